@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """The format analyzer."""
 
+import os
+
 import pysigscan
 
 from dfvfs.analyzer import specification
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.resolver import resolver
 
@@ -13,6 +16,21 @@ class Analyzer(object):
 
   _SCAN_BUFFER_SIZE = 33 * 1024
 
+  # The block size and maximum size of the buffer that is shared by
+  # the signature scanner and the analyzer helpers that do not have a format
+  # specification.
+  _SHARED_BUFFER_BLOCK_SIZE = 4096
+  _SHARED_BUFFER_MAXIMUM_SIZE = 1024 * 1024
+
+  # The prefix of the class attribute names of the cached objects per format
+  # category.
+  _FORMAT_CATEGORY_ATTRIBUTE_PREFIXES = {
+      definitions.FORMAT_CATEGORY_ARCHIVE: '_archive',
+      definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: '_compressed_stream',
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM: '_file_system',
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: '_storage_media_image',
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: '_volume_system'}
+
   _analyzer_helpers = {}
 
   # The archive format category analyzer helpers that do not have
@@ -97,6 +115,46 @@ class Analyzer(object):
       cls._volume_system_scanner = None
       cls._volume_system_store = None
 
+  @classmethod
+  def _GetFormatCategoryScanner(cls, format_category):
+    """Retrieves the cached objects used to scan for a format category.
+
+    Args:
+      format_category (str): format category.
+
+    Returns:
+      tuple[pysigscan.scanner, FormatSpecificationStore, list[AnalyzerHelper]]:
+          signature scanner, specification store and analyzer helpers that do
+          not have a format specification.
+    """
+    attribute_prefix = cls._FORMAT_CATEGORY_ATTRIBUTE_PREFIXES.get(
+        format_category, None)
+    if not attribute_prefix:
+      # Other format categories, such as encoded stream, are not cached.
+      specification_store, remainder_list = cls._GetSpecificationStore(
+          format_category)
+      signature_scanner = cls._GetSignatureScanner(specification_store)
+      return signature_scanner, specification_store, remainder_list
+
+    remainder_list_name = '{0:s}_remainder_list'.format(attribute_prefix)
+    scanner_name = '{0:s}_scanner'.format(attribute_prefix)
+    store_name = '{0:s}_store'.format(attribute_prefix)
+
+    if (getattr(cls, remainder_list_name) is None or
+        getattr(cls, store_name) is None):
+      specification_store, remainder_list = cls._GetSpecificationStore(
+          format_category)
+      setattr(cls, remainder_list_name, remainder_list)
+      setattr(cls, store_name, specification_store)
+
+    specification_store = getattr(cls, store_name)
+    if getattr(cls, scanner_name) is None:
+      setattr(cls, scanner_name, cls._GetSignatureScanner(specification_store))
+
+    return (
+        getattr(cls, scanner_name), specification_store,
+        getattr(cls, remainder_list_name))
+
   @classmethod
   def _GetSignatureScanner(cls, specification_store):
     """Initializes a signature scanner based on a specification store.
@@ -175,10 +233,30 @@ class Analyzer(object):
     Returns:
       list[str]: supported format type indicators.
     """
-    type_indicator_list = []
-
     file_object = resolver.Resolver.OpenFileObject(
         path_spec, resolver_context=resolver_context)
+
+    return cls._GetTypeIndicatorsFromFileObject(
+        signature_scanner, specification_store, remainder_list, file_object)
+
+  @classmethod
+  def _GetTypeIndicatorsFromFileObject(
+      cls, signature_scanner, specification_store, remainder_list,
+      file_object):
+    """Determines if a file-like object contains a supported format types.
+
+    Args:
+      signature_scanner (pysigscan.scanner): signature scanner.
+      specification_store (FormatSpecificationStore): specification store.
+      remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that
+          do not have a format specification.
+      file_object (FileIO): file-like object.
+
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    type_indicator_list = []
+
     scan_state = pysigscan.scan_state()
 
     signature_scanner.scan_file_object(scan_state, file_object)
@@ -198,6 +276,19 @@ class Analyzer(object):
 
     return type_indicator_list
 
+  @classmethod
+  def _RemoveFallbackVolumeSystemTypeIndicators(cls, type_indicators):
+    """Removes fallback volume system type indicators.
+
+    Args:
+      type_indicators (list[str]): volume system type indicators.
+    """
+    if (len(type_indicators) > 1 and
+        definitions.TYPE_INDICATOR_TSK_PARTITION in type_indicators):
+      # The TSK partition analyzer is used as a fallback, remove it if
+      # an alternative analyzer detected a supported volume system.
+      type_indicators.remove(definitions.TYPE_INDICATOR_TSK_PARTITION)
+
   @classmethod
   def DeregisterHelper(cls, analyzer_helper):
     """Deregisters a format analyzer helper.
@@ -331,6 +422,58 @@ class Analyzer(object):
         cls._storage_media_image_remainder_list, path_spec,
         resolver_context=resolver_context)
 
+  @classmethod
+  def GetTypeIndicatorsPerFormatCategory(
+      cls, path_spec, format_categories=None, resolver_context=None):
+    """Determines the supported format types of multiple format categories.
+
+    Unlike the format category specific functions, such as
+    GetFileSystemTypeIndicators, the file is opened only once and the data
+    read by the signature scanners and analyzer helpers is buffered, hence
+    the data is shared between format categories instead of being read again
+    for every format category.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_categories (Optional[list[str]]): format categories, where None
+          represents all format categories.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe.
+
+    Returns:
+      dict[str, list[str]]: supported format type indicators per format
+          category.
+    """
+    if format_categories is None:
+      format_categories = sorted(definitions.FORMAT_CATEGORIES)
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=resolver_context)
+
+    shared_buffer = block_cache_io.BlockCacheFile(
+        resolver_context, path_spec, file_object,
+        block_size=cls._SHARED_BUFFER_BLOCK_SIZE,
+        maximum_cache_size=cls._SHARED_BUFFER_MAXIMUM_SIZE,
+        maximum_read_ahead_size=0)
+    shared_buffer.Open()
+
+    type_indicators_per_category = {}
+    for format_category in format_categories:
+      signature_scanner, specification_store, remainder_list = (
+          cls._GetFormatCategoryScanner(format_category))
+
+      shared_buffer.seek(0, os.SEEK_SET)
+      type_indicators = cls._GetTypeIndicatorsFromFileObject(
+          signature_scanner, specification_store, remainder_list,
+          shared_buffer)
+
+      if format_category == definitions.FORMAT_CATEGORY_VOLUME_SYSTEM:
+        cls._RemoveFallbackVolumeSystemTypeIndicators(type_indicators)
+
+      type_indicators_per_category[format_category] = type_indicators
+
+    return type_indicators_per_category
+
   @classmethod
   def GetVolumeSystemTypeIndicators(cls, path_spec, resolver_context=None):
     """Determines if a file contains a supported volume system types.
@@ -359,11 +502,7 @@ class Analyzer(object):
         cls._volume_system_remainder_list, path_spec,
         resolver_context=resolver_context)
 
-    if (len(type_indicators) > 1 and
-        definitions.TYPE_INDICATOR_TSK_PARTITION in type_indicators):
-      # The TSK partition analyzer is used as a fallback, remove it if
-      # an alternative analyzer detected a supported volume system.
-      type_indicators.remove(definitions.TYPE_INDICATOR_TSK_PARTITION)
+    cls._RemoveFallbackVolumeSystemTypeIndicators(type_indicators)
 
     return type_indicators
 
@@ -9,6 +9,18 @@ class Decompressor(object):
 
   # pylint: disable=redundant-returns-doc
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    The copy can be used to resume decompression from the point in the
+    compressed data where the copy was made. Decompressors that do not
+    support copying their state return None.
+
+    Returns:
+      Decompressor: copy of the decompressor or None if not supported.
+    """
+    return None
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The zlib and DEFLATE decompressor implementations."""
 
+import copy
 import zlib
 
 from dfvfs.compression import decompressor
@@ -30,6 +31,17 @@ class ZlibDecompressor(decompressor.Decompressor):
     """bytes: data past the end of the compressed data."""
     return self._zlib_decompressor.unused_data
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    Returns:
+      ZlibDecompressor: copy of the decompressor.
+    """
+    decompressor = copy.copy(self)
+    # pylint: disable=protected-access
+    decompressor._zlib_decompressor = self._zlib_decompressor.copy()
+    return decompressor
+
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
 
@@ -13,6 +13,8 @@ from dfvfs.lib import errors
 class Base16Decoder(decoder.Decoder):
   """Base16 decoder using base64."""
 
+  DECODED_BLOCK_SIZE = 1
+  ENCODED_BLOCK_SIZE = 2
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE16
 
   def Decode(self, encoded_data):
@@ -13,6 +13,8 @@ from dfvfs.lib import errors
 class Base32Decoder(decoder.Decoder):
   """Base32 decoder using base64."""
 
+  DECODED_BLOCK_SIZE = 5
+  ENCODED_BLOCK_SIZE = 8
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE32
 
   def Decode(self, encoded_data):
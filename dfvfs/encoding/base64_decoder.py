@@ -13,6 +13,8 @@ from dfvfs.lib import errors
 class Base64Decoder(decoder.Decoder):
   """Base64 decoder using base64."""
 
+  DECODED_BLOCK_SIZE = 3
+  ENCODED_BLOCK_SIZE = 4
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE64
 
   def Decode(self, encoded_data):
@@ -5,7 +5,19 @@ import abc
 
 
 class Decoder(object):
-  """Decoder interface."""
+  """Decoder interface.
+
+  Attributes:
+    DECODED_BLOCK_SIZE (int): number of bytes of decoded data that correspond
+        with ENCODED_BLOCK_SIZE bytes of encoded data or None if the encoding
+        method does not have a fixed ratio.
+    ENCODED_BLOCK_SIZE (int): number of bytes of encoded data that correspond
+        with DECODED_BLOCK_SIZE bytes of decoded data or None if the encoding
+        method does not have a fixed ratio.
+  """
+
+  DECODED_BLOCK_SIZE = None
+  ENCODED_BLOCK_SIZE = None
 
   # pylint: disable=redundant-returns-doc
 
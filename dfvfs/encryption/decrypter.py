@@ -2,12 +2,14 @@
 """The decrypter interface."""
 
 import abc
+import bisect
 
 from cryptography.hazmat import backends
 from cryptography.hazmat.primitives import ciphers
 from cryptography.hazmat.primitives.ciphers import modes
 
 from dfvfs.lib import definitions
+from dfvfs.lib import errors
 
 
 class Decrypter(object):
@@ -42,6 +44,35 @@ class Decrypter(object):
       tuple[bytes, bytes]: decrypted data and remaining encrypted data.
     """
 
+  # pylint: disable=unused-argument
+  def DecryptRange(self, read_function, offset, size):
+    """Decrypts a range of the encrypted data.
+
+    This is the fall through implementation that raises NotSupported.
+
+    Args:
+      read_function (function): function to read encrypted data, which
+          takes an offset and size as arguments, such as FileIO.read_at.
+      offset (int): offset of the range in the encrypted data.
+      size (int): size of the range in bytes.
+
+    Returns:
+      bytes: decrypted data.
+
+    Raises:
+      NotSupported: since this is the fall through implementation.
+    """
+    raise errors.NotSupported(
+        'Missing implementation to decrypt a range of the encrypted data.')
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports decrypting a range of the data.
+
+    Returns:
+      bool: True if DecryptRange is supported.
+    """
+    return False
+
 
 class CryptographyBlockCipherDecrypter(Decrypter):
   """Block cipher decrypter using Cryptography."""
@@ -78,7 +109,105 @@ class CryptographyBlockCipherDecrypter(Decrypter):
 
     super(CryptographyBlockCipherDecrypter, self).__init__()
     self._algorithm = algorithm
+    self._backend = backend
+    self._block_size = algorithm.block_size // 8
     self._cipher_context = cipher.decryptor()
+    self._cipher_mode = cipher_mode
+    self._initialization_vector = initialization_vector
+
+    # The OFB initialization vectors of block numbers that are a multiple of
+    # the checkpoint interval, which are used to generate the keystream
+    # of a block without having to generate it from the start.
+    self._ofb_checkpoint_block_numbers = [0]
+    self._ofb_initialization_vectors = {0: initialization_vector}
+
+  # Number of blocks between the OFB keystream checkpoints.
+  _OFB_CHECKPOINT_INTERVAL = 4096
+
+  def _GetCipherContextForBlock(self, read_function, block_number):
+    """Retrieves a cipher context to decrypt from a specific block.
+
+    In ECB mode blocks are decrypted independently. In CBC and CFB mode
+    the initialization vector of a block is the preceding encrypted block.
+    In OFB mode the initialization vector of a block is the keystream of
+    the preceding block, which is generated from the nearest checkpoint.
+
+    Args:
+      read_function (function): function to read encrypted data, which
+          takes an offset and size as arguments.
+      block_number (int): number of the block to decrypt from.
+
+    Returns:
+      CipherContext: cipher context.
+
+    Raises:
+      IOError: if the preceding encrypted block cannot be read.
+    """
+    if self._cipher_mode == definitions.ENCRYPTION_MODE_ECB:
+      mode = modes.ECB()
+
+    elif self._cipher_mode == definitions.ENCRYPTION_MODE_OFB:
+      initialization_vector = self._GetOFBInitializationVector(block_number)
+      mode = modes.OFB(initialization_vector)
+
+    else:
+      if block_number == 0:
+        initialization_vector = self._initialization_vector
+      else:
+        initialization_vector = read_function(
+            (block_number - 1) * self._block_size, self._block_size)
+        if len(initialization_vector) != self._block_size:
+          raise IOError('Unable to read preceding encrypted block.')
+
+      if self._cipher_mode == definitions.ENCRYPTION_MODE_CBC:
+        mode = modes.CBC(initialization_vector)
+      else:
+        mode = modes.CFB(initialization_vector)
+
+    cipher = ciphers.Cipher(self._algorithm, mode=mode, backend=self._backend)
+    return cipher.decryptor()
+
+  def _GetOFBInitializationVector(self, block_number):
+    """Retrieves the OFB initialization vector of a specific block.
+
+    Args:
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: initialization vector, which is the keystream of the preceding
+          block.
+    """
+    index = bisect.bisect_right(
+        self._ofb_checkpoint_block_numbers, block_number) - 1
+    checkpoint_block_number = self._ofb_checkpoint_block_numbers[index]
+    initialization_vector = self._ofb_initialization_vectors[
+        checkpoint_block_number]
+
+    # Encrypting zero bytes in OFB mode results in the keystream, of which
+    # the last block is the initialization vector of the next block.
+    while checkpoint_block_number < block_number:
+      number_of_blocks = min(
+          block_number - checkpoint_block_number,
+          self._OFB_CHECKPOINT_INTERVAL)
+
+      cipher = ciphers.Cipher(
+          self._algorithm, mode=modes.OFB(initialization_vector),
+          backend=self._backend)
+      encryptor = cipher.encryptor()
+      keystream = encryptor.update(b'\x00' * (
+          number_of_blocks * self._block_size))
+
+      initialization_vector = keystream[-self._block_size:]
+      checkpoint_block_number += number_of_blocks
+
+      if checkpoint_block_number % self._OFB_CHECKPOINT_INTERVAL == 0 and (
+          checkpoint_block_number not in self._ofb_initialization_vectors):
+        bisect.insort(
+            self._ofb_checkpoint_block_numbers, checkpoint_block_number)
+        self._ofb_initialization_vectors[checkpoint_block_number] = (
+            initialization_vector)
+
+    return initialization_vector
 
   def Decrypt(self, encrypted_data, finalize=False):
     """Decrypts the encrypted data.
@@ -113,3 +242,60 @@ class CryptographyBlockCipherDecrypter(Decrypter):
       decrypted_data = decrypted_data[:encrypted_data_size]
 
     return decrypted_data, remaining_encrypted_data
+
+  def DecryptRange(self, read_function, offset, size):
+    """Decrypts a range of the encrypted data.
+
+    Only the blocks that contain the range are read and decrypted. The last
+    block of the encrypted data can be incomplete, in which case it is
+    decrypted the same as by Decrypt with finalize.
+
+    Args:
+      read_function (function): function to read encrypted data, which
+          takes an offset and size as arguments, such as FileIO.read_at.
+      offset (int): offset of the range in the encrypted data.
+      size (int): size of the range in bytes.
+
+    Returns:
+      bytes: decrypted data, which is smaller than size if the range exceeds
+          the encrypted data.
+
+    Raises:
+      IOError: if the encrypted data cannot be read.
+    """
+    if size <= 0:
+      return b''
+
+    first_block_number, block_offset = divmod(offset, self._block_size)
+    last_block_number = (offset + size - 1) // self._block_size
+
+    encrypted_data_offset = first_block_number * self._block_size
+    encrypted_data = read_function(
+        encrypted_data_offset,
+        (last_block_number + 1) * self._block_size - encrypted_data_offset)
+
+    encrypted_data_size = len(encrypted_data)
+    if encrypted_data_size <= block_offset:
+      return b''
+
+    cipher_context = self._GetCipherContextForBlock(
+        read_function, first_block_number)
+
+    _, remainder = divmod(encrypted_data_size, self._block_size)
+    if remainder > 0:
+      encrypted_data = b''.join([
+          encrypted_data, b'\x00' * (self._block_size - remainder)])
+
+    decrypted_data = cipher_context.update(encrypted_data)
+    decrypted_data += cipher_context.finalize()
+
+    return decrypted_data[block_offset:min(
+        block_offset + size, encrypted_data_size)]
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports decrypting a range of the data.
+
+    Returns:
+      bool: True if DecryptRange is supported.
+    """
+    return True
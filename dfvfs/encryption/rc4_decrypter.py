@@ -15,6 +15,9 @@ class RC4Decrypter(decrypter.Decrypter):
 
   ENCRYPTION_METHOD = definitions.ENCRYPTION_METHOD_RC4
 
+  # The maximum size of the keystream that is skipped at once.
+  _MAXIMUM_SKIP_SIZE = 1024 * 1024
+
   def __init__(self, key=None, **kwargs):
     """Initializes a decrypter.
 
@@ -34,7 +37,41 @@ class RC4Decrypter(decrypter.Decrypter):
     cipher = ciphers.Cipher(algorithm, mode=None, backend=backend)
 
     super(RC4Decrypter, self).__init__(**kwargs)
+    self._algorithm = algorithm
+    self._backend = backend
     self._cipher_context = cipher.decryptor()
+    self._range_cipher_context = None
+    self._range_keystream_offset = 0
+
+  def _GetRangeCipherContext(self, offset):
+    """Retrieves a cipher context positioned at a specific keystream offset.
+
+    The RC4 keystream can only be generated sequentially. Since the cipher
+    context does not expose its state, a new cipher context is created when
+    the offset precedes the current keystream offset and the keystream is
+    skipped by decrypting zero bytes, which does not require the encrypted
+    data to be read.
+
+    Args:
+      offset (int): keystream offset.
+
+    Returns:
+      CipherContext: cipher context.
+    """
+    if (self._range_cipher_context is None or
+        offset < self._range_keystream_offset):
+      cipher = ciphers.Cipher(
+          self._algorithm, mode=None, backend=self._backend)
+      self._range_cipher_context = cipher.decryptor()
+      self._range_keystream_offset = 0
+
+    while self._range_keystream_offset < offset:
+      skip_size = min(
+          offset - self._range_keystream_offset, self._MAXIMUM_SKIP_SIZE)
+      self._range_cipher_context.update(b'\x00' * skip_size)
+      self._range_keystream_offset += skip_size
+
+    return self._range_cipher_context
 
   # pylint: disable=unused-argument
   def Decrypt(self, encrypted_data, finalize=False):
@@ -51,5 +88,39 @@ class RC4Decrypter(decrypter.Decrypter):
     decrypted_data = self._cipher_context.update(encrypted_data)
     return decrypted_data, b''
 
+  def DecryptRange(self, read_function, offset, size):
+    """Decrypts a range of the encrypted data.
+
+    Args:
+      read_function (function): function to read encrypted data, which
+          takes an offset and size as arguments, such as FileIO.read_at.
+      offset (int): offset of the range in the encrypted data.
+      size (int): size of the range in bytes.
+
+    Returns:
+      bytes: decrypted data, which is smaller than size if the range exceeds
+          the encrypted data.
+    """
+    if size <= 0:
+      return b''
+
+    encrypted_data = read_function(offset, size)
+    if not encrypted_data:
+      return b''
+
+    cipher_context = self._GetRangeCipherContext(offset)
+    decrypted_data = cipher_context.update(encrypted_data)
+    self._range_keystream_offset += len(encrypted_data)
+
+    return decrypted_data
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports decrypting a range of the data.
+
+    Returns:
+      bool: True if DecryptRange is supported.
+    """
+    return True
+
 
 manager.EncryptionManager.RegisterDecrypter(RC4Decrypter)
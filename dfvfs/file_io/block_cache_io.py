@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""The block cache file-like object implementation."""
+
+import collections
+import os
+
+from dfvfs.file_io import file_io
+from dfvfs.resolver import cache
+
+
+class BlockCacheFile(file_io.FileIO):
+  """Block cache file input/output (IO) object.
+
+  The block cache file-like object caches the data of another file-like
+  object, the back end, in blocks that are aligned to the block size. The
+  least recently used blocks are evicted when the maximum cache size is
+  reached. Consecutive blocks that are not cached are read from the back end
+  with a single read and when a sequential read pattern is detected blocks
+  that follow the requested data are read ahead.
+
+  The block cache is intended for storage media images, where file systems
+  and volume systems repeatedly read the same small ranges of data, such as
+  superblocks, inode tables and the MFT, that otherwise would have to be read
+  and decoded by the storage media image back end every time.
+  """
+
+  def __init__(
+      self, resolver_context, path_spec, file_object, block_size=65536,
+      maximum_cache_size=64 * 1024 * 1024, maximum_read_ahead_size=1048576):
+    """Initializes a file input/output (IO) object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      path_spec (PathSpec): a path specification.
+      file_object (FileIO): file-like object of which the data is cached.
+      block_size (Optional[int]): size of a cached block in bytes.
+      maximum_cache_size (Optional[int]): maximum size of the cached blocks
+          in bytes.
+      maximum_read_ahead_size (Optional[int]): maximum number of bytes to
+          read ahead when a sequential read pattern is detected, where 0
+          disables read-ahead.
+
+    Raises:
+      ValueError: if the block size is 0 or less or the maximum cache size
+          is smaller than the block size.
+    """
+    if block_size <= 0:
+      raise ValueError('Invalid block size value zero or less.')
+
+    if maximum_cache_size < block_size:
+      raise ValueError('Invalid maximum cache size value less than block size.')
+
+    super(BlockCacheFile, self).__init__(resolver_context, path_spec)
+    self._block_size = block_size
+    self._blocks = collections.OrderedDict()
+    self._cache_size = 0
+    self._current_offset = 0
+    self._file_object = file_object
+    self._last_block_number = None
+    self._maximum_number_of_blocks = maximum_cache_size // block_size
+    self._maximum_read_ahead_blocks = maximum_read_ahead_size // block_size
+    self._read_ahead_blocks = 0
+    self._size = 0
+    self._statistics = cache.CacheStatistics()
+
+  @property
+  def file_object(self):
+    """FileIO: file-like object of which the data is cached."""
+    return self._file_object
+
+  def _CacheBlocks(self, block_number, number_of_blocks):
+    """Reads blocks from the back end and caches them.
+
+    Args:
+      block_number (int): number of the first block to read.
+      number_of_blocks (int): number of consecutive blocks to read.
+    """
+    data = self._file_object.read_at(
+        block_number * self._block_size, number_of_blocks * self._block_size)
+
+    data_offset = 0
+    data_size = len(data)
+    while data_offset < data_size:
+      data_end_offset = data_offset + self._block_size
+      block_data = data[data_offset:data_end_offset]
+
+      cached_block_data = self._blocks.pop(block_number, None)
+      if cached_block_data is not None:
+        self._cache_size -= len(cached_block_data)
+
+      self._blocks[block_number] = block_data
+      self._cache_size += len(block_data)
+
+      block_number += 1
+      data_offset = data_end_offset
+
+    while len(self._blocks) > self._maximum_number_of_blocks:
+      _, block_data = self._blocks.popitem(last=False)
+      self._cache_size -= len(block_data)
+      self._statistics.number_of_evictions += 1
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    The back end file-like object is not closed since it is owned by
+    the resolver context.
+    """
+    self._blocks = collections.OrderedDict()
+    self._cache_size = 0
+    self._last_block_number = None
+    self._read_ahead_blocks = 0
+
+  def _Open(self, mode='rb'):
+    """Opens the file-like object.
+
+    The back end file-like object is expected to be open already.
+
+    Args:
+      mode (Optional[str]): file access mode.
+    """
+    self._size = self._file_object.get_size()
+
+  def _ReadAt(self, offset, size):
+    """Reads a byte string from the cached blocks at a specific offset.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None is all remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if offset >= self._size:
+      return b''
+
+    if size is None or offset + size > self._size:
+      size = self._size - offset
+
+    if size <= 0:
+      return b''
+
+    first_block_number = offset // self._block_size
+    last_block_number = (offset + size - 1) // self._block_size
+    maximum_block_number = (self._size - 1) // self._block_size
+
+    # Do not cache reads that are larger than the cache.
+    if last_block_number - first_block_number >= self._maximum_number_of_blocks:
+      self._last_block_number = None
+      return self._file_object.read_at(offset, size)
+
+    # Increase the read-ahead on a sequential read pattern and stop it
+    # when the pattern is broken.
+    if self._last_block_number is not None and first_block_number in (
+        self._last_block_number, self._last_block_number + 1):
+      self._read_ahead_blocks = min(
+          max(self._read_ahead_blocks * 2, 1),
+          self._maximum_read_ahead_blocks)
+    else:
+      self._read_ahead_blocks = 0
+
+    self._last_block_number = last_block_number
+
+    block_number = first_block_number
+    while block_number <= last_block_number:
+      if block_number in self._blocks:
+        self._statistics.number_of_hits += 1
+        block_number += 1
+        continue
+
+      # Read the consecutive blocks that are not cached with a single read.
+      run_end_block_number = block_number + 1
+      while (run_end_block_number <= last_block_number and
+             run_end_block_number not in self._blocks):
+        run_end_block_number += 1
+
+      self._statistics.number_of_misses += (
+          run_end_block_number - block_number)
+
+      if run_end_block_number > last_block_number:
+        run_end_block_number = min(
+            run_end_block_number + self._read_ahead_blocks,
+            maximum_block_number + 1)
+
+      # Prevent that the read-ahead evicts the blocks being read.
+      run_end_block_number = min(
+          run_end_block_number,
+          block_number + self._maximum_number_of_blocks)
+
+      self._CacheBlocks(block_number, run_end_block_number - block_number)
+      block_number = run_end_block_number
+
+    data_parts = []
+    data_offset = offset - (first_block_number * self._block_size)
+    data_end_offset = data_offset + size
+
+    for block_number in range(first_block_number, last_block_number + 1):
+      block_data = self._blocks.get(block_number, None)
+      if block_data is None:
+        # The block was evicted during this read, for example because
+        # the read is larger than the cache, hence read it directly.
+        block_data = self._file_object.read_at(
+            block_number * self._block_size, self._block_size)
+      else:
+        self._blocks.move_to_end(block_number)
+
+      data_parts.append(block_data)
+
+    return b''.join(data_parts)[data_offset:data_end_offset]
+
+  def GetStatistics(self):
+    """Retrieves the block cache statistics.
+
+    Returns:
+      CacheStatistics: block cache statistics, where the number of cached
+          values is the number of cached blocks and the cost is the size of
+          the cached blocks in bytes.
+    """
+    statistics = cache.CacheStatistics()
+    statistics.cost = self._cache_size
+    statistics.number_of_cached_values = len(self._blocks)
+    statistics.number_of_evictions = self._statistics.number_of_evictions
+    statistics.number_of_hits = self._statistics.number_of_hits
+    statistics.number_of_misses = self._statistics.number_of_misses
+    return statistics
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    data = self._ReadAt(self._current_offset, size)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    return self._ReadAt(offset, size)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+
+    elif whence == os.SEEK_END:
+      offset += self._size
+
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._size
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The compressed stream file-like object implementation."""
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
@@ -9,8 +10,58 @@ from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
+class _CompressedStreamCheckpoint(object):
+  """Compressed stream checkpoint.
+
+  A checkpoint contains the decompressor state at a specific offset in the
+  compressed stream, which allows to resume decompression from that offset
+  instead of from the start of the compressed stream.
+
+  Attributes:
+    compressed_data (bytes): compressed data that was read but not yet
+        consumed by the decompressor.
+    compressed_data_offset (int): offset of the compressed data in the
+        parent file-like object from which to resume reading.
+    decompressor (Decompressor): decompressor with the state at the
+        checkpoint.
+    uncompressed_data_offset (int): offset in the uncompressed stream of
+        the checkpoint.
+  """
+
+  def __init__(
+      self, compressed_data_offset, uncompressed_data_offset, compressed_data,
+      decompressor):
+    """Initializes a compressed stream checkpoint.
+
+    Args:
+      compressed_data_offset (int): offset of the compressed data in the
+          parent file-like object from which to resume reading.
+      uncompressed_data_offset (int): offset in the uncompressed stream of
+          the checkpoint.
+      compressed_data (bytes): compressed data that was read but not yet
+          consumed by the decompressor.
+      decompressor (Decompressor): decompressor with the state at the
+          checkpoint.
+    """
+    super(_CompressedStreamCheckpoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
-  """File input/output (IO) object of a compressed stream."""
+  """File input/output (IO) object of a compressed stream.
+
+  Decompression can only be performed from the start to the end of the
+  compressed stream. To prevent that a seek backwards requires decompressing
+  the stream from the start, checkpoints of the decompressor state are stored
+  approximately every _CHECKPOINT_INTERVAL bytes of uncompressed data, when
+  supported by the decompressor.
+  """
+
+  # The minimum number of bytes of uncompressed data between checkpoints.
+  _CHECKPOINT_INTERVAL = 32 * 1024 * 1024
 
   # The size of the compressed data buffer.
   _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
@@ -23,15 +74,19 @@ class CompressedStream(file_io.FileIO):
       path_spec (PathSpec): a path specification.
     """
     super(CompressedStream, self).__init__(resolver_context, path_spec)
+    self._checkpoints = []
+    self._checkpoint_offsets = []
     self._compression_method = None
     self._file_object = None
     self._compressed_data = b''
+    self._compressed_data_offset = 0
     self._current_offset = 0
     self._decompressor = None
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = 0
     self._uncompressed_stream_size = None
 
   def _Close(self):
@@ -41,11 +96,57 @@ class CompressedStream(file_io.FileIO):
     the compressed stream file-like object does not control
     the file-like object and should not actually close it.
     """
+    self._checkpoints = []
+    self._checkpoint_offsets = []
     self._compressed_data = b''
     self._file_object = None
     self._decompressor = None
     self._uncompressed_data = b''
 
+  def _AddCheckpoint(self):
+    """Adds a checkpoint of the current decompressor state if needed.
+
+    A checkpoint is only added when at least _CHECKPOINT_INTERVAL bytes of
+    uncompressed data have been decompressed since the last checkpoint and
+    the decompressor supports copying its state.
+    """
+    uncompressed_data_offset = self._uncompressed_data_start_offset
+
+    last_checkpoint_offset = 0
+    if self._checkpoint_offsets:
+      last_checkpoint_offset = self._checkpoint_offsets[-1]
+
+    if uncompressed_data_offset < (
+        last_checkpoint_offset + self._CHECKPOINT_INTERVAL):
+      return
+
+    decompressor = self._decompressor.Copy()
+    if not decompressor:
+      return
+
+    checkpoint = _CompressedStreamCheckpoint(
+        self._compressed_data_offset, uncompressed_data_offset,
+        self._compressed_data, decompressor)
+
+    self._checkpoints.append(checkpoint)
+    self._checkpoint_offsets.append(uncompressed_data_offset)
+
+  def _GetCheckpoint(self, uncompressed_data_offset):
+    """Retrieves the checkpoint nearest before an uncompressed data offset.
+
+    Args:
+      uncompressed_data_offset (int): offset in the uncompressed stream.
+
+    Returns:
+      _CompressedStreamCheckpoint: checkpoint or None if not available.
+    """
+    checkpoint_index = bisect.bisect_right(
+        self._checkpoint_offsets, uncompressed_data_offset)
+    if checkpoint_index == 0:
+      return None
+
+    return self._checkpoints[checkpoint_index - 1]
+
   def _GetDecompressor(self):
     """Retrieves the decompressor.
 
@@ -58,27 +159,32 @@ class CompressedStream(file_io.FileIO):
   def _GetUncompressedStreamSize(self):
     """Retrieves the uncompressed stream size.
 
+    The decompression pass continues from the last checkpoint, if available,
+    and stores checkpoints for subsequent seeks.
+
     Returns:
       int: uncompressed stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    checkpoint = None
+    if self._checkpoints:
+      checkpoint = self._checkpoints[-1]
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    if self._decompressor is None or (
+        checkpoint and self._uncompressed_data_start_offset <
+        checkpoint.uncompressed_data_offset):
+      self._RestoreCheckpoint(checkpoint)
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
-    uncompressed_stream_size = 0
 
-    while compressed_data_offset < compressed_data_size:
+    while self._compressed_data_offset < compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
+    # Force the data offset to be realigned at the next read.
+    self._realign_offset = True
 
-    return uncompressed_stream_size
+    return self._uncompressed_data_start_offset + self._uncompressed_data_size
 
   def _Open(self, mode='rb'):
     """Opens the file-like object.
@@ -109,29 +215,37 @@ class CompressedStream(file_io.FileIO):
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression is continued from the current decompressor state when the
+    offset lies ahead of it and no nearer checkpoint is available, otherwise
+    it is resumed from the nearest checkpoint before the offset.
+
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    checkpoint = self._GetCheckpoint(uncompressed_data_offset)
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    checkpoint_offset = 0
+    if checkpoint:
+      checkpoint_offset = checkpoint.uncompressed_data_offset
+
+    if (self._decompressor is None or
+        uncompressed_data_offset < self._uncompressed_data_start_offset or
+        self._uncompressed_data_start_offset < checkpoint_offset):
+      self._RestoreCheckpoint(checkpoint)
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
 
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_start_offset + self._uncompressed_data_size):
+      if self._compressed_data_offset >= compressed_data_size:
         break
 
-      compressed_data_offset += read_count
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_start_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
@@ -142,9 +256,17 @@ class CompressedStream(file_io.FileIO):
     Returns:
       int: number of bytes of compressed data read.
     """
-    compressed_data = self._file_object.read(read_size)
+    self._uncompressed_data_start_offset += self._uncompressed_data_size
+    self._uncompressed_data = b''
+    self._uncompressed_data_size = 0
+
+    self._AddCheckpoint()
+
+    compressed_data = self._file_object.read_at(
+        self._compressed_data_offset, read_size)
 
     read_count = len(compressed_data)
+    self._compressed_data_offset += read_count
 
     self._compressed_data = b''.join([self._compressed_data, compressed_data])
 
@@ -155,6 +277,54 @@ class CompressedStream(file_io.FileIO):
 
     return read_count
 
+  def _RestoreCheckpoint(self, checkpoint):
+    """Restores the decompressor state from a checkpoint.
+
+    Args:
+      checkpoint (_CompressedStreamCheckpoint): checkpoint or None to restart
+          decompression from the start of the compressed stream.
+    """
+    if checkpoint:
+      self._compressed_data = checkpoint.compressed_data
+      self._compressed_data_offset = checkpoint.compressed_data_offset
+      self._decompressor = checkpoint.decompressor.Copy()
+      self._uncompressed_data_start_offset = (
+          checkpoint.uncompressed_data_offset)
+
+    else:
+      self._compressed_data = b''
+      self._compressed_data_offset = 0
+      self._decompressor = self._GetDecompressor()
+      self._uncompressed_data_start_offset = 0
+
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+
+  def SetUncompressedStreamSize(self, uncompressed_stream_size):
+    """Sets the uncompressed stream size.
+
+    This function is used to set the uncompressed stream size if it can be
+    determined separately.
+
+    Args:
+      uncompressed_stream_size (int): size of the uncompressed stream in bytes.
+
+    Raises:
+      IOError: if the file-like object is already open.
+      OSError: if the file-like object is already open.
+      ValueError: if the uncompressed stream size is invalid.
+    """
+    if self._is_open:
+      raise IOError('Already open.')
+
+    if uncompressed_stream_size < 0:
+      raise ValueError((
+          'Invalid uncompressed stream size: {0:d} value out of '
+          'bounds.').format(uncompressed_stream_size))
+
+    self._uncompressed_stream_size = uncompressed_stream_size
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -207,7 +377,8 @@ class CompressedStream(file_io.FileIO):
     if size == 0:
       return uncompressed_data
 
-    while size > self._uncompressed_data_size:
+    while size > (
+        self._uncompressed_data_size - self._uncompressed_data_offset):
       uncompressed_data = b''.join([
           uncompressed_data,
           self._uncompressed_data[self._uncompressed_data_offset:]])
@@ -68,6 +68,31 @@ class DataRange(file_io.FileIO):
     self._file_object = resolver.Resolver.OpenFileObject(
         self._path_spec.parent, resolver_context=self._resolver_context)
 
+  def _ReadAt(self, offset, size):
+    """Reads a byte string from the data range at a specific offset.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None is all remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the data range is invalid.
+      OSError: if the data range is invalid.
+    """
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if offset >= self._range_size:
+      return b''
+
+    if size is None or offset + size > self._range_size:
+      size = self._range_size - offset
+
+    return self._file_object.read_at(self._range_offset + offset, size)
+
   def _SetRange(self, range_offset, range_size):
     """Sets the data range (offset and size).
 
@@ -119,30 +144,40 @@ class DataRange(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
-    if self._range_offset < 0 or self._range_size < 0:
-      raise IOError('Invalid data range.')
-
     if self._current_offset < 0:
       raise IOError(
           'Invalid current offset: {0:d} value less than zero.'.format(
               self._current_offset))
 
-    if self._current_offset >= self._range_size:
-      return b''
+    data = self._ReadAt(self._current_offset, size)
 
-    if size is None:
-      size = self._range_size
-    if self._current_offset + size > self._range_size:
-      size = self._range_size - self._current_offset
+    self._current_offset += len(data)
 
-    self._file_object.seek(
-        self._range_offset + self._current_offset, os.SEEK_SET)
+    return data
 
-    data = self._file_object.read(size)
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
 
-    self._current_offset += len(data)
+    The current offset of the file-like object is not changed.
 
-    return data
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    return self._ReadAt(offset, size)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
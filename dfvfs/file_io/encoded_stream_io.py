@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The encoded stream file-like object implementation."""
 
+import bisect
 import os
 
 from dfvfs.encoding import manager as encoding_manager
@@ -15,6 +16,18 @@ class EncodedStream(file_io.FileIO):
   # The size of the encoded data buffer.
   _ENCODED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The maximum number of runs of lines in the line index, if the encoded
+  # data contains more runs it is considered irregular.
+  _MAXIMUM_NUMBER_OF_LINE_RUNS = 65536
+
+  # The number of lines that are compared at once when building the line
+  # index.
+  _NUMBER_OF_LINES_PER_COMPARE = 4096
+
+  # Whitespace characters, other than line breaks, that make the encoded
+  # data irregular.
+  _WHITESPACE_CHARACTERS = (b' ', b'\t', b'\x0b', b'\x0c')
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
 
@@ -30,8 +43,13 @@ class EncodedStream(file_io.FileIO):
     self._decoded_stream_size = None
     self._decoder = None
     self._encoded_data = b''
+    self._encoded_data_offset = 0
     self._encoding_method = None
     self._file_object = None
+    self._line_index = None
+    self._line_index_content_offsets = None
+    self._line_index_content_size = 0
+    self._line_index_decoded_size = 0
     self._realign_offset = True
 
   def _Close(self):
@@ -45,6 +63,314 @@ class EncodedStream(file_io.FileIO):
     self._decoded_data = b''
     self._encoded_data = b''
     self._file_object = None
+    self._line_index = None
+    self._line_index_content_offsets = None
+
+  def _AppendLinesToLineIndex(
+      self, line_runs, encoded_offset, line_size, content_size,
+      number_of_lines):
+    """Appends lines to the runs of lines of the line index.
+
+    Args:
+      line_runs (list[list[int]]): runs of lines, where every run consists of
+          the offset of the run in the content, the offset of the run in the
+          encoded data, the line size, the content size per line and
+          the number of lines.
+      encoded_offset (int): offset of the first line in the encoded data.
+      line_size (int): size of a line including its line break.
+      content_size (int): size of the content of a line.
+      number_of_lines (int): number of lines.
+
+    Returns:
+      bool: True if the lines were appended, False if the lines follow
+          a partial block of content, which makes the encoded data irregular.
+    """
+    if line_runs:
+      last_run = line_runs[-1]
+      last_run_content_offset, last_run_encoded_offset, last_run_line_size, (
+          last_run_content_size), last_run_number_of_lines = last_run
+
+      if last_run_content_size % self._decoder.ENCODED_BLOCK_SIZE:
+        return False
+
+      if (last_run_line_size == line_size and
+          last_run_content_size == content_size and
+          last_run_encoded_offset + (
+              last_run_line_size * last_run_number_of_lines) == encoded_offset):
+        last_run[4] += number_of_lines
+        return True
+
+      content_offset = last_run_content_offset + (
+          last_run_content_size * last_run_number_of_lines)
+    else:
+      content_offset = 0
+
+    # Only the last line can contain a partial block of content.
+    if number_of_lines > 1 and content_size % self._decoder.ENCODED_BLOCK_SIZE:
+      return False
+
+    line_runs.append([
+        content_offset, encoded_offset, line_size, content_size,
+        number_of_lines])
+    return True
+
+  def _BuildLineIndex(self):
+    """Builds a sparse index of the lines of the encoded data.
+
+    The line index consists of runs of lines with the same line size and
+    content size, which allows to map a decoded data offset to an encoded
+    data offset without decoding the preceding encoded data. Encoded data
+    without line breaks consists of a single run. Empty lines are allowed,
+    other whitespace, lines with partial blocks of content that are not
+    the last line and padding that is not at the end of the content are
+    considered irregular.
+
+    Returns:
+      bool: True if the line index was built, False if the encoding method
+          does not have a fixed ratio or the encoded data is irregular.
+    """
+    decoder = self._GetDecoder()
+    if not decoder or not decoder.ENCODED_BLOCK_SIZE:
+      return False
+
+    self._decoder = decoder
+
+    line_runs = []
+    number_of_padding_characters = 0
+
+    data = b''
+    data_encoded_offset = 0
+    encoded_data_size = self._file_object.get_size()
+    read_offset = 0
+
+    while read_offset < encoded_data_size:
+      read_data = self._file_object.read_at(
+          read_offset, self._ENCODED_DATA_BUFFER_SIZE)
+      if not read_data:
+        break
+
+      read_offset += len(read_data)
+
+      for character in self._WHITESPACE_CHARACTERS:
+        if character in read_data:
+          return False
+
+      number_of_padding_characters += read_data.count(b'=')
+
+      data = b''.join([data, read_data])
+      is_last_data = read_offset >= encoded_data_size
+
+      data_offset, is_regular = self._IndexLines(
+          line_runs, data, data_encoded_offset, is_last_data)
+      if not is_regular or len(line_runs) > self._MAXIMUM_NUMBER_OF_LINE_RUNS:
+        return False
+
+      data = data[data_offset:]
+      data_encoded_offset += data_offset
+
+    if data:
+      # The encoded data is smaller than its size.
+      _, is_regular = self._IndexLines(
+          line_runs, data, data_encoded_offset, True)
+      if not is_regular:
+        return False
+
+    content_size = 0
+    if line_runs:
+      last_run = line_runs[-1]
+      content_size = last_run[0] + last_run[3] * last_run[4]
+
+    if content_size % decoder.ENCODED_BLOCK_SIZE:
+      return False
+
+    self._line_index = [tuple(line_run) for line_run in line_runs]
+    self._line_index_content_offsets = [
+        line_run[0] for line_run in self._line_index]
+    self._line_index_content_size = content_size
+    self._line_index_decoded_size = 0
+
+    if content_size > 0:
+      encoded_block = self._ReadContent(
+          content_size - decoder.ENCODED_BLOCK_SIZE, content_size)
+      if encoded_block.count(b'=') != number_of_padding_characters:
+        self._line_index = None
+        return False
+
+      try:
+        decoded_block, _ = decoder.Decode(encoded_block)
+      except errors.BackEndError:
+        self._line_index = None
+        return False
+
+      number_of_blocks = content_size // decoder.ENCODED_BLOCK_SIZE
+      self._line_index_decoded_size = (
+          (number_of_blocks - 1) * decoder.DECODED_BLOCK_SIZE) + len(
+              decoded_block)
+
+    return True
+
+  def _IndexLines(self, line_runs, data, data_encoded_offset, is_last_data):
+    """Adds the lines in a buffer of encoded data to the line index.
+
+    Args:
+      line_runs (list[list[int]]): runs of lines.
+      data (bytes): encoded data.
+      data_encoded_offset (int): offset of the data in the encoded data.
+      is_last_data (bool): True if the data contains the end of the encoded
+          data.
+
+    Returns:
+      tuple[int, bool]: offset of the data that was not indexed, such as
+          a line without line break that continues in the next buffer, and
+          True if the lines are regular.
+    """
+    data_offset = 0
+    data_size = len(data)
+    number_of_lines_to_scan = 0
+
+    while data_offset < data_size:
+      if line_runs and number_of_lines_to_scan == 0:
+        _, last_run_encoded_offset, line_size, content_size, (
+            last_run_number_of_lines) = line_runs[-1]
+
+        number_of_lines = min(
+            (data_size - data_offset) // line_size,
+            self._NUMBER_OF_LINES_PER_COMPARE)
+
+        if number_of_lines > 1 and last_run_encoded_offset + (
+            line_size * last_run_number_of_lines) == (
+                data_encoded_offset + data_offset):
+          if self._IsUniformLines(
+              data[data_offset:data_offset + number_of_lines * line_size],
+              line_size, content_size, number_of_lines):
+            if not self._AppendLinesToLineIndex(
+                line_runs, data_encoded_offset + data_offset, line_size,
+                content_size, number_of_lines):
+              return data_offset, False
+
+            data_offset += number_of_lines * line_size
+            continue
+
+          number_of_lines_to_scan = number_of_lines
+
+      line_end_offset = data.find(b'\n', data_offset)
+      if line_end_offset == -1:
+        if not is_last_data:
+          break
+
+        line_end_offset = data_size
+        line_size = data_size - data_offset
+      else:
+        line_size = line_end_offset + 1 - data_offset
+
+      content_end_offset = line_end_offset
+      if content_end_offset > data_offset and (
+          data[content_end_offset - 1:content_end_offset] == b'\r'):
+        content_end_offset -= 1
+
+      content_size = content_end_offset - data_offset
+      if b'\r' in data[data_offset:content_end_offset]:
+        return data_offset, False
+
+      if content_size > 0 and not self._AppendLinesToLineIndex(
+          line_runs, data_encoded_offset + data_offset, line_size,
+          content_size, 1):
+        return data_offset, False
+
+      data_offset += line_size
+      if number_of_lines_to_scan > 0:
+        number_of_lines_to_scan -= 1
+
+    return data_offset, True
+
+  def _IsUniformLines(self, data, line_size, content_size, number_of_lines):
+    """Determines if encoded data consists of lines of the same size.
+
+    Args:
+      data (bytes): encoded data.
+      line_size (int): size of a line including its line break.
+      content_size (int): size of the content of a line.
+      number_of_lines (int): number of lines in the data.
+
+    Returns:
+      bool: True if all the lines have the same line and content size.
+    """
+    line_break_size = line_size - content_size
+    if line_break_size not in (1, 2):
+      return False
+
+    if (data.count(b'\n') != number_of_lines or
+        data[line_size - 1::line_size].count(b'\n') != number_of_lines):
+      return False
+
+    if line_break_size == 1:
+      return b'\r' not in data
+
+    return (data.count(b'\r') == number_of_lines and
+            data[line_size - 2::line_size].count(b'\r') == number_of_lines)
+
+  def _GetEncodedDataOffset(self, content_offset):
+    """Retrieves the encoded data offset of a content offset.
+
+    Args:
+      content_offset (int): offset in the content, which is the encoded data
+          without line breaks.
+
+    Returns:
+      int: offset in the encoded data.
+    """
+    index = bisect.bisect_right(
+        self._line_index_content_offsets, content_offset) - 1
+    run_content_offset, run_encoded_offset, line_size, content_size, _ = (
+        self._line_index[index])
+
+    line_number, line_offset = divmod(
+        content_offset - run_content_offset, content_size)
+    return run_encoded_offset + (line_number * line_size) + line_offset
+
+  def _ReadContent(self, start_offset, end_offset):
+    """Reads content from the encoded data.
+
+    Args:
+      start_offset (int): start offset in the content.
+      end_offset (int): end offset in the content.
+
+    Returns:
+      bytes: content, which is the encoded data without line breaks.
+    """
+    encoded_data_offset = self._GetEncodedDataOffset(start_offset)
+    encoded_data_end_offset = self._GetEncodedDataOffset(end_offset - 1) + 1
+
+    encoded_data = self._file_object.read_at(
+        encoded_data_offset, encoded_data_end_offset - encoded_data_offset)
+    return encoded_data.replace(b'\r', b'').replace(b'\n', b'')
+
+  def _ReadDecodedDataAt(self, offset, size):
+    """Reads decoded data at a specific offset using the line index.
+
+    Args:
+      offset (int): offset in the decoded data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: decoded data.
+    """
+    encoded_block_size = self._decoder.ENCODED_BLOCK_SIZE
+    decoded_block_size = self._decoder.DECODED_BLOCK_SIZE
+
+    first_block_number = offset // decoded_block_size
+    last_block_number = (offset + size - 1) // decoded_block_size
+
+    content_start_offset = first_block_number * encoded_block_size
+    content_end_offset = min(
+        (last_block_number + 1) * encoded_block_size,
+        self._line_index_content_size)
+
+    encoded_data = self._ReadContent(content_start_offset, content_end_offset)
+    decoded_data, _ = self._decoder.Decode(encoded_data)
+
+    decoded_data_offset = offset - (first_block_number * decoded_block_size)
+    return decoded_data[decoded_data_offset:decoded_data_offset + size]
 
   def _GetDecoder(self):
     """Retrieves the decoder.
@@ -57,10 +383,17 @@ class EncodedStream(file_io.FileIO):
   def _GetDecodedStreamSize(self):
     """Retrieves the decoded stream size.
 
+    If the encoded data is regular the decoded stream size is determined
+    from the line index, otherwise all the encoded data is decoded to
+    determine the decoded stream size.
+
     Returns:
       int: decoded stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    if self._HasLineIndex():
+      return self._line_index_decoded_size
+
+    self._encoded_data_offset = 0
 
     self._decoder = self._GetDecoder()
     self._decoded_data = b''
@@ -79,6 +412,21 @@ class EncodedStream(file_io.FileIO):
 
     return decoded_stream_size
 
+  def _HasLineIndex(self):
+    """Determines if the encoded data has a line index.
+
+    The line index is built the first time this function is called.
+
+    Returns:
+      bool: True if the encoded data has a line index.
+    """
+    if self._line_index is None and self._line_index_content_offsets is None:
+      if not self._BuildLineIndex():
+        self._line_index = None
+        self._line_index_content_offsets = []
+
+    return self._line_index is not None
+
   def _Open(self, mode='rb'):
     """Opens the file-like object.
 
@@ -110,7 +458,7 @@ class EncodedStream(file_io.FileIO):
     Args:
       decoded_data_offset (int): decoded data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    self._encoded_data_offset = 0
 
     self._decoder = self._GetDecoder()
     self._decoded_data = b''
@@ -140,9 +488,11 @@ class EncodedStream(file_io.FileIO):
     Returns:
       int: number of bytes of encoded data read.
     """
-    encoded_data = self._file_object.read(read_size)
+    encoded_data = self._file_object.read_at(
+        self._encoded_data_offset, read_size)
 
     read_count = len(encoded_data)
+    self._encoded_data_offset += read_count
 
     self._encoded_data = b''.join([self._encoded_data, encoded_data])
 
@@ -215,10 +565,6 @@ class EncodedStream(file_io.FileIO):
     if self._current_offset >= self._decoded_stream_size:
       return b''
 
-    if self._realign_offset:
-      self._AlignDecodedDataOffset(self._current_offset)
-      self._realign_offset = False
-
     if size is None:
       size = self._decoded_stream_size
     if self._current_offset + size > self._decoded_stream_size:
@@ -229,6 +575,15 @@ class EncodedStream(file_io.FileIO):
     if size == 0:
       return decoded_data
 
+    if self._HasLineIndex():
+      decoded_data = self._ReadDecodedDataAt(self._current_offset, size)
+      self._current_offset += len(decoded_data)
+      return decoded_data
+
+    if self._realign_offset:
+      self._AlignDecodedDataOffset(self._current_offset)
+      self._realign_offset = False
+
     while size > self._decoded_data_size:
       decoded_data = b''.join([
           decoded_data,
@@ -261,6 +616,48 @@ class EncodedStream(file_io.FileIO):
 
     return decoded_data
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None or a negative value is
+          all remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    # Without a line index the encoded data can only be decoded sequentially.
+    if not self._HasLineIndex():
+      return super(EncodedStream, self).read_at(offset, size)
+
+    if self._decoded_stream_size is None:
+      self._decoded_stream_size = self._GetDecodedStreamSize()
+
+    if offset >= self._decoded_stream_size:
+      return b''
+
+    if (size is None or size < 0 or
+        offset + size > self._decoded_stream_size):
+      size = self._decoded_stream_size - offset
+
+    if size == 0:
+      return b''
+
+    return self._ReadDecodedDataAt(offset, size)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
@@ -30,9 +30,12 @@ class EncryptedStream(file_io.FileIO):
     self._decrypted_stream_size = None
     self._decrypter = None
     self._encrypted_data = b''
+    self._encrypted_data_offset = 0
     self._encryption_method = None
     self._file_object = None
+    self._range_decrypter = None
     self._realign_offset = True
+    self._supports_random_access = None
 
   def _Close(self):
     """Closes the file-like object.
@@ -45,6 +48,8 @@ class EncryptedStream(file_io.FileIO):
     self._decrypted_data = b''
     self._encrypted_data = b''
     self._file_object = None
+    self._range_decrypter = None
+    self._supports_random_access = None
 
   def _GetDecrypter(self):
     """Retrieves a decrypter.
@@ -68,14 +73,21 @@ class EncryptedStream(file_io.FileIO):
   def _GetDecryptedStreamSize(self):
     """Retrieves the decrypted stream size.
 
+    If the decrypter supports random access the decrypted stream size is
+    the size of the encrypted data, otherwise all the encrypted data is
+    decrypted to determine the decrypted stream size.
+
     Returns:
       int: decrypted stream size.
     """
+    if self._GetRangeDecrypter():
+      return self._file_object.get_size()
+
     self._decrypter = self._GetDecrypter()
     self._decrypted_data = b''
     self._decrypted_data_size = 0
 
-    self._file_object.seek(0, os.SEEK_SET)
+    self._encrypted_data_offset = 0
     self._encrypted_data = b''
 
     decrypted_stream_size = 0
@@ -91,6 +103,25 @@ class EncryptedStream(file_io.FileIO):
 
     return decrypted_stream_size
 
+  def _GetRangeDecrypter(self):
+    """Retrieves a decrypter that supports decrypting a range of the data.
+
+    Returns:
+      Decrypter: decrypter or None if the decrypter does not support random
+          access.
+
+    Raises:
+      IOError: if the decrypter cannot be initialized.
+      OSError: if the decrypter cannot be initialized.
+    """
+    if self._supports_random_access is None:
+      decrypter = self._GetDecrypter()
+      self._supports_random_access = decrypter.SupportsRandomAccess()
+      if self._supports_random_access:
+        self._range_decrypter = decrypter
+
+    return self._range_decrypter
+
   def _Open(self, mode='rb'):
     """Opens the file-like object.
 
@@ -127,7 +158,7 @@ class EncryptedStream(file_io.FileIO):
     self._decrypted_data = b''
     self._decrypted_data_size = 0
 
-    self._file_object.seek(0, os.SEEK_SET)
+    self._encrypted_data_offset = 0
     self._encrypted_data = b''
 
     read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
@@ -154,9 +185,11 @@ class EncryptedStream(file_io.FileIO):
     Returns:
       int: number of bytes of encrypted data read.
     """
-    encrypted_data = self._file_object.read(read_size)
+    encrypted_data = self._file_object.read_at(
+        self._encrypted_data_offset, read_size)
 
     read_count = len(encrypted_data)
+    self._encrypted_data_offset += read_count
 
     self._encrypted_data = b''.join([self._encrypted_data, encrypted_data])
 
@@ -229,15 +262,22 @@ class EncryptedStream(file_io.FileIO):
     if self._current_offset >= self._decrypted_stream_size:
       return b''
 
-    if self._realign_offset:
-      self._AlignDecryptedDataOffset(self._current_offset)
-      self._realign_offset = False
-
     if size is None:
       size = self._decrypted_stream_size
     if self._current_offset + size > self._decrypted_stream_size:
       size = self._decrypted_stream_size - self._current_offset
 
+    range_decrypter = self._GetRangeDecrypter()
+    if range_decrypter:
+      decrypted_data = range_decrypter.DecryptRange(
+          self._file_object.read_at, self._current_offset, size)
+      self._current_offset += len(decrypted_data)
+      return decrypted_data
+
+    if self._realign_offset:
+      self._AlignDecryptedDataOffset(self._current_offset)
+      self._realign_offset = False
+
     decrypted_data = b''
 
     if size == 0:
@@ -276,6 +316,51 @@ class EncryptedStream(file_io.FileIO):
 
     return decrypted_data
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None or a negative value is
+          all remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    # Without a range decrypter the encrypted data can only be decrypted
+    # sequentially.
+    range_decrypter = self._GetRangeDecrypter()
+    if not range_decrypter:
+      return super(EncryptedStream, self).read_at(offset, size)
+
+    if self._decrypted_stream_size is None:
+      self._decrypted_stream_size = self._GetDecryptedStreamSize()
+
+    if self._decrypted_stream_size < 0:
+      raise IOError('Invalid decrypted stream size.')
+
+    if offset >= self._decrypted_stream_size:
+      return b''
+
+    if (size is None or size < 0 or
+        offset + size > self._decrypted_stream_size):
+      size = self._decrypted_stream_size - offset
+
+    return range_decrypter.DecryptRange(
+        self._file_object.read_at, offset, size)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""The extents file-like object implementation."""
+
+import bisect
+import os
+
+from dfvfs.file_io import file_io
+from dfvfs.lib import definitions
+
+
+class ExtentsFile(file_io.FileIO):
+  """Extents file input/output (IO) object.
+
+  The extents file-like object reads the data of a data stream directly from
+  its extents in the file-like object that contains the file system, such as
+  a volume, bypassing the file system back end. Physically adjacent extents
+  are merged into runs, hence a sequential read of a data stream results in
+  large sequential reads of the volume. Sparse extents and data beyond
+  the last extent are read as zero bytes.
+
+  The extents file-like object is only intended for data streams of which
+  the data is stored unmodified in the extents, that is data streams that are
+  not resident, compressed or encrypted.
+  """
+
+  def __init__(self, resolver_context, path_spec, file_object, extents, size):
+    """Initializes a file input/output (IO) object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      path_spec (PathSpec): a path specification.
+      file_object (FileIO): file-like object that contains the extents, where
+          the offsets of the extents are relative to the start of the
+          file-like object.
+      extents (list[Extent]): extents of the data stream.
+      size (int): size of the data stream.
+
+    Raises:
+      ValueError: if the size is less than zero or an extent is compressed
+          or not supported.
+    """
+    if size < 0:
+      raise ValueError('Invalid size value less than zero.')
+
+    super(ExtentsFile, self).__init__(resolver_context, path_spec)
+    self._current_offset = 0
+    self._file_object = file_object
+    self._run_offsets = []
+    self._runs = []
+    self._size = size
+
+    self._BuildRuns(extents)
+
+  @property
+  def number_of_runs(self):
+    """int: number of runs of the merged extents."""
+    return len(self._runs)
+
+  def _BuildRuns(self, extents):
+    """Builds the runs from the extents.
+
+    A run is a range of data of the data stream that is either stored
+    contiguously in the file-like object or is sparse.
+
+    Args:
+      extents (list[Extent]): extents of the data stream.
+
+    Raises:
+      ValueError: if an extent is compressed or not supported.
+    """
+    run_offset = 0
+    for data_stream_extent in extents:
+      if data_stream_extent.extent_type == definitions.EXTENT_TYPE_SPARSE:
+        physical_offset = None
+      elif data_stream_extent.extent_type == definitions.EXTENT_TYPE_DATA:
+        physical_offset = data_stream_extent.offset
+      else:
+        raise ValueError('Unsupported extent type: {0!s}.'.format(
+            data_stream_extent.extent_type))
+
+      if run_offset >= self._size:
+        break
+
+      run_size = min(data_stream_extent.size, self._size - run_offset)
+      if run_size <= 0:
+        continue
+
+      if self._runs:
+        last_run_offset, last_physical_offset, last_run_size = self._runs[-1]
+        if physical_offset is None:
+          is_adjacent = last_physical_offset is None
+        else:
+          is_adjacent = last_physical_offset is not None and (
+              last_physical_offset + last_run_size == physical_offset)
+
+        if is_adjacent:
+          self._runs[-1] = (
+              last_run_offset, last_physical_offset, last_run_size + run_size)
+          run_offset += run_size
+          continue
+
+      self._runs.append((run_offset, physical_offset, run_size))
+      self._run_offsets.append(run_offset)
+      run_offset += run_size
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    The file-like object that contains the extents is not closed since it is
+    owned by the resolver context.
+    """
+    return
+
+  def _Open(self, mode='rb'):
+    """Opens the file-like object.
+
+    The file-like object that contains the extents is expected to be open
+    already.
+
+    Args:
+      mode (Optional[str]): file access mode.
+    """
+    return
+
+  def _ReadAt(self, offset, size):
+    """Reads a byte string from the extents at a specific offset.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None is all remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if offset >= self._size:
+      return b''
+
+    if size is None or offset + size > self._size:
+      size = self._size - offset
+
+    if size <= 0:
+      return b''
+
+    end_offset = offset + size
+
+    data_parts = []
+    run_index = max(bisect.bisect_right(self._run_offsets, offset) - 1, 0)
+    number_of_runs = len(self._runs)
+
+    while offset < end_offset:
+      if run_index < number_of_runs:
+        run_offset, physical_offset, run_size = self._runs[run_index]
+      else:
+        run_offset, physical_offset, run_size = (
+            offset, None, end_offset - offset)
+
+      run_end_offset = run_offset + run_size
+      if run_end_offset <= offset:
+        run_index += 1
+        continue
+
+      read_size = min(run_end_offset, end_offset) - offset
+
+      if physical_offset is None:
+        data_parts.append(b'\x00' * read_size)
+      else:
+        data = self._file_object.read_at(
+            physical_offset + offset - run_offset, read_size)
+        data_parts.append(data)
+
+        if len(data) < read_size:
+          break
+
+      offset += read_size
+      run_index += 1
+
+    return b''.join(data_parts)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    data = self._ReadAt(self._current_offset, size)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    return self._ReadAt(offset, size)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+
+    elif whence == os.SEEK_END:
+      offset += self._size
+
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the data stream.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._size
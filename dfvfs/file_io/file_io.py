@@ -127,6 +127,40 @@ class FileIO(object):
       OSError: if the read failed.
     """
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file input/output (IO) object at an offset.
+
+    The current offset of the file input/output (IO) object is not changed.
+    File input/output (IO) objects that can read at a specific offset without
+    seeking should override this method.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    current_offset = self.get_offset()
+
+    self.seek(offset, os.SEEK_SET)
+    try:
+      data = self.read(size)
+    finally:
+      self.seek(current_offset, os.SEEK_SET)
+
+    return data
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file input/output (IO) object.
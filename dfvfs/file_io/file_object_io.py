@@ -21,12 +21,16 @@ class FileObjectIO(file_io.FileIO):
     """
     super(FileObjectIO, self).__init__(resolver_context, path_spec)
     self._file_object = None
+    # The current offset to restore after read_at changed the current offset
+    # of the file-like object or None if not changed.
+    self._restore_offset = None
     self._size = None
 
   def _Close(self):
     """Closes the file-like object."""
     self._file_object.close()
     self._file_object = None
+    self._restore_offset = None
 
   def _Open(self, mode='rb'):
     """Opens the file-like object defined by path specification.
@@ -44,6 +48,12 @@ class FileObjectIO(file_io.FileIO):
     if not self._file_object:
       raise IOError('Unable to open missing file-like object.')
 
+  def _RestoreOffset(self):
+    """Restores the current offset of the file-like object after read_at."""
+    if self._restore_offset is not None:
+      self._file_object.seek(self._restore_offset, os.SEEK_SET)
+      self._restore_offset = None
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def _OpenFileObject(self, path_spec):
@@ -83,10 +93,48 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    self._RestoreOffset()
+
     # Do not pass the size argument as a keyword argument since it breaks
     # some file-like object implementations.
     return self._file_object.read(size)
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not hasattr(self._file_object, 'read_buffer_at_offset'):
+      return super(FileObjectIO, self).read_at(offset, size)
+
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size is None:
+      size = max(self.get_size() - offset, 0)
+
+    # The libyal read_buffer_at_offset functions change the current offset
+    # of the file-like object, hence it is restored when it is needed, so
+    # that successive reads at an offset do not require a seek.
+    if self._restore_offset is None:
+      self._restore_offset = self._file_object.get_offset()
+
+    return self._file_object.read_buffer_at_offset(size, offset)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
@@ -102,7 +150,12 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    if self._restore_offset is not None and whence == os.SEEK_CUR:
+      offset += self._restore_offset
+      whence = os.SEEK_SET
+
     self._file_object.seek(offset, whence)
+    self._restore_offset = None
 
   def get_offset(self):
     """Retrieves the current offset into the file-like object.
@@ -117,6 +170,9 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    if self._restore_offset is not None:
+      return self._restore_offset
+
     if not hasattr(self._file_object, 'get_offset'):
       return self._file_object.tell()
     return self._file_object.get_offset()
@@ -15,6 +15,11 @@ class GzipFile(file_object_io.FileObjectIO):
     """list(str): comments in the gzip file."""
     return [member.comment for member in self._file_object.members]
 
+  @property
+  def index(self):
+    """GzipIndex: gzip index."""
+    return self._file_object.index
+
   @property
   def modification_times(self):
     """list(int): modification times stored in the gzip file."""
@@ -54,8 +59,21 @@ class GzipFile(file_object_io.FileObjectIO):
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
 
+    gzip_index = self._resolver_context.GetGzipIndex(path_spec.parent)
+
     gzip_compressed_stream = gzipfile.GzipCompressedStream()
-    gzip_compressed_stream.Open(file_object)
+    if gzip_index:
+      try:
+        gzip_compressed_stream.Open(file_object, gzip_index=gzip_index)
+      except IOError:
+        # The gzip index does not match the gzip file, for example because
+        # the gzip file was changed, hence the gzip index is built again.
+        gzip_index = None
+
+    if not gzip_index:
+      gzip_compressed_stream.Open(file_object)
+      self._resolver_context.SetGzipIndex(
+          path_spec.parent, gzip_compressed_stream.index)
 
     return gzip_compressed_stream
 
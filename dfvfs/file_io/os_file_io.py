@@ -22,12 +22,14 @@ class OSFile(file_io.FileIO):
       path_spec (PathSpec): a path specification.
     """
     super(OSFile, self).__init__(resolver_context, path_spec)
+    self._file_descriptor = None
     self._file_object = None
     self._size = 0
 
   def _Close(self):
     """Closes the file-like object."""
     self._file_object.close()
+    self._file_descriptor = None
     self._file_object = None
 
   def _Open(self, mode='rb'):
@@ -113,6 +115,10 @@ class OSFile(file_io.FileIO):
       self._file_object = open(location, mode=mode)  # pylint: disable=consider-using-with
       self._size = stat_info.st_size
 
+      # Note that os.pread is not available on Windows.
+      if hasattr(os, 'pread'):
+        self._file_descriptor = self._file_object.fileno()
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -142,6 +148,37 @@ class OSFile(file_io.FileIO):
 
     return self._file_object.read(size)
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None or a negative value is
+          all remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if self._file_descriptor is None:
+      return super(OSFile, self).read_at(offset, size)
+
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size is None or size < 0:
+      size = max(self._size - offset, 0)
+
+    return os.pread(self._file_descriptor, size, offset)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
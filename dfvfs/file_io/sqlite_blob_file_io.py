@@ -2,6 +2,7 @@
 """The SQlite blob file-like object."""
 
 import os
+import sqlite3
 
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
@@ -12,6 +13,10 @@ from dfvfs.resolver import resolver
 class SQLiteBlobFile(file_io.FileIO):
   """File input/output (IO) object using sqlite."""
 
+  # Blobs larger than this size are read incrementally instead of being kept
+  # in memory.
+  _MAXIMUM_BLOB_SIZE_IN_MEMORY = 1024 * 1024
+
   _OPERATORS = frozenset(['==', '=', 'IS'])
 
   def __init__(self, resolver_context, path_spec):
@@ -23,22 +28,99 @@ class SQLiteBlobFile(file_io.FileIO):
     """
     super(SQLiteBlobFile, self).__init__(resolver_context, path_spec)
     self._blob = None
+    self._column_name = None
     self._current_offset = 0
     self._database_object = None
     self._number_of_rows = None
+    self._row_identifier = None
     self._size = 0
     self._table_name = None
 
   def _Close(self):
-    """Closes the file-like object."""
-    if self._database_object:
-      self._database_object.Close()
+    """Closes the file-like object.
 
+    The database is not closed since it is shared with other file-like objects
+    by the resolver context.
+    """
     self._blob = None
+    self._column_name = None
     self._current_offset = 0
+    self._database_object = None
+    self._number_of_rows = None
+    self._row_identifier = None
     self._size = 0
     self._table_name = None
 
+  def _GetDatabase(self):
+    """Retrieves the database that contains the blob.
+
+    The database is materialized once per resolver context and is shared by
+    the file-like objects of the blobs it contains.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database.
+
+    Raises:
+      IOError: if the database could not be opened.
+      OSError: if the database could not be opened.
+    """
+    database_path_spec = self._path_spec.parent
+
+    database_object = self._resolver_context.GetDatabase(database_path_spec)
+    if not database_object:
+      with self._resolver_context.GetDatabaseOpenLock(database_path_spec):
+        # Check the cache again in case the database was opened while waiting
+        # for the lock, without counting the cache miss twice.
+        # pylint: disable=protected-access
+        database_object = self._resolver_context._LookupDatabase(
+            database_path_spec)
+        if not database_object:
+          file_object = resolver.Resolver.OpenFileObject(
+              database_path_spec, resolver_context=self._resolver_context)
+
+          database_object = sqlite_database.SQLiteDatabaseFile()
+          database_object.Open(file_object, maximum_in_memory_size=(
+              self._resolver_context.maximum_in_memory_database_size))
+
+          self._resolver_context.CacheDatabase(
+              database_path_spec, database_object)
+
+    return database_object
+
+  def _QueryRowIdentifiers(
+      self, database_object, table_name, column_name, query_clause,
+      parameters):
+    """Queries the row identifiers, types and sizes of the blob values.
+
+    Args:
+      database_object (SQLiteDatabaseFile): SQLite database.
+      table_name (str): name of the table.
+      column_name (str): name of the column that contains the blob.
+      query_clause (str): clause of the query that selects the row.
+      parameters (tuple): query parameters or None.
+
+    Returns:
+      tuple[str, list[tuple[int, bytes, int]]]: name that refers to the row
+          identifier and the row identifier, type and size of the value of
+          the matching rows or None if the table has no row identifiers,
+          such as a WITHOUT ROWID table, or if the names that refer to
+          the row identifier are shadowed by columns of the table.
+    """
+    row_identifier_name = database_object.GetRowIdentifierName(table_name)
+    if not row_identifier_name:
+      return None
+
+    query = (
+        'SELECT {0:s}, typeof({1:s}), length({1:s}) FROM {2:s} {3:s}').format(
+            row_identifier_name, column_name, table_name, query_clause)
+
+    try:
+      rows = database_object.Query(query, parameters=parameters)
+    except sqlite3.OperationalError:
+      return None
+
+    return row_identifier_name, rows
+
   def _Open(self, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -81,11 +163,7 @@ class SQLiteBlobFile(file_io.FileIO):
     if self._database_object:
       raise IOError('Database file already set.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        self._path_spec.parent, resolver_context=self._resolver_context)
-
-    database_object = sqlite_database.SQLiteDatabaseFile()
-    database_object.Open(file_object)
+    database_object = self._GetDatabase()
 
     # Sanity check the table and column names.
     error_string = ''
@@ -97,9 +175,8 @@ class SQLiteBlobFile(file_io.FileIO):
           column_name, table_name)
 
     elif not row_condition:
-      query = 'SELECT {0:s} FROM {1:s} LIMIT 1 OFFSET {2:d}'.format(
-          column_name, table_name, row_index)
-      rows = database_object.Query(query)
+      query_clause = 'LIMIT 1 OFFSET {0:d}'.format(row_index)
+      parameters = None
 
     elif not database_object.HasColumn(table_name, row_condition[0]):
       error_string = (
@@ -112,13 +189,28 @@ class SQLiteBlobFile(file_io.FileIO):
               row_condition[1]))
 
     else:
-      query = 'SELECT {0:s} FROM {1:s} WHERE {2:s} {3:s} ?'.format(
-          column_name, table_name, row_condition[0], row_condition[1])
-      rows = database_object.Query(query, parameters=(row_condition[2], ))
+      query_clause = 'WHERE {0:s} {1:s} ?'.format(
+          row_condition[0], row_condition[1])
+      parameters = (row_condition[2], )
+
+    if not error_string:
+      row_identifier_name = None
+      result = self._QueryRowIdentifiers(
+          database_object, table_name, column_name, query_clause, parameters)
+      if result:
+        row_identifier_name, rows = result
+
+      # The value is read as a whole if the row identifier is not available
+      # or not an integer.
+      if not result or (
+          len(rows) == 1 and not isinstance(rows[0][0], int)):
+        query = 'SELECT {0:s} FROM {1:s} {2:s}'.format(
+            column_name, table_name, query_clause)
+        rows = database_object.Query(query, parameters=parameters)
 
     # Make sure the query returns a single row, using cursor.rowcount
     # is not reliable for this purpose.
-    if not error_string and (len(rows) != 1 or len(rows[0]) != 1):
+    if not error_string and len(rows) != 1:
       if not row_condition:
         error_string = (
             'Unable to open blob in table: {0:s} and column: {1:s} '
@@ -133,13 +225,31 @@ class SQLiteBlobFile(file_io.FileIO):
                 table_name, column_name, row_condition_string)
 
     if error_string:
-      database_object.Close()
       raise IOError(error_string)
 
-    self._blob = rows[0][0]
+    blob = None
+    row_identifier = None
+    if len(rows[0]) == 1:
+      blob = rows[0][0]
+      size = len(blob)
+
+    else:
+      row_identifier, value_type, size = rows[0]
+      if value_type != b'blob' or size <= self._MAXIMUM_BLOB_SIZE_IN_MEMORY:
+        query = 'SELECT {0:s} FROM {1:s} WHERE {2:s} = ?'.format(
+            column_name, table_name, row_identifier_name)
+        rows = database_object.Query(query, parameters=(row_identifier, ))
+
+        blob = rows[0][0]
+        row_identifier = None
+        size = len(blob)
+
+    self._blob = blob
+    self._column_name = column_name
     self._current_offset = 0
     self._database_object = database_object
-    self._size = len(self._blob)
+    self._row_identifier = row_identifier
+    self._size = size
     self._table_name = table_name
 
   # TODO: remove this when there is a move this to a central temp file
@@ -199,8 +309,17 @@ class SQLiteBlobFile(file_io.FileIO):
       size = self._size - self._current_offset
 
     start_offset = self._current_offset
-    self._current_offset += size
-    return self._blob[start_offset:self._current_offset]
+    end_offset = start_offset + size
+
+    if self._blob is None:
+      data = self._database_object.ReadBlob(
+          self._table_name, self._column_name, self._row_identifier,
+          start_offset, size)
+    else:
+      data = self._blob[start_offset:end_offset]
+
+    self._current_offset = end_offset
+    return data
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""The thread-safe file-like object implementation."""
+
+import os
+import threading
+
+from dfvfs.file_io import file_io
+
+
+class ThreadSafeFile(file_io.FileIO):
+  """Thread-safe file input/output (IO) object.
+
+  The thread-safe file-like object shares another file-like object, the back
+  end, between threads. Every thread has its own current offset (cursor) and
+  reads of the back end are positional and serialized with a lock.
+  """
+
+  def __init__(self, resolver_context, path_spec, file_object):
+    """Initializes a file input/output (IO) object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      path_spec (PathSpec): a path specification.
+      file_object (FileIO): file-like object that is shared between threads.
+    """
+    super(ThreadSafeFile, self).__init__(resolver_context, path_spec)
+    self._file_object = file_object
+    self._lock = threading.RLock()
+    self._thread_local = threading.local()
+
+  def __getattr__(self, name):
+    """Retrieves an attribute of the shared file-like object.
+
+    Args:
+      name (str): name of the attribute.
+
+    Returns:
+      object: value of the attribute.
+
+    Raises:
+      AttributeError: if the attribute does not exist.
+    """
+    # Prevent recursion when the shared file-like object is not set, for
+    # example when __init__ failed.
+    if name == '_file_object':
+      raise AttributeError(name)
+
+    return getattr(self._file_object, name)
+
+  @property
+  def file_object(self):
+    """FileIO: file-like object that is shared between threads."""
+    return self._file_object
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    The shared file-like object is not closed since it is owned by
+    the resolver context.
+    """
+    return
+
+  def _GetCurrentOffset(self):
+    """Retrieves the current offset of the calling thread.
+
+    Returns:
+      int: current offset of the calling thread.
+    """
+    return getattr(self._thread_local, 'current_offset', 0)
+
+  def _Open(self, mode='rb'):
+    """Opens the file-like object.
+
+    The shared file-like object is expected to be open already.
+
+    Args:
+      mode (Optional[str]): file access mode.
+    """
+    return
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    current_offset = self._GetCurrentOffset()
+
+    data = self.read_at(current_offset, size)
+
+    self._thread_local.current_offset = current_offset + len(data)
+
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the calling thread is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read, where None is all remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    with self._lock:
+      if size is None:
+        size = max(self._file_object.get_size() - offset, 0)
+
+      return self._file_object.read_at(offset, size)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._GetCurrentOffset()
+
+    elif whence == os.SEEK_END:
+      offset += self.get_size()
+
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._thread_local.current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset of the calling thread.
+
+    Returns:
+      int: current offset of the calling thread.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._GetCurrentOffset()
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    with self._lock:
+      return self._file_object.get_size()
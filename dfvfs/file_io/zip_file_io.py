@@ -5,14 +5,32 @@
 # an instance of file_io.FileIO.
 
 import os
+import struct
 import zipfile
 
+from dfvfs.file_io import compressed_stream_io
 from dfvfs.file_io import file_io
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver
 
 
 class ZipFile(file_io.FileIO):
-  """File input/output (IO) object using zipfile."""
+  """File input/output (IO) object using zipfile.
+
+  The data of stored (uncompressed) members is read directly from the member
+  data in the parent file-like object and the data of deflate compressed
+  members is read using a compressed stream, which stores decompressor
+  checkpoints to speed up seeking backwards. Other members, such as encrypted
+  members, are read using zipfile.
+  """
+
+  # The general purpose bit flag that indicates the member is encrypted.
+  _FLAG_ENCRYPTED = 0x0001
+
+  _LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+
+  _LOCAL_FILE_HEADER_SIZE = 30
 
   # The size of the uncompressed data buffer.
   _UNCOMPRESSED_DATA_BUFFER_SIZE = 16 * 1024 * 1024
@@ -28,10 +46,12 @@ class ZipFile(file_io.FileIO):
     self._compressed_data = b''
     self._current_offset = 0
     self._file_system = None
+    self._member_data_file_object = None
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = 0
     self._uncompressed_stream_size = None
     self._zip_ext_file = None
     self._zip_file = None
@@ -43,11 +63,69 @@ class ZipFile(file_io.FileIO):
       self._zip_ext_file.close()
       self._zip_ext_file = None
 
+    self._member_data_file_object = None
     self._zip_file = None
     self._zip_info = None
 
     self._file_system = None
 
+  def _OpenMemberDataFileObject(self):
+    """Opens a file-like object of the member data.
+
+    Returns:
+      FileIO: file-like object of the member data or None if the member data
+          cannot be read without zipfile, for example if the member is
+          encrypted or uses a compression method other than deflate.
+    """
+    if self._zip_info.flag_bits & self._FLAG_ENCRYPTED:
+      return None
+
+    if self._zip_info.compress_type not in (
+        zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+      return None
+
+    if not self._zip_info.compress_size or not self._zip_info.file_size:
+      return None
+
+    parent_file_object = resolver.Resolver.OpenFileObject(
+        self._path_spec.parent, resolver_context=self._resolver_context)
+
+    # The size of the local file header can differ from the size stored in
+    # the central directory, for example the size of the extra field, hence
+    # the offset of the member data is determined from the local file header.
+    local_file_header = parent_file_object.read_at(
+        self._zip_info.header_offset, self._LOCAL_FILE_HEADER_SIZE)
+    if (len(local_file_header) != self._LOCAL_FILE_HEADER_SIZE or
+        local_file_header[:4] != self._LOCAL_FILE_HEADER_SIGNATURE):
+      return None
+
+    name_size, extra_field_size = struct.unpack(
+        '<HH', local_file_header[26:30])
+
+    data_offset = (
+        self._zip_info.header_offset + self._LOCAL_FILE_HEADER_SIZE +
+        name_size + extra_field_size)
+
+    data_range_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_DATA_RANGE, range_offset=data_offset,
+        range_size=self._zip_info.compress_size, parent=self._path_spec.parent)
+
+    if self._zip_info.compress_type == zipfile.ZIP_STORED:
+      return resolver.Resolver.OpenFileObject(
+          data_range_path_spec, resolver_context=self._resolver_context)
+
+    compressed_stream_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+        compression_method=definitions.COMPRESSION_METHOD_DEFLATE,
+        parent=data_range_path_spec)
+
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, compressed_stream_path_spec)
+    file_object.SetUncompressedStreamSize(self._zip_info.file_size)
+    file_object.Open()
+
+    return file_object
+
   def _Open(self, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -77,9 +155,15 @@ class ZipFile(file_io.FileIO):
     self._current_offset = 0
     self._uncompressed_stream_size = self._zip_info.file_size
 
+    self._member_data_file_object = self._OpenMemberDataFileObject()
+
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression is continued when the offset lies ahead of the current
+    position otherwise the ZIP file is reopened and decompressed from
+    the start.
+
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
 
@@ -87,31 +171,33 @@ class ZipFile(file_io.FileIO):
       IOError: if the ZIP file could not be opened.
       OSError: if the ZIP file could not be opened.
     """
-    if self._zip_ext_file:
-      self._zip_ext_file.close()
-      self._zip_ext_file = None
-
-    try:
-      # The open can fail if the file path in the local file header
-      # does not use the same path segment separator as the corresponding
-      # entry in the central directory.
-      self._zip_ext_file = self._zip_file.open(self._zip_info, 'r')
-    except zipfile.BadZipfile as exception:
-      raise IOError(
-          'Unable to open ZIP file with error: {0!s}'.format(exception))
-
-    self._uncompressed_data = b''
-    self._uncompressed_data_size = 0
-    self._uncompressed_data_offset = 0
-
-    while uncompressed_data_offset > 0:
+    if (not self._zip_ext_file or
+        uncompressed_data_offset < self._uncompressed_data_start_offset):
+      if self._zip_ext_file:
+        self._zip_ext_file.close()
+        self._zip_ext_file = None
+
+      try:
+        # The open can fail if the file path in the local file header
+        # does not use the same path segment separator as the corresponding
+        # entry in the central directory.
+        self._zip_ext_file = self._zip_file.open(self._zip_info, 'r')
+      except zipfile.BadZipfile as exception:
+        raise IOError(
+            'Unable to open ZIP file with error: {0!s}'.format(exception))
+
+      self._uncompressed_data = b''
+      self._uncompressed_data_size = 0
+      self._uncompressed_data_start_offset = 0
+
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_start_offset + self._uncompressed_data_size):
       self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      if self._uncompressed_data_size == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_start_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
@@ -119,6 +205,7 @@ class ZipFile(file_io.FileIO):
     Args:
       read_size (int): number of bytes of compressed data to read.
     """
+    self._uncompressed_data_start_offset += self._uncompressed_data_size
     self._uncompressed_data = self._zip_ext_file.read(read_size)
     self._uncompressed_data_size = len(self._uncompressed_data)
 
@@ -156,6 +243,12 @@ class ZipFile(file_io.FileIO):
         self._current_offset + size > self._uncompressed_stream_size):
       size = self._uncompressed_stream_size - self._current_offset
 
+    if self._member_data_file_object:
+      uncompressed_data = self._member_data_file_object.read_at(
+          self._current_offset, size)
+      self._current_offset += len(uncompressed_data)
+      return uncompressed_data
+
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
@@ -193,6 +286,39 @@ class ZipFile(file_io.FileIO):
 
     return uncompressed_data
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._member_data_file_object:
+      return super(ZipFile, self).read_at(offset, size)
+
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if offset >= self._uncompressed_stream_size:
+      return b''
+
+    if size is None or offset + size > self._uncompressed_stream_size:
+      size = self._uncompressed_stream_size - offset
+
+    return self._member_data_file_object.read_at(offset, size)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
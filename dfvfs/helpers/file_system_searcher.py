@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 """A searcher to find file entries within a file system."""
 
+import queue
 import re
 import sre_constants
+import threading
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import glob2regex
 from dfvfs.lib import decorators
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
 
 class FindSpec(object):
@@ -494,6 +498,346 @@ class FindSpec(object):
     return match, location_match
 
 
+class _FindSpecTrieNode(object):
+  """Node of a trie of find specification location segments.
+
+  Attributes:
+    case_insensitive_children (dict[str, _FindSpecTrieNode]): child nodes of
+        case insensitive literal location segments, where the key is the lower
+        case location segment.
+    case_sensitive_children (dict[str, _FindSpecTrieNode]): child nodes of
+        case sensitive literal location segments.
+    find_specs (list[FindSpec]): find specifications of which the location
+        ends at the node.
+    pattern_children (dict[tuple[str, int], tuple[re.Pattern,
+        _FindSpecTrieNode]]): child nodes of regular expression location
+        segments, where the key consists of the pattern and the flags of the
+        regular expression.
+  """
+
+  def __init__(self):
+    """Initializes a find specification trie node."""
+    super(_FindSpecTrieNode, self).__init__()
+    self.case_insensitive_children = {}
+    self.case_sensitive_children = {}
+    self.find_specs = []
+    self.pattern_children = {}
+
+  def GetMatchingChildNodes(self, name):
+    """Retrieves the child nodes that match a name.
+
+    Args:
+      name (str): name of a file entry.
+
+    Returns:
+      list[_FindSpecTrieNode]: child nodes that match the name.
+    """
+    child_nodes = []
+
+    child_node = self.case_sensitive_children.get(name, None)
+    if child_node:
+      child_nodes.append(child_node)
+
+    if self.case_insensitive_children:
+      child_node = self.case_insensitive_children.get(name.lower(), None)
+      if child_node:
+        child_nodes.append(child_node)
+
+    for compiled_regex, child_node in self.pattern_children.values():
+      if compiled_regex.match(name):
+        child_nodes.append(child_node)
+
+    return child_nodes
+
+  def HasChildNodes(self):
+    """Determines if the node has child nodes.
+
+    Returns:
+      bool: True if the node has child nodes.
+    """
+    return bool(
+        self.case_insensitive_children or self.case_sensitive_children or
+        self.pattern_children)
+
+
+class CompiledFindSpecs(object):
+  """Find specifications compiled into a trie of location segments.
+
+  The location segments of the find specifications are merged into a trie,
+  where a child node is either a literal or a regular expression location
+  segment. Glob location segments are converted into regular expressions by
+  the find specification. Regular expression location segments without
+  special characters, such as "Windows" or "\\$Extend", are compiled into
+  literal location segments.
+
+  The file system searcher uses the trie to look up literal location segments
+  by name and only enumerates the sub file entries of a directory when
+  a regular expression location segment or a find specification without
+  a location requires it.
+
+  Note that a case insensitive literal location segment matches every sub
+  file entry whose name only differs in case, such as "Var" and "var".
+  """
+
+  _REGEX_SPECIAL_CHARACTERS = frozenset('$()*+.?[\\]^{|}')
+
+  def __init__(self, find_specs):
+    """Initializes compiled find specifications.
+
+    Args:
+      find_specs (list[FindSpec]): find specifications.
+    """
+    super(CompiledFindSpecs, self).__init__()
+    self._find_specs_without_location = []
+    self._root_node = _FindSpecTrieNode()
+
+    for find_spec in find_specs:
+      self._AddFindSpec(find_spec)
+
+  @property
+  def find_specs_without_location(self):
+    """list[FindSpec]: find specifications without a location."""
+    return self._find_specs_without_location
+
+  @property
+  def root_node(self):
+    """_FindSpecTrieNode: root node of the trie."""
+    return self._root_node
+
+  def _AddFindSpec(self, find_spec):
+    """Adds a find specification to the trie.
+
+    Find specifications with an invalid regular expression location segment
+    are ignored since they cannot match.
+
+    Args:
+      find_spec (FindSpec): find specification.
+    """
+    # pylint: disable=protected-access
+    if find_spec._location_segments is None:
+      self._find_specs_without_location.append(find_spec)
+      return
+
+    # Note that a find specification with a location without segments, such
+    # as "/", only matches the root.
+
+    trie_node = self._root_node
+    for location_segment in find_spec._location_segments:
+      if find_spec._is_regex:
+        trie_node = self._AddRegexLocationSegment(
+            trie_node, location_segment, find_spec._is_case_sensitive)
+        if not trie_node:
+          return
+
+      else:
+        trie_node = self._AddLiteralLocationSegment(
+            trie_node, location_segment, find_spec._is_case_sensitive)
+
+    trie_node.find_specs.append(find_spec)
+
+  def _AddLiteralLocationSegment(
+      self, trie_node, location_segment, case_sensitive):
+    """Adds a literal location segment to the trie.
+
+    Args:
+      trie_node (_FindSpecTrieNode): parent trie node.
+      location_segment (str): literal location segment.
+      case_sensitive (bool): True if the location segment is case sensitive.
+
+    Returns:
+      _FindSpecTrieNode: trie node of the location segment.
+    """
+    if case_sensitive:
+      children = trie_node.case_sensitive_children
+    else:
+      children = trie_node.case_insensitive_children
+      location_segment = location_segment.lower()
+
+    child_node = children.get(location_segment, None)
+    if not child_node:
+      child_node = _FindSpecTrieNode()
+      children[location_segment] = child_node
+
+    return child_node
+
+  def _AddRegexLocationSegment(
+      self, trie_node, location_segment, case_sensitive):
+    """Adds a regular expression location segment to the trie.
+
+    Args:
+      trie_node (_FindSpecTrieNode): parent trie node.
+      location_segment (str|re.Pattern): regular expression location segment,
+          which is compiled if the find specification has already been used
+          to compare a location segment.
+      case_sensitive (bool): True if the location segment is case sensitive.
+
+    Returns:
+      _FindSpecTrieNode: trie node of the location segment or None if
+          the regular expression is invalid.
+    """
+    if isinstance(location_segment, str):
+      literal_location_segment = self._GetLiteralFromRegex(location_segment)
+      if literal_location_segment is not None:
+        return self._AddLiteralLocationSegment(
+            trie_node, literal_location_segment, case_sensitive)
+
+      # Allow '\n' to be matched by '.' and make '\w', '\W', '\b', '\B',
+      # '\d', '\D', '\s' and '\S' Unicode safe.
+      flags = re.DOTALL | re.UNICODE
+      if not case_sensitive:
+        flags |= re.IGNORECASE
+
+      pattern = r'^{0:s}$'.format(location_segment)
+
+    else:
+      flags = location_segment.flags
+      pattern = location_segment.pattern
+
+    lookup_key = (pattern, flags)
+    compiled_regex, child_node = trie_node.pattern_children.get(
+        lookup_key, (None, None))
+    if not child_node:
+      try:
+        compiled_regex = re.compile(pattern, flags=flags)
+      except sre_constants.error:
+        return None
+
+      child_node = _FindSpecTrieNode()
+      trie_node.pattern_children[lookup_key] = (compiled_regex, child_node)
+
+    return child_node
+
+  def _GetLiteralFromRegex(self, regex):
+    """Retrieves the literal string a regular expression matches.
+
+    Args:
+      regex (str): regular expression location segment.
+
+    Returns:
+      str: literal string or None if the regular expression contains special
+          characters.
+    """
+    literal_characters = []
+
+    regex_index = 0
+    regex_length = len(regex)
+    while regex_index < regex_length:
+      character = regex[regex_index]
+      regex_index += 1
+
+      if character == '\\':
+        if regex_index >= regex_length:
+          return None
+
+        character = regex[regex_index]
+        regex_index += 1
+
+        # Escaped alphanumeric characters, such as '\d', are special.
+        if character.isalnum() or character == '_':
+          return None
+
+      elif character in self._REGEX_SPECIAL_CHARACTERS:
+        return None
+
+      literal_characters.append(character)
+
+    return ''.join(literal_characters)
+
+
+class _ParallelFindState(object):
+  """Parallel find state shared between the workers.
+
+  Attributes:
+    abort (threading.Event): event that signals the workers to stop.
+    results (queue.Queue): path specifications of matching file entries,
+        exceptions raised by the workers and None when all tasks are done.
+    tasks (queue.LifoQueue): directories to search, as tuples of path
+        specification, find specifications and location segment index, or
+        None to stop a worker. A last-in-first-out queue is used so that
+        directories are searched depth-first.
+  """
+
+  # Interval in seconds a worker waits for room in the results queue before
+  # it checks if the find was aborted.
+  _RESULTS_QUEUE_TIMEOUT = 0.1
+
+  def __init__(
+      self, maximum_number_of_queued_results, maximum_number_of_queued_tasks):
+    """Initializes a parallel find state.
+
+    Args:
+      maximum_number_of_queued_results (int): maximum number of results that
+          are queued.
+      maximum_number_of_queued_tasks (int): maximum number of tasks that
+          are queued.
+    """
+    super(_ParallelFindState, self).__init__()
+    self._lock = threading.Lock()
+    self._number_of_pending_tasks = 0
+    self.abort = threading.Event()
+    self.results = queue.Queue(maxsize=maximum_number_of_queued_results)
+    self.tasks = queue.LifoQueue(maxsize=maximum_number_of_queued_tasks)
+
+  def AddResult(self, result):
+    """Adds a result.
+
+    Waits for room in the results queue unless the find was aborted.
+
+    Args:
+      result (PathSpec|Exception): path specification of a matching file
+          entry, an exception raised by a worker or None when all tasks are
+          done.
+    """
+    while not self.abort.is_set():
+      try:
+        self.results.put(result, timeout=self._RESULTS_QUEUE_TIMEOUT)
+        break
+      except queue.Full:
+        pass
+
+  def AddTask(self, task):
+    """Adds a task.
+
+    Since the workers add the tasks, a worker does not wait for room in
+    the tasks queue, which could cause all workers to wait on each other.
+
+    Args:
+      task (tuple[PathSpec, list[FindSpec], int]): path specification of
+          the directory to search, find specifications and location segment
+          index.
+
+    Returns:
+      bool: True if the task was added or False if the tasks queue is full.
+    """
+    # The number of pending tasks is incremented before the task is queued,
+    # so that it cannot reach 0 before the task is finished.
+    with self._lock:
+      self._number_of_pending_tasks += 1
+
+    try:
+      self.tasks.put_nowait(task)
+    except queue.Full:
+      # Since the task that adds the task is pending the number of pending
+      # tasks does not reach 0 here.
+      with self._lock:
+        self._number_of_pending_tasks -= 1
+      return False
+
+    return True
+
+  def FinishTask(self):
+    """Marks a task as finished.
+
+    When all tasks are finished None is added to the results.
+    """
+    with self._lock:
+      self._number_of_pending_tasks -= 1
+      all_tasks_finished = self._number_of_pending_tasks == 0
+
+    if all_tasks_finished:
+      self.AddResult(None)
+
+
 class FileSystemSearcher(object):
   """Searcher to find file entries within a file system."""
 
@@ -522,17 +866,22 @@ class FileSystemSearcher(object):
     self._file_system = file_system
     self._mount_point = mount_point
 
-  def _FindInFileEntry(self, file_entry, find_specs, segment_index):
-    """Searches for matching file entries within the file entry.
+  def _CompareFileEntry(self, file_entry, find_specs, segment_index):
+    """Compares a file entry with find specifications.
 
     Args:
       file_entry (FileEntry): file entry.
       find_specs (list[FindSpec]): find specifications.
       segment_index (int): index of the location path segment to compare.
 
-    Yields:
-      PathSpec: path specification of a matching file entry.
+    Returns:
+      tuple: containing:
+
+        int: number of find specifications that match the file entry.
+        list[FindSpec]: find specifications to compare with the sub file
+            entries.
     """
+    number_of_matches = 0
     sub_find_specs = []
     for find_spec in find_specs:
       has_location = find_spec.HasLocation()
@@ -549,12 +898,31 @@ class FileSystemSearcher(object):
 
       if not has_location or (location_match and is_last_location_segment):
         if find_spec.CompareTraits(file_entry):
-          yield file_entry.path_spec
+          number_of_matches += 1
 
       at_last_location_segment = find_spec.AtLastLocationSegment(segment_index)
       if (not has_location or location_match) and not at_last_location_segment:
         sub_find_specs.append(find_spec)
 
+    return number_of_matches, sub_find_specs
+
+  def _FindInFileEntry(self, file_entry, find_specs, segment_index):
+    """Searches for matching file entries within the file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      find_specs (list[FindSpec]): find specifications.
+      segment_index (int): index of the location path segment to compare.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+    """
+    number_of_matches, sub_find_specs = self._CompareFileEntry(
+        file_entry, find_specs, segment_index)
+
+    for _ in range(number_of_matches):
+      yield file_entry.path_spec
+
     if sub_find_specs:
       segment_index += 1
       try:
@@ -566,6 +934,206 @@ class FileSystemSearcher(object):
       except errors.AccessError:
         pass
 
+  def _FindInTrieNodes(
+      self, file_entry, trie_nodes, find_specs_without_location):
+    """Searches for matching file entries using compiled find specifications.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+          of the file entry.
+      find_specs_without_location (list[FindSpec]): find specifications
+          without a location, which are compared with every file entry.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+    """
+    for trie_node in trie_nodes:
+      for find_spec in trie_node.find_specs:
+        if find_spec.CompareTraits(file_entry):
+          yield file_entry.path_spec
+
+    for find_spec in find_specs_without_location:
+      if find_spec.CompareTraits(file_entry):
+        yield file_entry.path_spec
+
+    if not find_specs_without_location and not any(
+        trie_node.HasChildNodes() for trie_node in trie_nodes):
+      return
+
+    try:
+      for sub_file_entry, sub_trie_nodes in self._GetSubFileEntriesInTrieNodes(
+          file_entry, trie_nodes, bool(find_specs_without_location)):
+        for matching_path_spec in self._FindInTrieNodes(
+            sub_file_entry, sub_trie_nodes, find_specs_without_location):
+          yield matching_path_spec
+
+    except errors.AccessError:
+      pass
+
+  def _FindInDirectoryWorker(self, find_state):
+    """Searches for matching file entries within directories in a worker.
+
+    The worker searches the directories in the task queue of the find state,
+    using its own resolver context, until it receives a stop task.
+
+    Args:
+      find_state (_ParallelFindState): parallel find state.
+    """
+    resolver_context = context.Context()
+
+    while True:
+      task = find_state.tasks.get()
+      if task is None:
+        break
+
+      path_spec, find_specs, segment_index = task
+      try:
+        if not find_state.abort.is_set():
+          file_entry = resolver.Resolver.OpenFileEntry(
+              path_spec, resolver_context=resolver_context)
+          if file_entry:
+            self._FindInDirectory(
+                find_state, file_entry, find_specs, segment_index)
+
+      except errors.AccessError:
+        pass
+
+      except Exception as exception:  # pylint: disable=broad-except
+        find_state.AddResult(exception)
+        find_state.abort.set()
+
+      finally:
+        find_state.FinishTask()
+
+  def _FindInDirectory(self, find_state, file_entry, find_specs, segment_index):
+    """Searches for matching file entries within a directory.
+
+    Matching sub file entries are added to the results and sub directories
+    that need to be searched are added to the tasks of the find state. When
+    the tasks queue is full the sub directory is searched by the current
+    worker instead, which bounds the number of queued tasks.
+
+    Args:
+      find_state (_ParallelFindState): parallel find state.
+      file_entry (FileEntry): file entry of the directory.
+      find_specs (list[FindSpec]): find specifications.
+      segment_index (int): index of the location path segment to compare
+          with the sub file entries.
+
+    Raises:
+      AccessError: if the access to the directory was denied.
+    """
+    for sub_file_entry in file_entry.sub_file_entries:
+      if find_state.abort.is_set():
+        break
+
+      number_of_matches, sub_find_specs = self._CompareFileEntry(
+          sub_file_entry, find_specs, segment_index)
+
+      for _ in range(number_of_matches):
+        find_state.AddResult(sub_file_entry.path_spec)
+
+      if sub_find_specs and sub_file_entry.IsDirectory():
+        if not find_state.AddTask(
+            (sub_file_entry.path_spec, sub_find_specs, segment_index + 1)):
+          try:
+            self._FindInDirectory(
+                find_state, sub_file_entry, sub_find_specs, segment_index + 1)
+          except errors.AccessError:
+            pass
+
+  def _GetFindRootFileEntry(self):
+    """Retrieves the file entry where the search starts.
+
+    Returns:
+      FileEntry: file entry of the mount point or the root file entry.
+    """
+    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+        self._file_system.type_indicator):
+      return self._file_system.GetFileEntryByPathSpec(self._mount_point)
+
+    return self._file_system.GetRootFileEntry()
+
+  def _GetSubFileEntriesInTrieNodes(
+      self, file_entry, trie_nodes, enumerate_sub_file_entries):
+    """Retrieves the sub file entries that match child nodes of trie nodes.
+
+    The sub file entries are only enumerated when a regular expression
+    location segment requires it or when requested, otherwise literal location
+    segments are looked up by name.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+          of the file entry.
+      enumerate_sub_file_entries (bool): True if all sub file entries should
+          be returned, including those that do not match a child node.
+
+    Yields:
+      tuple[FileEntry, list[_FindSpecTrieNode]]: sub file entry and the child
+          nodes that match its name.
+    """
+    if enumerate_sub_file_entries or any(
+        trie_node.pattern_children for trie_node in trie_nodes):
+      for sub_file_entry in file_entry.sub_file_entries:
+        sub_trie_nodes = []
+        for trie_node in trie_nodes:
+          sub_trie_nodes.extend(
+              trie_node.GetMatchingChildNodes(sub_file_entry.name))
+
+        if sub_trie_nodes or enumerate_sub_file_entries:
+          yield sub_file_entry, sub_trie_nodes
+
+      return
+
+    # A dictionary is used to look up every name only once, while preserving
+    # the order of the find specifications.
+    lookup_names = {}
+    for trie_node in trie_nodes:
+      for name in trie_node.case_sensitive_children:
+        lookup_names[(name, True)] = True
+      for name in trie_node.case_insensitive_children:
+        lookup_names[(name, False)] = True
+
+    # Case insensitive, a name can match multiple sub file entries.
+    sub_path_specs = set()
+    for name, case_sensitive in lookup_names:
+      for sub_file_entry in file_entry.GetSubFileEntriesByName(
+          name, case_sensitive=case_sensitive):
+        if sub_file_entry.path_spec.comparable in sub_path_specs:
+          continue
+
+        sub_path_specs.add(sub_file_entry.path_spec.comparable)
+
+        sub_trie_nodes = []
+        for trie_node in trie_nodes:
+          sub_trie_nodes.extend(
+              trie_node.GetMatchingChildNodes(sub_file_entry.name))
+
+        yield sub_file_entry, sub_trie_nodes
+
+  def CompiledFind(self, compiled_find_specs):
+    """Searches for matching file entries using compiled find specifications.
+
+    The find specifications are applied the same as by Find, however literal
+    location segments are looked up by name instead of comparing them with
+    every sub file entry, hence the path specifications of matching file
+    entries are not necessarily yielded in the same order as by Find.
+
+    Args:
+      compiled_find_specs (CompiledFindSpecs): compiled find specifications.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+    """
+    file_entry = self._GetFindRootFileEntry()
+
+    for matching_path_spec in self._FindInTrieNodes(
+        file_entry, [compiled_find_specs.root_node],
+        compiled_find_specs.find_specs_without_location):
+      yield matching_path_spec
+
   def Find(self, find_specs=None):
     """Searches for matching file entries within the file system.
 
@@ -577,17 +1145,106 @@ class FileSystemSearcher(object):
       PathSpec: path specification of a matching file entry.
     """
     if not find_specs:
-      find_specs.append(FindSpec())
+      find_specs = [FindSpec()]
 
-    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
-        self._file_system.type_indicator):
-      file_entry = self._file_system.GetFileEntryByPathSpec(self._mount_point)
-    else:
-      file_entry = self._file_system.GetRootFileEntry()
+    file_entry = self._GetFindRootFileEntry()
 
     for matching_path_spec in self._FindInFileEntry(file_entry, find_specs, 0):
       yield matching_path_spec
 
+  def ParallelFind(
+      self, find_specs=None, number_of_workers=4,
+      maximum_number_of_queued_results=1024,
+      maximum_number_of_queued_tasks=1024):
+    """Searches for matching file entries within the file system in parallel.
+
+    The directories are searched by a pool of worker threads, where every
+    worker uses its own resolver context and hence its own file system object.
+    The find specifications are applied the same as by Find, however
+    the path specifications of matching file entries are yielded as they are
+    found and hence not necessarily in the same order as by Find.
+
+    Memory usage is bounded since the workers wait when the maximum number of
+    queued results is reached and search a directory themselves when
+    the maximum number of queued tasks is reached, and since directories are
+    searched depth-first.
+
+    Note that the file system must be resolvable from the path specifications
+    of its file entries, which is not the case for fake file systems.
+
+    Args:
+      find_specs (Optional[list[FindSpec]]): find specifications, where None
+          will return all allocated file entries.
+      number_of_workers (Optional[int]): number of worker threads.
+      maximum_number_of_queued_results (Optional[int]): maximum number of
+          results that are queued for the caller.
+      maximum_number_of_queued_tasks (Optional[int]): maximum number of
+          directories that are queued to be searched by the workers.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+
+    Raises:
+      ValueError: if the number of workers, maximum number of queued results
+          or maximum number of queued tasks is 0 or less.
+    """
+    if number_of_workers <= 0:
+      raise ValueError('Invalid number of workers value zero or less.')
+
+    if maximum_number_of_queued_results <= 0:
+      raise ValueError(
+          'Invalid maximum number of queued results value zero or less.')
+
+    if maximum_number_of_queued_tasks <= 0:
+      raise ValueError(
+          'Invalid maximum number of queued tasks value zero or less.')
+
+    if not find_specs:
+      find_specs = [FindSpec()]
+
+    file_entry = self._GetFindRootFileEntry()
+
+    number_of_matches, sub_find_specs = self._CompareFileEntry(
+        file_entry, find_specs, 0)
+
+    for _ in range(number_of_matches):
+      yield file_entry.path_spec
+
+    if not sub_find_specs:
+      return
+
+    find_state = _ParallelFindState(
+        maximum_number_of_queued_results, maximum_number_of_queued_tasks)
+    find_state.AddTask((file_entry.path_spec, sub_find_specs, 1))
+
+    workers = []
+    for _ in range(number_of_workers):
+      worker = threading.Thread(
+          target=self._FindInDirectoryWorker, args=(find_state, ))
+      worker.daemon = True
+      worker.start()
+      workers.append(worker)
+
+    try:
+      while True:
+        result = find_state.results.get()
+        if result is None:
+          break
+
+        if isinstance(result, Exception):
+          raise result
+
+        yield result
+
+    finally:
+      find_state.abort.set()
+
+      for _ in workers:
+        find_state.tasks.put(None)
+
+      for worker in workers:
+        worker.join()
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -398,16 +398,60 @@ class SourceScannerContext(object):
 class SourceScanner(object):
   """Searcher to find volumes within a volume system."""
 
-  def __init__(self, resolver_context=None):
+  # The format categories that are determined at once when scanning a node.
+  _SCAN_NODE_FORMAT_CATEGORIES = [
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM]
+
+  def __init__(self, resolver_context=None, scan_result_cache=None):
     """Initializes a source scanner.
 
     Args:
       resolver_context (Optional[Context]): resolver context, where None
           indicates to use the built-in context which is not multi process
           safe.
+      scan_result_cache (Optional[SourceScannerCache]): cache of scan results,
+          where None indicates scan results are not cached.
     """
     super(SourceScanner, self).__init__()
     self._resolver_context = resolver_context
+    self._scan_result_cache = scan_result_cache
+    self._type_indicators_per_path_spec = None
+
+  def _GetTypeIndicators(self, path_spec, format_category):
+    """Determines the supported format types of a format category.
+
+    While a node is scanned, the supported format types of the storage media
+    image, volume system and file system format categories are determined at
+    once, since the same path specification is typically scanned for all of
+    these format categories, and cached for the duration of the scan.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    if self._type_indicators_per_path_spec is None:
+      type_indicators_per_category = (
+          analyzer.Analyzer.GetTypeIndicatorsPerFormatCategory(
+              path_spec, format_categories=[format_category],
+              resolver_context=self._resolver_context))
+      return type_indicators_per_category[format_category]
+
+    type_indicators_per_category = self._type_indicators_per_path_spec.get(
+        path_spec, None)
+    if type_indicators_per_category is None:
+      type_indicators_per_category = (
+          analyzer.Analyzer.GetTypeIndicatorsPerFormatCategory(
+              path_spec, format_categories=self._SCAN_NODE_FORMAT_CATEGORIES,
+              resolver_context=self._resolver_context))
+      self._type_indicators_per_path_spec[path_spec] = (
+          type_indicators_per_category)
+
+    return list(type_indicators_per_category[format_category])
 
   # TODO: add functions to check if path spec type is a storage media image
   # type, file system type, etc.
@@ -415,6 +459,34 @@ class SourceScanner(object):
   def _ScanNode(self, scan_context, scan_node, auto_recurse=True):
     """Scans a node for supported formats.
 
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      scan_node (SourceScanNode): source scan node.
+      auto_recurse (Optional[bool]): True if the scan should automatically
+          recurse as far as possible.
+
+    Raises:
+      BackEndError: if the source cannot be scanned.
+      ValueError: if the scan context or scan node is invalid.
+    """
+    # Nested scans, such as of the volumes in a volume system, share the cache
+    # of the outermost scan.
+    if self._type_indicators_per_path_spec is not None:
+      self._ScanNodeWithCachedTypeIndicators(
+          scan_context, scan_node, auto_recurse=auto_recurse)
+      return
+
+    self._type_indicators_per_path_spec = {}
+    try:
+      self._ScanNodeWithCachedTypeIndicators(
+          scan_context, scan_node, auto_recurse=auto_recurse)
+    finally:
+      self._type_indicators_per_path_spec = None
+
+  def _ScanNodeWithCachedTypeIndicators(
+      self, scan_context, scan_node, auto_recurse=True):
+    """Scans a node for supported formats.
+
     Args:
       scan_context (SourceScannerContext): source scanner context.
       scan_node (SourceScanNode): source scan node.
@@ -644,6 +716,11 @@ class SourceScanner(object):
   def Scan(self, scan_context, auto_recurse=True, scan_path_spec=None):
     """Scans for supported formats.
 
+    If the source scanner has a scan result cache, the scan result of a source
+    that has not been scanned is read from the cache when available, and the
+    scan result is written to the cache after the scan of the source. Scans
+    that continue at another scan node do not change the cache.
+
     Args:
       scan_context (SourceScannerContext): source scanner context.
       auto_recurse (Optional[bool]): True if the scan should automatically
@@ -666,8 +743,22 @@ class SourceScanner(object):
     else:
       scan_node = scan_context.GetUnscannedScanNode()
 
-    if scan_node:
-      self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+    if not scan_node:
+      return
+
+    is_source_scan = bool(
+        self._scan_result_cache and not scan_path_spec and
+        scan_node == scan_context.GetRootScanNode())
+
+    if is_source_scan and self._scan_result_cache.ReadScanContext(
+        scan_context, auto_recurse, resolver_context=self._resolver_context):
+      return
+
+    self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+
+    if is_source_scan:
+      self._scan_result_cache.WriteScanContext(
+          scan_context, auto_recurse, resolver_context=self._resolver_context)
 
   def ScanForFileSystem(self, source_path_spec):
     """Scans the path specification for a supported file system format.
@@ -691,10 +782,12 @@ class SourceScanner(object):
           definitions.TYPE_INDICATOR_APFS, location='/',
           parent=source_path_spec)
 
+    # Since the format types of multiple format categories are determined at
+    # once, scanning for another format category can raise an IOError.
     try:
-      type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
-    except RuntimeError as exception:
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM)
+    except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
           '{0!s}').format(exception))
@@ -751,10 +844,12 @@ class SourceScanner(object):
       BackEndError: if the source cannot be scanned or more than one storage
           media image type is found.
     """
+    # Since the format types of multiple format categories are determined at
+    # once, scanning for another format category can raise an IOError.
     try:
-      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
-    except RuntimeError as exception:
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
+    except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
           '{0!s}').format(exception))
@@ -815,8 +910,8 @@ class SourceScanner(object):
       return None
 
     try:
-      type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
     except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""Persistent cache of source scanner results.
+
+Scanning a source for storage media images, volume systems, encrypted volumes
+and file systems can take a considerable amount of time. The source scanner
+cache stores the resulting scan node tree of a source in a directory, so that
+repeated scans of the same source, for example by subsequent runs of a tool or
+by multiple workers that share the cache directory, can skip the scan.
+
+A cached scan result is identified by the source, which consists of the path,
+size, modification time and a digest of the first and last bytes of the
+source. Credentials used to unlock scan nodes are never stored.
+"""
+
+import hashlib
+import json
+import os
+
+from dfvfs.lib import definitions
+from dfvfs.resolver import resolver
+from dfvfs.serializer import json_serializer
+
+
+class SourceScannerCache(object):
+  """Persistent cache of source scanner results."""
+
+  _FORMAT_VERSION = 1
+
+  # Number of bytes at the start and end of the source used to calculate
+  # the digest of the source.
+  _DIGEST_DATA_SIZE = 65536
+
+  def __init__(self, path):
+    """Initializes a source scanner cache.
+
+    Args:
+      path (str): path of the directory that contains the cached scan results.
+    """
+    super(SourceScannerCache, self).__init__()
+    self._path = path
+
+  def _GetCacheFilePath(self, source_key):
+    """Retrieves the path of the file that contains a cached scan result.
+
+    Args:
+      source_key (str): key that identifies the source.
+
+    Returns:
+      str: path of the cache file.
+    """
+    return os.path.join(self._path, '{0:s}.json'.format(source_key))
+
+  def _GetSourceDigest(self, path_spec, resolver_context=None):
+    """Calculates the digest of the first and last bytes of a source.
+
+    Args:
+      path_spec (PathSpec): path specification of the source.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built in context which is not multi process safe.
+
+    Returns:
+      tuple[int, str]: size of the source and hexadecimal SHA-256 digest of
+          the first and last bytes of the source.
+    """
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=resolver_context)
+
+    size = file_object.get_size()
+
+    hash_context = hashlib.sha256()
+    hash_context.update(file_object.read_at(0, self._DIGEST_DATA_SIZE))
+
+    tail_offset = max(size - self._DIGEST_DATA_SIZE, self._DIGEST_DATA_SIZE)
+    if tail_offset < size:
+      hash_context.update(
+          file_object.read_at(tail_offset, size - tail_offset))
+
+    return size, hash_context.hexdigest()
+
+  def _GetSourceKey(self, scan_context, resolver_context=None):
+    """Determines the key that identifies the source of a scan context.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built in context which is not multi process safe.
+
+    Returns:
+      str: key that identifies the source or None if the source cannot be
+          identified.
+    """
+    root_scan_node = scan_context.GetRootScanNode()
+    if not root_scan_node or root_scan_node.type_indicator != (
+        definitions.TYPE_INDICATOR_OS):
+      return None
+
+    location = getattr(root_scan_node.path_spec, 'location', None)
+    if not location:
+      return None
+
+    try:
+      stat_object = os.stat(location)
+      if os.path.isdir(location):
+        size = stat_object.st_size
+        digest = None
+      else:
+        size, digest = self._GetSourceDigest(
+            root_scan_node.path_spec, resolver_context=resolver_context)
+
+    except (IOError, OSError):
+      return None
+
+    source_identity = json.dumps([
+        os.path.abspath(location), size, stat_object.st_mtime_ns, digest])
+    return hashlib.sha256(source_identity.encode('utf-8')).hexdigest()
+
+  def _ReadScanNodes(self, scan_context, serialized_scan_nodes):
+    """Reads serialized scan nodes into a scan context.
+
+    The serialized scan nodes are validated before they are added to the scan
+    context, hence the scan context is not changed if they are invalid.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      serialized_scan_nodes (list[dict[str, object]]): serialized scan nodes,
+          where the first scan node is the root scan node and a parent scan
+          node is stored before its sub scan nodes.
+
+    Returns:
+      bool: True if the scan nodes were read.
+    """
+    root_scan_node = scan_context.GetRootScanNode()
+
+    path_specs = set()
+    scan_node_values = []
+    try:
+      for index, serialized_scan_node in enumerate(serialized_scan_nodes):
+        path_spec = json_serializer.JsonPathSpecSerializer.ReadSerialized(
+            serialized_scan_node['path_spec'])
+        if path_spec in path_specs:
+          return False
+
+        parent_index = serialized_scan_node['parent']
+        if index == 0:
+          if parent_index is not None or path_spec != root_scan_node.path_spec:
+            return False
+
+        elif not isinstance(parent_index, int) or not 0 <= parent_index < index:
+          return False
+
+        path_specs.add(path_spec)
+        scan_node_values.append((
+            path_spec, parent_index, bool(serialized_scan_node['scanned']),
+            bool(serialized_scan_node['locked'])))
+
+    except (KeyError, TypeError, ValueError):
+      return False
+
+    if not scan_node_values:
+      return False
+
+    scan_nodes = []
+    for path_spec, parent_index, scanned, locked in scan_node_values:
+      if parent_index is None:
+        scan_node = root_scan_node
+      else:
+        scan_node = scan_context.AddScanNode(
+            path_spec, scan_nodes[parent_index])
+
+      scan_node.scanned = scanned
+      if locked:
+        scan_context.LockScanNode(path_spec)
+
+      scan_nodes.append(scan_node)
+
+    return True
+
+  def ReadScanContext(self, scan_context, auto_recurse, resolver_context=None):
+    """Reads the cached scan result of the source of a scan context.
+
+    The scan result is only read if the root scan node of the scan context has
+    not been scanned.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      auto_recurse (bool): True if the scan should automatically recurse as
+          far as possible.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built in context which is not multi process safe.
+
+    Returns:
+      bool: True if a cached scan result was read into the scan context.
+    """
+    root_scan_node = scan_context.GetRootScanNode()
+    if not root_scan_node or root_scan_node.scanned or root_scan_node.sub_nodes:
+      return False
+
+    source_key = self._GetSourceKey(
+        scan_context, resolver_context=resolver_context)
+    if not source_key:
+      return False
+
+    cache_file_path = self._GetCacheFilePath(source_key)
+
+    try:
+      with open(cache_file_path, 'r', encoding='utf-8') as file_object:
+        cached_scan_result = json.load(file_object)
+
+    except (IOError, OSError, ValueError):
+      return False
+
+    if not isinstance(cached_scan_result, dict):
+      return False
+
+    if (cached_scan_result.get('version', None) != self._FORMAT_VERSION or
+        cached_scan_result.get('auto_recurse', None) != auto_recurse):
+      return False
+
+    serialized_scan_nodes = cached_scan_result.get('scan_nodes', None)
+    if not isinstance(serialized_scan_nodes, list):
+      return False
+
+    if not self._ReadScanNodes(scan_context, serialized_scan_nodes):
+      return False
+
+    source_type = cached_scan_result.get('source_type', None)
+    if source_type:
+      scan_context.SetSourceType(source_type)
+
+    return True
+
+  def WriteScanContext(self, scan_context, auto_recurse, resolver_context=None):
+    """Writes the scan result of the source of a scan context to the cache.
+
+    The scan result is not written if a scan node was unlocked with
+    a credential, since credentials are not stored in the cache. Since the
+    cache only speeds up scanning, the scan result is also not written if
+    the cache directory is not writable.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      auto_recurse (bool): True if the scan automatically recursed as far as
+          possible.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built in context which is not multi process safe.
+
+    Returns:
+      bool: True if the scan result was written.
+    """
+    root_scan_node = scan_context.GetRootScanNode()
+    if not root_scan_node:
+      return False
+
+    serialized_scan_nodes = []
+    scan_nodes = [(root_scan_node, None)]
+    while scan_nodes:
+      scan_node, parent_index = scan_nodes.pop(0)
+      if scan_node.credential:
+        return False
+
+      index = len(serialized_scan_nodes)
+      serialized_scan_nodes.append({
+          'locked': scan_context.IsLockedScanNode(scan_node.path_spec),
+          'parent': parent_index,
+          'path_spec': json_serializer.JsonPathSpecSerializer.WriteSerialized(
+              scan_node.path_spec),
+          'scanned': scan_node.scanned})
+
+      scan_nodes.extend([
+          (sub_scan_node, index) for sub_scan_node in scan_node.sub_nodes])
+
+    source_key = self._GetSourceKey(
+        scan_context, resolver_context=resolver_context)
+    if not source_key:
+      return False
+
+    cached_scan_result = {
+        'auto_recurse': auto_recurse,
+        'scan_nodes': serialized_scan_nodes,
+        'source_type': scan_context.source_type,
+        'version': self._FORMAT_VERSION}
+
+    # Write to a temporary file first so that other processes that share
+    # the cache directory never read a partially written scan result.
+    cache_file_path = self._GetCacheFilePath(source_key)
+    temporary_file_path = '{0:s}.{1:d}.tmp'.format(
+        cache_file_path, os.getpid())
+
+    try:
+      os.makedirs(self._path, exist_ok=True)
+
+      with open(temporary_file_path, 'w', encoding='utf-8') as file_object:
+        json.dump(cached_scan_result, file_object)
+
+      os.replace(temporary_file_path, cache_file_path)
+
+    except (IOError, OSError):
+      try:
+        os.remove(temporary_file_path)
+      except (IOError, OSError):
+        pass
+
+      return False
+
+    return True
@@ -9,7 +9,12 @@ import os
 
 
 class TextFile(object):
-  """Text file interface for file-like objects."""
+  """Text file interface for file-like objects.
+
+  The text file reads the data of the file-like object into a buffer and
+  scans the buffer for end-of-line indicators. Lines are only decoded when
+  they are returned.
+  """
 
   # The maximum allowed size of the read buffer.
   _MAXIMUM_READ_BUFFER_SIZE = 16 * 1024 * 1024
@@ -26,16 +31,19 @@ class TextFile(object):
       end_of_line (Optional[str]): end of line indicator.
     """
     super(TextFile, self).__init__()
+    self._buffer = b''
+    self._buffer_offset = 0
+    self._buffer_view = memoryview(self._buffer)
+    self._current_offset = 0
     self._file_object = file_object
+    self._file_object_offset = 0
     self._file_object_size = file_object.get_size()
     self._encoding = encoding
     self._encoding_errors = encoding_errors
     self._end_of_line = end_of_line.encode(self._encoding)
     self._end_of_line_length = len(self._end_of_line)
-    self._lines = []
-    self._lines_buffer = b''
-    self._lines_buffer_offset = 0
-    self._current_offset = 0
+    self._decoded_end_of_line = self._end_of_line.decode(
+        self._encoding, self._encoding_errors)
 
   def __enter__(self):
     """Enters a with statement."""
@@ -53,10 +61,149 @@ class TextFile(object):
     Yields:
       str: line of text.
     """
-    line = self.readline()
-    while line:
-      yield line
-      line = self.readline()
+    for lines in self.iter_lines():
+      for line in lines:
+        yield line
+
+  def _DecodeLine(self, line_offset, line_data):
+    """Decodes a line.
+
+    Args:
+      line_offset (int): offset of the line in the file-like object.
+      line_data (bytes|memoryview): encoded line.
+
+    Returns:
+      str: line of text.
+
+    Raises:
+      UnicodeDecodeError: if the line cannot be decoded and encoding errors is
+          set to strict.
+    """
+    decoded_line = str(line_data, self._encoding, self._encoding_errors)
+
+    # Remove a byte-order mark at the start of the file.
+    if line_offset == 0 and decoded_line[:1] == '\ufeff':
+      decoded_line = decoded_line[1:]
+
+    return decoded_line
+
+  def _ReadBuffer(self):
+    """Reads data from the file-like object into the buffer.
+
+    The data in the buffer that has not been read yet, such as a partial line,
+    is kept at the start of the buffer.
+
+    Returns:
+      bool: True if data was read, False if the end of the file-like object
+          was reached.
+    """
+    if self._file_object_offset >= self._file_object_size:
+      return False
+
+    read_size = min(
+        self._MAXIMUM_READ_BUFFER_SIZE,
+        self._file_object_size - self._file_object_offset)
+
+    self._file_object.seek(self._file_object_offset, os.SEEK_SET)
+    read_buffer = self._file_object.read(read_size)
+    if not read_buffer:
+      return False
+
+    self._file_object_offset += len(read_buffer)
+
+    if self._buffer_offset < len(self._buffer):
+      read_buffer = b''.join([self._buffer[self._buffer_offset:], read_buffer])
+
+    self._buffer = read_buffer
+    self._buffer_offset = 0
+    self._buffer_view = memoryview(self._buffer)
+
+    return True
+
+  def iter_lines(self, batch_size=1024):
+    """Iterates over the lines of text in batches.
+
+    All the complete lines in the buffer are split at once and decoded per
+    batch, which is faster than reading the lines one by one.
+
+    Args:
+      batch_size (Optional[int]): maximum number of lines per batch.
+
+    Yields:
+      list[str]: lines of text.
+
+    Raises:
+      UnicodeDecodeError: if a line cannot be decoded and encoding errors is
+          set to strict.
+      ValueError: if the batch size is zero or less.
+    """
+    if batch_size <= 0:
+      raise ValueError('Invalid batch size value zero or less.')
+
+    batch = []
+    while True:
+      if self._buffer_offset >= len(self._buffer) and not self._ReadBuffer():
+        break
+
+      buffer = self._buffer
+      buffer_offset = self._buffer_offset
+
+      lines_end_offset = buffer.rfind(self._end_of_line, buffer_offset)
+      if lines_end_offset == -1:
+        # The buffer contains a partial line, which is read by readline that
+        # reads more data until the end of the line.
+        line = self.readline()
+        if not line:
+          break
+
+        batch.append(line)
+        if len(batch) >= batch_size:
+          yield batch
+          batch = []
+        continue
+
+      lines_end_offset += self._end_of_line_length
+
+      lines = buffer[buffer_offset:lines_end_offset].split(self._end_of_line)
+      del lines[-1]
+
+      lines_index = 0
+      number_of_lines = len(lines)
+      while lines_index < number_of_lines:
+        next_lines_index = min(
+            lines_index + batch_size - len(batch), number_of_lines)
+
+        batch_index = len(batch)
+        lines_size = 0
+        for line in lines[lines_index:next_lines_index]:
+          batch.append(str(
+              line, self._encoding, self._encoding_errors) + (
+                  self._decoded_end_of_line))
+          lines_size += len(line)
+
+        # Remove a byte-order mark at the start of the file.
+        if self._current_offset == 0 and batch[batch_index][:1] == '\ufeff':
+          batch[batch_index] = batch[batch_index][1:]
+
+        lines_size += (
+            next_lines_index - lines_index) * self._end_of_line_length
+        lines_index = next_lines_index
+
+        buffer_offset += lines_size
+        self._buffer_offset = buffer_offset
+        self._current_offset += lines_size
+
+        if len(batch) >= batch_size:
+          yield batch
+          batch = []
+
+          # Split the buffer again if it was changed, for example by readline,
+          # while the batch was processed by the caller.
+          if self._buffer is not buffer or self._buffer_offset != buffer_offset:
+            break
+
+    if batch:
+      yield batch
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the readline file-like object interface.
@@ -90,59 +237,41 @@ class TextFile(object):
     if size is not None and size > self._MAXIMUM_READ_BUFFER_SIZE:
       raise ValueError('Invalid size value exceeds maximum.')
 
-    if not self._lines:
-      if self._lines_buffer_offset >= self._file_object_size:
-        return ''
+    search_offset = self._buffer_offset
+    while True:
+      buffer_size = len(self._buffer)
 
-      read_size = size
-      if not read_size:
-        read_size = self._MAXIMUM_READ_BUFFER_SIZE
+      end_of_line_offset = self._buffer.find(self._end_of_line, search_offset)
+      if end_of_line_offset != -1:
+        line_end_offset = end_of_line_offset + self._end_of_line_length
+        break
 
-      if self._lines_buffer_offset + read_size > self._file_object_size:
-        read_size = self._file_object_size - self._lines_buffer_offset
+      if size and buffer_size - self._buffer_offset >= size:
+        line_end_offset = buffer_size
+        break
 
-      self._file_object.seek(self._lines_buffer_offset, os.SEEK_SET)
-      read_buffer = self._file_object.read(read_size)
+      # Continue the search where a partial end-of-line indicator can start.
+      search_offset = max(
+          buffer_size - self._end_of_line_length + 1, self._buffer_offset)
+      search_offset -= self._buffer_offset
 
-      self._lines_buffer_offset += len(read_buffer)
+      if not self._ReadBuffer():
+        line_end_offset = len(self._buffer)
+        break
 
-      self._lines = read_buffer.split(self._end_of_line)
-      if self._lines_buffer:
-        self._lines[0] = b''.join([self._lines_buffer, self._lines[0]])
-        self._lines_buffer = b''
+    if size:
+      line_end_offset = min(line_end_offset, self._buffer_offset + size)
 
-      # Move a partial line from the lines list to the lines buffer.
-      if read_buffer[self._end_of_line_length:] != self._end_of_line:
-        self._lines_buffer = self._lines.pop()
+    line_size = line_end_offset - self._buffer_offset
+    if line_size <= 0:
+      return ''
 
-      for index, line in enumerate(self._lines):
-        self._lines[index] = b''.join([line, self._end_of_line])
+    decoded_line = self._DecodeLine(
+        self._current_offset,
+        self._buffer_view[self._buffer_offset:line_end_offset])
 
-      if (self._lines_buffer and
-          self._lines_buffer_offset >= self._file_object_size):
-        self._lines.append(self._lines_buffer)
-        self._lines_buffer = b''
-
-    if not self._lines:
-      line = self._lines_buffer
-      self._lines_buffer = b''
-
-    elif not size or size >= len(self._lines[0]):
-      line = self._lines.pop(0)
-
-    else:
-      line = self._lines[0]
-      self._lines[0] = line[size:]
-      line = line[:size]
-
-    last_offset = self._current_offset
-    self._current_offset += len(line)
-
-    decoded_line = line.decode(self._encoding, self._encoding_errors)
-
-    # Remove a byte-order mark at the start of the file.
-    if last_offset == 0 and decoded_line[0] == '\ufeff':
-      decoded_line = decoded_line[1:]
+    self._buffer_offset = line_end_offset
+    self._current_offset += line_size
 
     return decoded_line
 
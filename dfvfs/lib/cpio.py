@@ -347,5 +347,4 @@ class CPIOArchiveFile(data_format.DataFormat):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    self._file_object.seek(file_offset, os.SEEK_SET)
-    return self._file_object.read(size)
+    return self._file_object.read_at(file_offset, size)
@@ -2,6 +2,10 @@
 """The Virtual File System (VFS) definitions."""
 
 
+# The cache eviction policy definitions.
+CACHE_EVICTION_POLICY_LFU = 'lfu'
+CACHE_EVICTION_POLICY_LRU = 'lru'
+
 # The compression method definitions.
 COMPRESSION_METHOD_BZIP2 = 'bzip2'
 COMPRESSION_METHOD_DEFLATE = 'deflate'
@@ -5,7 +5,10 @@
 # AttributeError: 'module' object has no attribute 'GzipFile'
 # when using pip.
 
+import bisect
 import collections
+import hashlib
+import json
 import os
 
 from dtfabric.runtime import fabric as dtfabric_fabric
@@ -26,7 +29,7 @@ class _GzipDecompressorState(object):
         member last emitted by the state object.
   """
 
-  _MAXIMUM_READ_SIZE = 16 * 1024 * 1024
+  _MAXIMUM_READ_SIZE = 1 * 1024 * 1024
 
   def __init__(self, stream_start):
     """Initializes a gzip member decompressor wrapper.
@@ -40,6 +43,18 @@ class _GzipDecompressorState(object):
     self._last_read = stream_start
     self.uncompressed_offset = 0
 
+  def Copy(self):
+    """Copies the decompressor state.
+
+    Returns:
+      _GzipDecompressorState: copy of the decompressor state.
+    """
+    decompressor_state = _GzipDecompressorState(self._last_read)
+    decompressor_state._compressed_data = self._compressed_data
+    decompressor_state._decompressor = self._decompressor.Copy()
+    decompressor_state.uncompressed_offset = self.uncompressed_offset
+    return decompressor_state
+
   def Read(self, file_object):
     """Reads the next uncompressed data from the gzip stream.
 
@@ -75,15 +90,452 @@ class _GzipDecompressorState(object):
     return self._decompressor.unused_data
 
 
+class GzipMemberIndex(object):
+  """Gzip member index.
+
+  The member index contains the values needed to access a gzip member without
+  having to read all its data first, and access points to resume decompression
+  from inside the member.
+
+  Attributes:
+    comment (str): comment stored in the member.
+    compressed_data_offset (int): offset to the start of the compressed data
+        of the member in the parent file object.
+    member_end_offset (int): offset to the end of the member in the parent
+        file object.
+    member_start_offset (int): offset to the start of the member in the parent
+        file object.
+    modification_time (int): modification time stored in the member.
+    operating_system (int): type of file system on which the compression
+        took place.
+    original_filename (str): original filename of the uncompressed file.
+    uncompressed_data_offset (int): offset of the start of the uncompressed
+        data in this member relative to the whole gzip file's uncompressed data.
+    uncompressed_data_size (int): total size of the data in this gzip member
+        after decompression.
+  """
+
+  _SERIALIZED_ATTRIBUTES = (
+      'comment', 'compressed_data_offset', 'member_end_offset',
+      'member_start_offset', 'modification_time', 'operating_system',
+      'original_filename', 'uncompressed_data_offset', 'uncompressed_data_size')
+
+  def __init__(self):
+    """Initializes a gzip member index."""
+    super(GzipMemberIndex, self).__init__()
+    self._access_points = []
+    self._access_point_offsets = []
+    self.comment = None
+    self.compressed_data_offset = None
+    self.member_end_offset = None
+    self.member_start_offset = None
+    self.modification_time = None
+    self.operating_system = None
+    self.original_filename = None
+    self.uncompressed_data_offset = None
+    self.uncompressed_data_size = None
+
+  @property
+  def number_of_access_points(self):
+    """int: number of access points."""
+    return len(self._access_points)
+
+  def AddAccessPoint(self, decompressor_state):
+    """Adds an access point.
+
+    Access points must be added in order of increasing uncompressed offset.
+
+    Args:
+      decompressor_state (_GzipDecompressorState): decompressor state at
+          the access point, which should not be used after it was added.
+    """
+    self._access_points.append(decompressor_state)
+    self._access_point_offsets.append(decompressor_state.uncompressed_offset)
+
+  def CopyFromDict(self, json_dict):
+    """Copies the member index values from a JSON dictionary.
+
+    Args:
+      json_dict (dict[str, object]): JSON dictionary with the member index
+          values.
+
+    Raises:
+      KeyError: if a member index value is missing.
+    """
+    for attribute_name in self._SERIALIZED_ATTRIBUTES:
+      setattr(self, attribute_name, json_dict[attribute_name])
+
+  def CopyToDict(self):
+    """Copies the member index values to a JSON dictionary.
+
+    Note that access points are not copied since the decompressor state cannot
+    be serialized.
+
+    Returns:
+      dict[str, object]: JSON dictionary with the member index values.
+    """
+    return {
+        attribute_name: getattr(self, attribute_name)
+        for attribute_name in self._SERIALIZED_ATTRIBUTES}
+
+  def GetAccessPoint(self, uncompressed_offset):
+    """Retrieves the access point nearest before an uncompressed offset.
+
+    Args:
+      uncompressed_offset (int): offset into the uncompressed data of
+          the member.
+
+    Returns:
+      _GzipDecompressorState: copy of the decompressor state at the access
+          point or None if not available.
+    """
+    access_point_index = bisect.bisect_right(
+        self._access_point_offsets, uncompressed_offset)
+    if access_point_index == 0:
+      return None
+
+    return self._access_points[access_point_index - 1].Copy()
+
+  def GetAccessPointOffset(self, uncompressed_offset):
+    """Retrieves the offset of the access point nearest before an offset.
+
+    Args:
+      uncompressed_offset (int): offset into the uncompressed data of
+          the member.
+
+    Returns:
+      int: offset into the uncompressed data of the member of the access
+          point or 0 if not available.
+    """
+    access_point_index = bisect.bisect_right(
+        self._access_point_offsets, uncompressed_offset)
+    if access_point_index == 0:
+      return 0
+
+    return self._access_point_offsets[access_point_index - 1]
+
+  def GetLastAccessPointOffset(self):
+    """Retrieves the uncompressed offset of the last access point.
+
+    Returns:
+      int: offset into the uncompressed data of the member of the last access
+          point or 0 if there are no access points.
+    """
+    if not self._access_point_offsets:
+      return 0
+
+    return self._access_point_offsets[-1]
+
+
+class GzipIndex(object):
+  """Gzip index.
+
+  The gzip index contains the member indexes of a gzip file. It can be used
+  to open the gzip file again, for example in another resolver context or
+  process, without having to read all the members first.
+
+  Attributes:
+    compressed_data_size (int): size of the gzip file the index was built for.
+    digest (str): hexadecimal SHA-256 digest of the first and last bytes of
+        the gzip file the index was built for or None if not available.
+    members (list[GzipMemberIndex]): member indexes.
+  """
+
+  # Number of bytes at the start and end of the gzip file used to calculate
+  # the digest.
+  _DIGEST_DATA_SIZE = 65536
+
+  _FORMAT_VERSION = 1
+
+  _MEMBER_SIGNATURE = b'\x1f\x8b\x08'
+
+  def __init__(self, compressed_data_size, digest=None):
+    """Initializes a gzip index.
+
+    Args:
+      compressed_data_size (int): size of the gzip file the index was built
+          for.
+      digest (Optional[str]): hexadecimal SHA-256 digest of the first and
+          last bytes of the gzip file the index was built for.
+    """
+    super(GzipIndex, self).__init__()
+    self.compressed_data_size = compressed_data_size
+    self.digest = digest
+    self.members = []
+
+  @classmethod
+  def CalculateDigest(cls, file_object):
+    """Calculates the digest of the first and last bytes of a gzip file.
+
+    Args:
+      file_object (FileIO): file-like object that contains the gzip file.
+
+    Returns:
+      str: hexadecimal SHA-256 digest.
+    """
+    file_size = file_object.get_size()
+
+    hash_context = hashlib.sha256()
+    hash_context.update(file_object.read_at(0, cls._DIGEST_DATA_SIZE))
+
+    tail_offset = max(file_size - cls._DIGEST_DATA_SIZE, cls._DIGEST_DATA_SIZE)
+    if tail_offset < file_size:
+      hash_context.update(
+          file_object.read_at(tail_offset, file_size - tail_offset))
+
+    return hash_context.hexdigest()
+
+  @classmethod
+  def ReadSerialized(cls, json_string):
+    """Reads a gzip index from serialized form.
+
+    Args:
+      json_string (str): JSON serialized gzip index.
+
+    Returns:
+      GzipIndex: gzip index.
+
+    Raises:
+      ValueError: if the gzip index cannot be read.
+    """
+    try:
+      json_dict = json.loads(json_string)
+
+      format_version = json_dict.get('format_version', None)
+      if format_version != cls._FORMAT_VERSION:
+        raise ValueError('Unsupported format version: {0!s}.'.format(
+            format_version))
+
+      gzip_index = cls(
+          json_dict['compressed_data_size'],
+          digest=json_dict.get('digest', None))
+      for member_json_dict in json_dict['members']:
+        member_index = GzipMemberIndex()
+        member_index.CopyFromDict(member_json_dict)
+        gzip_index.members.append(member_index)
+
+    except (AttributeError, KeyError, TypeError, ValueError) as exception:
+      raise ValueError('Unable to read gzip index with error: {0!s}'.format(
+          exception))
+
+    return gzip_index
+
+  def MatchesFileObject(self, file_object):
+    """Determines if the gzip index matches a gzip file.
+
+    The gzip index matches if the size of the gzip file, the digest of its
+    first and last bytes and the member signatures at the offsets of
+    the member indexes match, and the member indexes span the entire gzip
+    file.
+
+    Args:
+      file_object (FileIO): file-like object that contains the gzip file.
+
+    Returns:
+      bool: True if the gzip index matches the gzip file.
+    """
+    if self.compressed_data_size != file_object.get_size():
+      return False
+
+    if self.digest is not None and self.digest != self.CalculateDigest(
+        file_object):
+      return False
+
+    member_offset = 0
+    signature_size = len(self._MEMBER_SIGNATURE)
+    for member_index in self.members:
+      if member_index.member_start_offset != member_offset:
+        return False
+
+      member_offset = member_index.member_end_offset
+
+      signature = file_object.read_at(
+          member_index.member_start_offset, signature_size)
+      if signature != self._MEMBER_SIGNATURE:
+        return False
+
+    return member_offset == self.compressed_data_size
+
+  def WriteSerialized(self):
+    """Writes the gzip index to serialized form.
+
+    Returns:
+      str: JSON serialized gzip index.
+    """
+    json_dict = {
+        'compressed_data_size': self.compressed_data_size,
+        'format_version': self._FORMAT_VERSION,
+        'members': [member.CopyToDict() for member in self.members]}
+
+    if self.digest is not None:
+      json_dict['digest'] = self.digest
+
+    return json.dumps(json_dict)
+
+
+class GzipIndexStore(object):
+  """Store of gzip indexes.
+
+  The store keeps the most recently used gzip indexes, including their access
+  points, keyed by the path specification of the gzip file. If a path is
+  specified the gzip indexes are also stored as files in that directory, so
+  that they can be reused by other processes.
+  """
+
+  def __init__(self, maximum_number_of_indexes=8, path=None):
+    """Initializes a gzip index store.
+
+    Args:
+      maximum_number_of_indexes (Optional[int]): maximum number of gzip
+          indexes kept in memory.
+      path (Optional[str]): path of the directory that contains the stored
+          gzip indexes, where None represents that gzip indexes are only kept
+          in memory.
+
+    Raises:
+      ValueError: when the maximum number of gzip indexes is 0 or less.
+    """
+    if maximum_number_of_indexes <= 0:
+      raise ValueError(
+          'Invalid maximum number of gzip indexes value zero or less.')
+
+    super(GzipIndexStore, self).__init__()
+    self._indexes = collections.OrderedDict()
+    self._maximum_number_of_indexes = maximum_number_of_indexes
+    self._path = path
+
+  def _AddIndex(self, identifier, gzip_index):
+    """Adds a gzip index to the most recently used gzip indexes.
+
+    Args:
+      identifier (str): identifier of the gzip file.
+      gzip_index (GzipIndex): gzip index.
+    """
+    self._indexes[identifier] = gzip_index
+    self._indexes.move_to_end(identifier)
+
+    while len(self._indexes) > self._maximum_number_of_indexes:
+      self._indexes.popitem(last=False)
+
+  def _GetIndexFilePath(self, identifier):
+    """Retrieves the path of the file that contains a stored gzip index.
+
+    Args:
+      identifier (str): identifier of the gzip file.
+
+    Returns:
+      str: path of the gzip index file.
+    """
+    index_key = hashlib.sha256(identifier.encode('utf-8')).hexdigest()
+    return os.path.join(self._path, '{0:s}.json'.format(index_key))
+
+  def _ReadIndexFile(self, identifier):
+    """Reads a stored gzip index.
+
+    Args:
+      identifier (str): identifier of the gzip file.
+
+    Returns:
+      GzipIndex: gzip index or None if not available.
+    """
+    index_file_path = self._GetIndexFilePath(identifier)
+
+    try:
+      with open(index_file_path, 'r', encoding='utf-8') as file_object:
+        json_string = file_object.read()
+
+      return GzipIndex.ReadSerialized(json_string)
+
+    except (IOError, OSError, ValueError):
+      return None
+
+  def _WriteIndexFile(self, identifier, gzip_index):
+    """Writes a gzip index to a file.
+
+    Since storing the gzip index only speeds up opening the gzip file again,
+    the gzip index is not written if the directory is not writable.
+
+    Args:
+      identifier (str): identifier of the gzip file.
+      gzip_index (GzipIndex): gzip index.
+    """
+    # Write to a temporary file first so that other processes that share
+    # the directory never read a partially written gzip index.
+    index_file_path = self._GetIndexFilePath(identifier)
+    temporary_file_path = '{0:s}.{1:d}.tmp'.format(
+        index_file_path, os.getpid())
+
+    try:
+      os.makedirs(self._path, exist_ok=True)
+
+      with open(temporary_file_path, 'w', encoding='utf-8') as file_object:
+        file_object.write(gzip_index.WriteSerialized())
+
+      os.replace(temporary_file_path, index_file_path)
+
+    except (IOError, OSError):
+      try:
+        os.remove(temporary_file_path)
+      except (IOError, OSError):
+        pass
+
+  def Empty(self):
+    """Empties the in-memory gzip indexes of the store."""
+    self._indexes = collections.OrderedDict()
+
+  def GetIndex(self, path_spec):
+    """Retrieves the gzip index of a path specification.
+
+    Note that a gzip index read from the directory can be stale, for example
+    if the gzip file was changed, hence it should be matched against the gzip
+    file before it is used.
+
+    Args:
+      path_spec (PathSpec): path specification of the gzip file.
+
+    Returns:
+      GzipIndex: gzip index or None if not available.
+    """
+    identifier = path_spec.comparable
+
+    gzip_index = self._indexes.get(identifier, None)
+    if gzip_index:
+      self._indexes.move_to_end(identifier)
+
+    elif self._path:
+      gzip_index = self._ReadIndexFile(identifier)
+      if gzip_index:
+        self._AddIndex(identifier, gzip_index)
+
+    return gzip_index
+
+  def SetIndex(self, path_spec, gzip_index):
+    """Sets the gzip index of a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the gzip file.
+      gzip_index (GzipIndex): gzip index.
+    """
+    identifier = path_spec.comparable
+
+    self._AddIndex(identifier, gzip_index)
+
+    if self._path:
+      self._WriteIndexFile(identifier, gzip_index)
+
+
 class GzipMember(data_format.DataFormat):
   """Gzip member.
 
   Gzip files have no index of members, so each member must be read
   sequentially before metadata and random seeks are possible. This class
-  provides caching of gzip member data during the initial read of each member.
+  provides caching of gzip member data during the initial read of each member
+  and stores access points, approximately every _ACCESS_POINT_INTERVAL bytes
+  of uncompressed data, from which decompression can be resumed.
 
   Attributes:
     comment (str): comment stored in the member.
+    index (GzipMemberIndex): member index.
     member_end_offset (int): offset to the end of the member in the parent file
         object.
     member_start_offset (int): offset to the start of the member in the parent
@@ -132,11 +584,15 @@ class GzipMember(data_format.DataFormat):
   _FLAG_FNAME = 0x08
   _FLAG_FCOMMENT = 0x10
 
+  # The minimum number of bytes of uncompressed data between access points.
+  _ACCESS_POINT_INTERVAL = 32 * 1024 * 1024
+
   # The maximum size of the uncompressed data cache.
   _UNCOMPRESSED_DATA_CACHE_SIZE = 2 * 1024 * 1024
 
   def __init__(
-      self, file_object, member_start_offset, uncompressed_data_offset):
+      self, file_object, member_start_offset, uncompressed_data_offset,
+      member_index=None):
     """Initializes a gzip member.
 
     Args:
@@ -146,6 +602,8 @@ class GzipMember(data_format.DataFormat):
       uncompressed_data_offset (int): offset of the start of the uncompressed
           data in this member relative to the whole gzip file's uncompressed
           data.
+      member_index (Optional[GzipMemberIndex]): member index, where None
+          represents the member index should be built by reading the member.
     """
     self._cache = b''
     # End offset of the cached uncompressed data of the member.
@@ -154,10 +612,30 @@ class GzipMember(data_format.DataFormat):
     self._cache_start_offset = None
 
     self.comment = None
+    self.index = member_index
     self.modification_time = None
     self.operating_system = None
     self.original_filename = None
 
+    if member_index:
+      self._file_object = file_object
+
+      self._compressed_data_start = member_index.compressed_data_offset
+      self._decompressor_state = _GzipDecompressorState(
+          member_index.compressed_data_offset)
+
+      self.comment = member_index.comment
+      self.member_end_offset = member_index.member_end_offset
+      self.member_start_offset = member_start_offset
+      self.modification_time = member_index.modification_time
+      self.operating_system = member_index.operating_system
+      self.original_filename = member_index.original_filename
+      self.uncompressed_data_offset = uncompressed_data_offset
+      self.uncompressed_data_size = member_index.uncompressed_data_size
+      return
+
+    self.index = GzipMemberIndex()
+
     file_size = file_object.get_size()
 
     file_object.seek(member_start_offset, os.SEEK_SET)
@@ -175,6 +653,8 @@ class GzipMember(data_format.DataFormat):
     while file_offset < file_size:
       data_offset += uncompressed_data_size
 
+      self._AddAccessPoint(decompressor_state)
+
       decompressed_data = decompressor_state.Read(file_object)
       uncompressed_data_size += len(decompressed_data)
 
@@ -225,6 +705,27 @@ class GzipMember(data_format.DataFormat):
     # the whole gzip file's uncompressed data.
     self.uncompressed_data_offset = uncompressed_data_offset
 
+    self.index.comment = self.comment
+    self.index.compressed_data_offset = compressed_data_offset
+    self.index.member_end_offset = member_end_offset
+    self.index.member_start_offset = member_start_offset
+    self.index.modification_time = self.modification_time
+    self.index.operating_system = self.operating_system
+    self.index.original_filename = self.original_filename
+    self.index.uncompressed_data_offset = uncompressed_data_offset
+    self.index.uncompressed_data_size = uncompressed_data_size
+
+  def _AddAccessPoint(self, decompressor_state):
+    """Adds an access point to the member index if needed.
+
+    Args:
+      decompressor_state (_GzipDecompressorState): decompressor state.
+    """
+    last_access_point_offset = self.index.GetLastAccessPointOffset()
+    if decompressor_state.uncompressed_offset >= (
+        last_access_point_offset + self._ACCESS_POINT_INTERVAL):
+      self.index.AddAccessPoint(decompressor_state.Copy())
+
   def _GetCacheSize(self):
     """Determines the size of the uncompressed cached data.
 
@@ -258,12 +759,17 @@ class GzipMember(data_format.DataFormat):
     # Decompression can only be performed from beginning to end of the stream.
     # So, if data before the current position of the decompressor in the stream
     # is required, it's necessary to throw away the current decompression
-    # state and start again.
-    if minimum_offset < self._decompressor_state.uncompressed_offset:
-      self._ResetDecompressorState()
+    # state and resume from the nearest access point or start again. The same
+    # applies if an access point is nearer than the current position.
+    access_point_offset = self.index.GetAccessPointOffset(minimum_offset)
+    if (minimum_offset < self._decompressor_state.uncompressed_offset or
+        self._decompressor_state.uncompressed_offset < access_point_offset):
+      self._ResetDecompressorState(uncompressed_offset=minimum_offset)
 
     cache_is_full = self._IsCacheFull()
     while not cache_is_full:
+      self._AddAccessPoint(self._decompressor_state)
+
       decompressed_data = self._decompressor_state.Read(file_object)
       # Note that decompressed_data will be empty if there is no data left
       # to read and decompress.
@@ -358,10 +864,22 @@ class GzipMember(data_format.DataFormat):
     if member_header.flags & self._FLAG_FHCRC:
       file_object.read(2)
 
-  def _ResetDecompressorState(self):
-    """Resets the state of the internal decompression object."""
-    self._decompressor_state = _GzipDecompressorState(
-        self._compressed_data_start)
+  def _ResetDecompressorState(self, uncompressed_offset=0):
+    """Resets the state of the internal decompression object.
+
+    Args:
+      uncompressed_offset (Optional[int]): offset into the uncompressed data
+          of the member, where the decompressor state is reset to the nearest
+          access point before the offset.
+    """
+    decompressor_state = None
+    if uncompressed_offset > 0:
+      decompressor_state = self.index.GetAccessPoint(uncompressed_offset)
+
+    if not decompressor_state:
+      decompressor_state = _GzipDecompressorState(self._compressed_data_start)
+
+    self._decompressor_state = decompressor_state
 
   def FlushCache(self):
     """Empties the cache that holds cached decompressed data."""
@@ -402,7 +920,7 @@ class GzipMember(data_format.DataFormat):
     if self._cache_start_offset is None:
       self._LoadDataIntoCache(self._file_object, offset)
 
-    if offset > self._cache_end_offset or offset < self._cache_start_offset:
+    if offset >= self._cache_end_offset or offset < self._cache_start_offset:
       self.FlushCache()
       self._LoadDataIntoCache(self._file_object, offset)
 
@@ -434,10 +952,16 @@ class GzipCompressedStream(object):
     self._compressed_data_size = -1
     self._current_offset = 0
     self._file_object = None
+    self._index = None
     self._members_by_end_offset = collections.OrderedDict()
 
     self.uncompressed_data_size = 0
 
+  @property
+  def index(self):
+    """GzipIndex: gzip index."""
+    return self._index
+
   @property
   def members(self):
     """list(GzipMember): members in the gzip file."""
@@ -467,12 +991,14 @@ class GzipCompressedStream(object):
 
     return None
 
-  def Open(self, file_object):
+  def Open(self, file_object, gzip_index=None):
     """Opens the file-like object defined by path specification.
 
     Args:
       file_object (FileIO): file-like object that contains the gzip compressed
           stream.
+      gzip_index (Optional[GzipIndex]): gzip index, where None represents
+          the gzip index should be built by reading all the members.
 
     Raises:
       IOError: if the file-like object could not be opened.
@@ -480,21 +1006,46 @@ class GzipCompressedStream(object):
     """
     file_size = file_object.get_size()
 
+    if gzip_index and gzip_index.compressed_data_size != file_size:
+      raise IOError((
+          'Gzip index compressed data size: {0:d} does not match file '
+          'size: {1:d}.').format(gzip_index.compressed_data_size, file_size))
+
+    if gzip_index and not gzip_index.MatchesFileObject(file_object):
+      raise IOError('Gzip index does not match file.')
+
     file_object.seek(0, os.SEEK_SET)
 
     uncompressed_data_offset = 0
-    next_member_offset = 0
 
-    while next_member_offset < file_size:
-      member = GzipMember(
-          file_object, next_member_offset, uncompressed_data_offset)
-      uncompressed_data_offset = (
-          uncompressed_data_offset + member.uncompressed_data_size)
-      self._members_by_end_offset[uncompressed_data_offset] = member
-      self.uncompressed_data_size += member.uncompressed_data_size
-      next_member_offset = member.member_end_offset
+    if gzip_index:
+      for member_index in gzip_index.members:
+        member = GzipMember(
+            file_object, member_index.member_start_offset,
+            uncompressed_data_offset, member_index=member_index)
+        uncompressed_data_offset = (
+            uncompressed_data_offset + member.uncompressed_data_size)
+        self._members_by_end_offset[uncompressed_data_offset] = member
+        self.uncompressed_data_size += member.uncompressed_data_size
+
+    else:
+      gzip_index = GzipIndex(
+          file_size, digest=GzipIndex.CalculateDigest(file_object))
+      next_member_offset = 0
+
+      while next_member_offset < file_size:
+        member = GzipMember(
+            file_object, next_member_offset, uncompressed_data_offset)
+        uncompressed_data_offset = (
+            uncompressed_data_offset + member.uncompressed_data_size)
+        self._members_by_end_offset[uncompressed_data_offset] = member
+        self.uncompressed_data_size += member.uncompressed_data_size
+        next_member_offset = member.member_end_offset
+
+        gzip_index.members.append(member.index)
 
     self._file_object = file_object
+    self._index = gzip_index
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -502,6 +1053,7 @@ class GzipCompressedStream(object):
 
   def close(self):
     """Closes the file-like object."""
+    self._index = None
     self._members_by_end_offset = []
     if self._file_object:
       self._file_object = None
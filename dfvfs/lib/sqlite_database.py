@@ -4,13 +4,21 @@
 import os
 import sqlite3
 import tempfile
+import threading
 
 
 class SQLiteDatabaseFile(object):
-  """SQLite database file using a file-like object."""
+  """SQLite database file using a file-like object.
+
+  The database file can be shared, for example by the SQLite blob file-like
+  objects of the same database, since queries are serialized.
+  """
 
   _COPY_BUFFER_SIZE = 65536
 
+  # Incremental blob I/O requires Python 3.11 or later.
+  _HAS_BLOBOPEN = hasattr(sqlite3.Connection, 'blobopen')
+
   _HAS_COLUMN_QUERY = 'PRAGMA table_info("{0:s}")'
 
   _HAS_TABLE_QUERY = (
@@ -20,15 +28,68 @@ class SQLiteDatabaseFile(object):
 
   _NUMBER_OF_ROWS_QUERY = 'SELECT COUNT(*) FROM {0:s}'
 
+  _READ_BLOB_QUERY = 'SELECT substr({0:s}, ?, ?) FROM {1:s} WHERE {2:s} = ?'
+
+  # Names that refer to the row identifier, unless a table declares a column
+  # with the same name.
+  _ROW_IDENTIFIER_NAMES = ('rowid', '_rowid_', 'oid')
+
   def __init__(self):
     """Initializes the database file object."""
     super(SQLiteDatabaseFile, self).__init__()
     self._column_names_per_table = {}
     self._connection = None
     self._cursor = None
+    self._is_in_memory = False
+    self._lock = threading.RLock()
     self._table_names = None
     self._temp_file_path = ''
 
+  def __del__(self):
+    """Cleans up the database file object."""
+    # In case __init__ fails the instance attributes might not exist hence
+    # that getattr is used here.
+    if getattr(self, '_connection', None) or getattr(
+        self, '_temp_file_path', None):
+      self.Close()
+
+  @property
+  def is_in_memory(self):
+    """bool: True if the database was loaded in memory."""
+    return self._is_in_memory
+
+  def _OpenInMemory(self, data):
+    """Opens the database from data in memory.
+
+    Args:
+      data (bytes): data of the database.
+
+    Returns:
+      sqlite3.Connection: connection to the database.
+    """
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.deserialize(data)
+    return connection
+
+  def _OpenTemporaryFile(self, file_object, data):
+    """Opens the database from a temporary copy.
+
+    Args:
+      file_object (FileIO): file-like object.
+      data (bytes): data of the database that has already been read from
+          the file-like object.
+
+    Returns:
+      sqlite3.Connection: connection to the database.
+    """
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+      self._temp_file_path = temp_file.name
+      while data:
+        temp_file.write(data)
+        data = file_object.read(self._COPY_BUFFER_SIZE)
+
+    return sqlite3.connect(self._temp_file_path, check_same_thread=False)
+
   def Close(self):
     """Closes the database file object.
 
@@ -36,10 +97,13 @@ class SQLiteDatabaseFile(object):
       IOError: if the close failed.
       OSError: if the close failed.
     """
-    if self._connection:
-      self._cursor = None
-      self._connection.close()
-      self._connection = None
+    with self._lock:
+      if self._connection:
+        self._cursor = None
+        self._connection.close()
+        self._connection = None
+
+    self._is_in_memory = False
 
     # TODO: move this to a central temp file manager and have it track errors.
     # https://github.com/log2timeline/dfvfs/issues/92
@@ -66,8 +130,10 @@ class SQLiteDatabaseFile(object):
     if not self._connection:
       raise IOError('Not opened.')
 
-    self._cursor.execute(self._NUMBER_OF_ROWS_QUERY.format(table_name))
-    row = self._cursor.fetchone()
+    with self._lock:
+      self._cursor.execute(self._NUMBER_OF_ROWS_QUERY.format(table_name))
+      row = self._cursor.fetchone()
+
     if not row:
       raise IOError(
           'Unable to retrieve number of rows of table: {0:s}'.format(
@@ -84,6 +150,26 @@ class SQLiteDatabaseFile(object):
 
     return number_of_rows
 
+  def GetRowIdentifierName(self, table_name):
+    """Retrieves the name that refers to the row identifier of a table.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      str: name that refers to the row identifier or None if the names are
+          shadowed by columns of the table.
+
+    Raises:
+      IOError: if the database file is not opened.
+      OSError: if the database file is not opened.
+    """
+    for row_identifier_name in self._ROW_IDENTIFIER_NAMES:
+      if not self.HasColumn(table_name, row_identifier_name):
+        return row_identifier_name
+
+    return None
+
   def HasColumn(self, table_name, column_name):
     """Determines if a specific column exists.
 
@@ -109,8 +195,11 @@ class SQLiteDatabaseFile(object):
     if column_names is None:
       column_names = []
 
-      self._cursor.execute(self._HAS_COLUMN_QUERY.format(table_name))
-      for row in self._cursor.fetchall():
+      with self._lock:
+        self._cursor.execute(self._HAS_COLUMN_QUERY.format(table_name))
+        rows = self._cursor.fetchall()
+
+      for row in rows:
         if not row[1]:
           continue
 
@@ -145,10 +234,12 @@ class SQLiteDatabaseFile(object):
       return False
 
     if self._table_names is None:
-      self._table_names = []
+      with self._lock:
+        self._cursor.execute(self._HAS_TABLE_QUERY)
+        rows = self._cursor.fetchall()
 
-      self._cursor.execute(self._HAS_TABLE_QUERY)
-      for row in self._cursor.fetchall():
+      table_names = []
+      for row in rows:
         if not row[0]:
           continue
 
@@ -156,16 +247,23 @@ class SQLiteDatabaseFile(object):
         if isinstance(row_table_name, bytes):
           row_table_name = row_table_name.decode('utf-8')
 
-        self._table_names.append(row_table_name.lower())
+        table_names.append(row_table_name.lower())
+
+      self._table_names = table_names
 
     table_name = table_name.lower()
     return table_name in self._table_names
 
-  def Open(self, file_object):
+  def Open(self, file_object, maximum_in_memory_size=None):
     """Opens the database file object.
 
     Args:
       file_object (FileIO): file-like object.
+      maximum_in_memory_size (Optional[int]): maximum size in bytes of
+          a database that is loaded in memory instead of copied to a temporary
+          file, where None represents that the database is always copied to
+          a temporary file. Loading a database in memory requires a version
+          of sqlite3 that supports deserialize.
 
     Raises:
       IOError: if the SQLite database signature does not match.
@@ -176,8 +274,9 @@ class SQLiteDatabaseFile(object):
       raise ValueError('Missing file-like object.')
 
     # Since pysqlite3 does not provide an exclusive read-only mode and
-    # cannot interact with a file-like object directly we make a temporary
-    # copy. Before making a copy we check the header signature.
+    # cannot interact with a file-like object directly we make a copy, in
+    # memory or in a temporary file. Before making a copy we check the header
+    # signature.
 
     file_object.seek(0, os.SEEK_SET)
     data = file_object.read(len(self._HEADER_SIGNATURE))
@@ -185,14 +284,20 @@ class SQLiteDatabaseFile(object):
     if data != self._HEADER_SIGNATURE:
       raise IOError('Unsupported SQLite database signature.')
 
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-      self._temp_file_path = temp_file.name
-      while data:
-        temp_file.write(data)
-        data = file_object.read(self._COPY_BUFFER_SIZE)
+    is_in_memory = bool(
+        maximum_in_memory_size is not None and
+        hasattr(sqlite3.Connection, 'deserialize') and
+        file_object.get_size() <= maximum_in_memory_size)
 
-    self._connection = sqlite3.connect(self._temp_file_path)
+    if is_in_memory:
+      file_object.seek(0, os.SEEK_SET)
+      connection = self._OpenInMemory(file_object.read())
+    else:
+      connection = self._OpenTemporaryFile(file_object, data)
+
+    self._connection = connection
     self._connection.text_factory = bytes
+    self._is_in_memory = is_in_memory
     self._cursor = self._connection.cursor()
 
   def Query(self, query, parameters=None):
@@ -208,9 +313,72 @@ class SQLiteDatabaseFile(object):
     # TODO: catch Warning and return None.
     # Note that we cannot pass parameters as a keyword argument here.
     # A parameters value of None is not supported.
-    if parameters:
-      self._cursor.execute(query, parameters)
-    else:
-      self._cursor.execute(query)
+    with self._lock:
+      if parameters:
+        self._cursor.execute(query, parameters)
+      else:
+        self._cursor.execute(query)
+
+      return self._cursor.fetchall()
+
+  def ReadBlob(self, table_name, column_name, row_identifier, offset, size):
+    """Reads data from a blob.
+
+    The data is read with incremental blob I/O if supported by sqlite3,
+    otherwise with a substr() query, hence only the data read is kept in
+    memory.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column that contains the blob.
+      row_identifier (int): identifier of the row (rowid) that contains
+          the blob.
+      offset (int): offset within the blob where to start reading.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the database file is not opened or the blob cannot be read.
+      OSError: if the database file is not opened or the blob cannot be read.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    if not isinstance(row_identifier, int):
+      raise IOError('Unsupported row identifier: {0!s} not an integer.'.format(
+          row_identifier))
+
+    try:
+      with self._lock:
+        if self._HAS_BLOBOPEN:
+          with self._connection.blobopen(
+              table_name, column_name, row_identifier,
+              readonly=True) as blob:
+            blob.seek(offset)
+            return blob.read(size)
+
+        row_identifier_name = self.GetRowIdentifierName(table_name)
+        if not row_identifier_name:
+          raise IOError((
+              'Unable to read blob in table: {0:s} without row identifier '
+              'name.').format(table_name))
+
+        self._cursor.execute(
+            self._READ_BLOB_QUERY.format(
+                column_name, table_name, row_identifier_name),
+            (offset + 1, size, row_identifier))
+        row = self._cursor.fetchone()
+
+    except (sqlite3.Error, ValueError) as exception:
+      raise IOError((
+          'Unable to read blob in table: {0:s} and column: {1:s} '
+          'with error: {2!s}').format(table_name, column_name, exception))
+
+    if not row or row[0] is None:
+      raise IOError(
+          'Unable to read blob in table: {0:s} and column: {1:s}.'.format(
+              table_name, column_name))
 
-    return self._cursor.fetchall()
+    return row[0]
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """The path specification factory."""
 
+import copy
+import threading
+import weakref
+
 
 class Factory(object):
   """Path specification factory."""
@@ -32,10 +36,45 @@ class Factory(object):
       'table_name',
       'volume_index'])
 
+  # The intern table only maintains weak references to the interned path
+  # specifications, hence path specifications that are no longer used are
+  # removed from the table.
+  _interned_path_specs = weakref.WeakValueDictionary()
+  _interned_path_specs_lock = threading.Lock()
+
   _path_spec_types = {}
 
   _system_level_type_indicators = {}
 
+  @classmethod
+  def _InternPathSpec(cls, path_spec):
+    """Interns a path specification and its parents.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      PathSpec: interned frozen path specification.
+    """
+    parent = path_spec.parent
+    if parent is not None:
+      parent = cls._InternPathSpec(parent)
+
+    comparable = path_spec.comparable
+
+    interned_path_spec = cls._interned_path_specs.get(comparable, None)
+    if interned_path_spec is None:
+      if not path_spec.is_frozen or path_spec.parent is not parent:
+        # Note that the copy of a frozen path specification is not frozen.
+        path_spec = copy.copy(path_spec)
+        path_spec.parent = parent
+        path_spec.Freeze()
+
+      cls._interned_path_specs[comparable] = path_spec
+      interned_path_spec = path_spec
+
+    return interned_path_spec
+
   @classmethod
   def DeregisterPathSpec(cls, path_spec_type):
     """Deregisters a path specification type.
@@ -78,6 +117,25 @@ class Factory(object):
 
     return properties
 
+  @classmethod
+  def InternPathSpec(cls, path_spec):
+    """Interns a path specification.
+
+    Equal path specifications, including their parents, are interned as
+    the same frozen path specification, hence path specifications that share
+    a parent share the same parent object and their comparable and hash are
+    computed once. The path specification itself is not changed.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      PathSpec: interned frozen path specification, which should be used
+          instead of path_spec.
+    """
+    with cls._interned_path_specs_lock:
+      return cls._InternPathSpec(path_spec)
+
   @classmethod
   def IsSystemLevelTypeIndicator(cls, type_indicator):
     """Determines if the type indicator is at system-level.
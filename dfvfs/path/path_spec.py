@@ -7,12 +7,19 @@ from dfvfs.lib import definitions
 class PathSpec(object):
   """Path specification interface.
 
+  A path specification can be frozen, after which it can no longer be changed
+  and its comparable and hash are computed once. Frozen path specifications
+  are intended to be used as keys of caches that are looked up frequently,
+  for example by the path specification factory intern table.
+
   Attributes:
     parent (PathSpec): parent path specification.
   """
 
   # pylint: disable=missing-raises-doc
 
+  _IS_FROZEN = False
+
   _IS_SYSTEM_LEVEL = False
 
   def __init__(self, parent=None, **kwargs):
@@ -39,6 +46,9 @@ class PathSpec(object):
 
   def __eq__(self, other):
     """Determines if the path specification is equal to the other."""
+    if self is other:
+      return True
+
     return isinstance(other, PathSpec) and self.comparable == other.comparable
 
   def __hash__(self):
@@ -72,6 +82,11 @@ class PathSpec(object):
     """str: comparable representation of the path specification."""
     return self._GetComparable()
 
+  @property
+  def is_frozen(self):
+    """bool: True if the path specification is frozen."""
+    return self._IS_FROZEN
+
   @property
   def type_indicator(self):
     """str: type indicator."""
@@ -96,6 +111,23 @@ class PathSpec(object):
 
     return path_spec_dict
 
+  def Freeze(self):
+    """Freezes the path specification and its parents.
+
+    The comparable and hash of a frozen path specification are computed once.
+    The path specification is frozen by changing its class to the frozen
+    variant of its path specification type, hence path specifications that
+    are not frozen are not affected.
+    """
+    if self.parent is not None:
+      self.parent.Freeze()
+
+    comparable = self.comparable
+    self._frozen_comparable = comparable
+    self._frozen_hash = hash(comparable)
+
+    self.__class__ = _GetFrozenPathSpecType(self.__class__)
+
   def HasParent(self):
     """Determines if the path specification has a parent.
 
@@ -138,3 +170,122 @@ class PathSpec(object):
       bool: True if the path specification is the root of a volume system.
     """
     return self.IsVolumeSystem() and getattr(self, 'location', None) == '/'
+
+
+class _FrozenPathSpec(object):
+  """Frozen path specification mix-in.
+
+  The mix-in precedes the path specification type in the frozen variant of
+  the type, which is created by _GetFrozenPathSpecType.
+  """
+
+  # pylint: disable=missing-raises-doc,no-member
+
+  _IS_FROZEN = True
+
+  _FROZEN_ATTRIBUTE_NAMES = ('_frozen_comparable', '_frozen_hash')
+
+  def __delattr__(self, name):
+    """Deletes an attribute of the path specification.
+
+    Raises:
+      AttributeError: since the path specification is frozen.
+    """
+    raise AttributeError((
+        'Unable to delete attribute: {0:s} of frozen path '
+        'specification.').format(name))
+
+  def __hash__(self):
+    """Returns the hash of a path specification."""
+    return self._frozen_hash
+
+  def __reduce_ex__(self, protocol):
+    """Reduces the path specification, for copy and pickle.
+
+    Copies of a frozen path specification are not frozen.
+
+    Args:
+      protocol (int): pickle protocol version.
+
+    Returns:
+      tuple[function, tuple[type], dict[str, object]]: function to create
+          the path specification, its arguments and the state of the path
+          specification.
+    """
+    state = {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in self.__dict__.items()
+        if attribute_name not in self._FROZEN_ATTRIBUTE_NAMES}
+
+    return _NewPathSpec, (self._UNFROZEN_TYPE, ), state
+
+  def __setattr__(self, name, value):
+    """Sets an attribute of the path specification.
+
+    Raises:
+      AttributeError: since the path specification is frozen.
+    """
+    raise AttributeError(
+        'Unable to set attribute: {0:s} of frozen path specification.'.format(
+            name))
+
+  @property
+  def comparable(self):
+    """str: comparable representation of the path specification."""
+    return self._frozen_comparable
+
+  def CopyToDict(self):
+    """Copies the path specification to a dictionary.
+
+    Returns:
+      dict[str, object]: path specification attributes.
+    """
+    path_spec_dict = super(_FrozenPathSpec, self).CopyToDict()
+    for attribute_name in self._FROZEN_ATTRIBUTE_NAMES:
+      path_spec_dict.pop(attribute_name, None)
+
+    return path_spec_dict
+
+  def Freeze(self):
+    """Freezes the path specification and its parents."""
+    return
+
+
+def _NewPathSpec(path_spec_type):
+  """Creates a path specification without initializing it.
+
+  Args:
+    path_spec_type (type): path specification type.
+
+  Returns:
+    PathSpec: path specification.
+  """
+  return path_spec_type.__new__(path_spec_type)
+
+
+# The frozen variants of the path specification types.
+_frozen_path_spec_types = {}
+
+
+def _GetFrozenPathSpecType(path_spec_type):
+  """Retrieves the frozen variant of a path specification type.
+
+  Args:
+    path_spec_type (type): path specification type.
+
+  Returns:
+    type: frozen path specification type.
+  """
+  frozen_path_spec_type = _frozen_path_spec_types.get(path_spec_type, None)
+  if not frozen_path_spec_type:
+    frozen_path_spec_type = type(
+        path_spec_type.__name__, (_FrozenPathSpec, path_spec_type), {
+            '__module__': path_spec_type.__module__,
+            '__qualname__': path_spec_type.__qualname__,
+            '_UNFROZEN_TYPE': path_spec_type})
+
+    # Another thread could have created the frozen type in the meantime.
+    frozen_path_spec_type = _frozen_path_spec_types.setdefault(
+        path_spec_type, frozen_path_spec_type)
+
+  return frozen_path_spec_type
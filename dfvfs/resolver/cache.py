@@ -1,34 +1,186 @@
 # -*- coding: utf-8 -*-
 """The resolver objects cache."""
 
+import collections
 import weakref
 
+from dfvfs.lib import definitions
 from dfvfs.lib import errors
 
 
+class CacheStatistics(object):
+  """Resolver objects cache statistics.
+
+  Attributes:
+    cost (int): total cost of the objects in the working set.
+    number_of_cached_values (int): number of cached values.
+    number_of_evictions (int): number of objects evicted from the working set.
+    number_of_hits (int): number of cache lookups that found an object.
+    number_of_misses (int): number of cache lookups that did not find
+        an object.
+  """
+
+  def __init__(self):
+    """Initializes resolver objects cache statistics."""
+    super(CacheStatistics, self).__init__()
+    self.cost = 0
+    self.number_of_cached_values = 0
+    self.number_of_evictions = 0
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+
 class ObjectsCache(object):
-  """Resolver object cache."""
+  """Resolver object cache.
+
+  By default the cache only maintains weak references to the cached objects
+  and raises CacheFullError when the maximum number of cached values is
+  reached. When an eviction policy is set, the cache also maintains a working
+  set of strong references to the cached objects, so that objects stay cached
+  when they are no longer referenced by other objects, and evicts objects from
+  the working set according to the policy when the maximum number of cached
+  values or the maximum cost is reached.
+  """
+
+  _EVICTION_POLICIES = frozenset([
+      definitions.CACHE_EVICTION_POLICY_LFU,
+      definitions.CACHE_EVICTION_POLICY_LRU])
 
-  def __init__(self, maximum_number_of_cached_values):
+  def __init__(
+      self, maximum_number_of_cached_values, cost_function=None,
+      eviction_policy=None, maximum_cost=None):
     """Initializes a resolver objects cache object.
 
     Args:
       maximum_number_of_cached_values (int): maximum number of cached values.
+      cost_function (Optional[function]): function to estimate the cost of
+          a cached object, for example its size in bytes, where None represents
+          that the cost of a cached object is not estimated.
+      eviction_policy (Optional[str]): eviction policy, for example
+          CACHE_EVICTION_POLICY_LRU, where None represents no eviction policy.
+      maximum_cost (Optional[int]): maximum total cost of the objects in
+          the working set, where None represents no maximum. The maximum cost
+          is only used in combination with an eviction policy and a cost
+          function.
 
     Raises:
-      ValueError: when the maximum number of cached objects is 0 or less.
+      ValueError: when the maximum number of cached objects is 0 or less or
+          the eviction policy is not supported.
     """
     if maximum_number_of_cached_values <= 0:
       raise ValueError(
           'Invalid maximum number of cached objects value zero or less.')
 
+    if (eviction_policy is not None and
+        eviction_policy not in self._EVICTION_POLICIES):
+      raise ValueError('Unsupported eviction policy: {0!s}.'.format(
+          eviction_policy))
+
     super(ObjectsCache, self).__init__()
+    self._cost = 0
+    self._cost_function = cost_function
+    self._costs = {}
+    self._eviction_policy = eviction_policy
+    self._maximum_cost = maximum_cost
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
+    self._number_of_evictions = 0
+    self._number_of_hits = 0
+    self._number_of_misses = 0
+    self._usage_counts = {}
     # The WeakValueDictionary will maintain a (weak) reference to a VFS object
     # as long as the object is (strong) referrened by other objects. If an
     # object has no remaining (strong) referrences it is removed from the
     # WeakValueDictionary.
     self._values = weakref.WeakValueDictionary()
+    # The working set maintains (strong) references to the most recently used
+    # VFS objects when an eviction policy is set.
+    self._working_set = collections.OrderedDict()
+
+  def _AddToWorkingSet(self, identifier, vfs_object):
+    """Adds a VFS object to the working set.
+
+    Objects are evicted from the working set according to the eviction policy
+    to make room for the VFS object.
+
+    Args:
+      identifier (str): VFS object identifier.
+      vfs_object (object): VFS object.
+    """
+    cost = 0
+    if self._cost_function:
+      cost = self._cost_function(vfs_object)
+
+    if self._maximum_cost is not None and cost > self._maximum_cost:
+      return
+
+    while self._working_set and (
+        len(self._working_set) >= self._maximum_number_of_cached_values or (
+            self._maximum_cost is not None and
+            self._cost + cost > self._maximum_cost)):
+      self._EvictFromWorkingSet()
+
+    self._working_set[identifier] = vfs_object
+    self._costs[identifier] = cost
+    self._cost += cost
+    self._usage_counts[identifier] = 0
+
+  def _EvictFromWorkingSet(self):
+    """Evicts a VFS object from the working set."""
+    if self._eviction_policy == definitions.CACHE_EVICTION_POLICY_LFU:
+      # The working set is ordered by least recent use, hence min() returns
+      # the least recently used of the least frequently used objects.
+      identifier = min(
+          self._working_set.keys(),
+          key=lambda key: self._usage_counts.get(key, 0))
+    else:
+      identifier = next(iter(self._working_set.keys()))
+
+    self._RemoveFromWorkingSet(identifier)
+    self._number_of_evictions += 1
+
+  def _LookupObject(self, identifier):
+    """Looks up a cached object based on the identifier.
+
+    Unlike GetObject, a lookup that does not find an object is not counted
+    as a cache miss, which allows to check the cache again, for example after
+    waiting for a lock, without counting the miss twice.
+
+    Args:
+      identifier (str): VFS object identifier.
+
+    Returns:
+      object: cached VFS object or None if not cached.
+    """
+    vfs_object = self._values.get(identifier, None)
+    if vfs_object is None:
+      return None
+
+    self._number_of_hits += 1
+
+    if self._eviction_policy:
+      if identifier in self._working_set:
+        self._working_set.move_to_end(identifier)
+      else:
+        # The object was evicted from the working set but is still referenced
+        # by other objects.
+        self._AddToWorkingSet(identifier, vfs_object)
+
+      if identifier in self._usage_counts:
+        self._usage_counts[identifier] += 1
+
+    return vfs_object
+
+  def _RemoveFromWorkingSet(self, identifier):
+    """Removes a VFS object from the working set.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+    if identifier in self._working_set:
+      del self._working_set[identifier]
+      self._cost -= self._costs.pop(identifier, 0)
+
+    self._usage_counts.pop(identifier, None)
 
   def CacheObject(self, identifier, vfs_object):
     """Caches a VFS object.
@@ -40,14 +192,18 @@ class ObjectsCache(object):
       vfs_object (object): VFS object to cache.
 
     Raises:
-      CacheFullError: if he maximum number of cached values is reached.
+      CacheFullError: if he maximum number of cached values is reached and
+          no eviction policy is set.
       KeyError: if the VFS object already is cached.
     """
     if identifier in self._values:
       raise KeyError('Object already cached for identifier: {0:s}'.format(
           identifier))
 
-    if len(self._values) == self._maximum_number_of_cached_values:
+    if self._eviction_policy:
+      self._AddToWorkingSet(identifier, vfs_object)
+
+    elif len(self._values) == self._maximum_number_of_cached_values:
       raise errors.CacheFullError('Maximum number of cached values reached.')
 
     self._values[identifier] = vfs_object
@@ -57,7 +213,11 @@ class ObjectsCache(object):
 
     This method ignores the cache value reference count.
     """
+    self._cost = 0
+    self._costs = {}
+    self._usage_counts = {}
     self._values.clear()
+    self._working_set = collections.OrderedDict()
 
   def GetObject(self, identifier):
     """Retrieves a cached object based on the identifier.
@@ -70,7 +230,25 @@ class ObjectsCache(object):
     Returns:
       object: cached VFS object or None if not cached.
     """
-    return self._values.get(identifier, None)
+    vfs_object = self._LookupObject(identifier)
+    if vfs_object is None:
+      self._number_of_misses += 1
+
+    return vfs_object
+
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      CacheStatistics: cache statistics.
+    """
+    cache_statistics = CacheStatistics()
+    cache_statistics.cost = self._cost
+    cache_statistics.number_of_cached_values = len(self._values)
+    cache_statistics.number_of_evictions = self._number_of_evictions
+    cache_statistics.number_of_hits = self._number_of_hits
+    cache_statistics.number_of_misses = self._number_of_misses
+    return cache_statistics
 
   def RemoveObject(self, identifier):
     """Removes a cached object based on the identifier.
@@ -87,6 +265,7 @@ class ObjectsCache(object):
       raise KeyError('Missing cached object for identifier: {0:s}'.format(
           identifier))
 
+    self._RemoveFromWorkingSet(identifier)
     del self._values[identifier]
 
   def SetMaximumNumberOfCachedValues(self, maximum_number_of_cached_values):
@@ -103,3 +282,6 @@ class ObjectsCache(object):
           'Invalid maximum number of cached objects value zero or less.')
 
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
+
+    while len(self._working_set) > self._maximum_number_of_cached_values:
+      self._EvictFromWorkingSet()
@@ -1,17 +1,89 @@
 # -*- coding: utf-8 -*-
 """The resolver context object."""
 
+import threading
+import weakref
+
+from dfvfs.file_io import block_cache_io
+from dfvfs.file_io import thread_safe_file_io
 from dfvfs.lib import decorators
+from dfvfs.lib import definitions
+from dfvfs.lib import gzipfile
 from dfvfs.mount import manager as mount_manager
 from dfvfs.resolver import cache
 
 
+class _NoLock(object):
+  """Lock that does not lock, used where locking is not required."""
+
+  def __enter__(self):
+    """Enters a with statement."""
+    return self
+
+  def __exit__(self, exception_type, value, traceback):
+    """Exits a with statement."""
+    return False
+
+
+class _OpenLock(object):
+  """Lock to serialize opening an object identified by an identifier."""
+
+  def __init__(self, open_locks, open_locks_lock, identifier):
+    """Initializes an open lock.
+
+    Args:
+      open_locks (dict[str, list[object]]): lock and number of users per
+          identifier.
+      open_locks_lock (threading.Lock): lock that protects open_locks.
+      identifier (str): identifier of the object to open.
+    """
+    super(_OpenLock, self).__init__()
+    self._identifier = identifier
+    self._lock = None
+    self._open_locks = open_locks
+    self._open_locks_lock = open_locks_lock
+
+  def __enter__(self):
+    """Enters a with statement."""
+    with self._open_locks_lock:
+      lock_and_users = self._open_locks.get(self._identifier, None)
+      if not lock_and_users:
+        lock_and_users = [threading.Lock(), 0]
+        self._open_locks[self._identifier] = lock_and_users
+
+      lock_and_users[1] += 1
+
+    self._lock = lock_and_users[0]
+    self._lock.acquire()  # pylint: disable=consider-using-with
+    return self
+
+  def __exit__(self, exception_type, value, traceback):
+    """Exits a with statement."""
+    self._lock.release()
+
+    with self._open_locks_lock:
+      lock_and_users = self._open_locks[self._identifier]
+      lock_and_users[1] -= 1
+      if lock_and_users[1] == 0:
+        del self._open_locks[self._identifier]
+
+    return False
+
+
 class Context(object):
-  """Resolver context."""
+  """Resolver context.
+
+  The resolver context is not thread-safe, use ThreadSafeContext to share
+  a resolver context between threads.
+  """
 
   def __init__(
       self, maximum_number_of_file_objects=256,
-      maximum_number_of_file_systems=32):
+      maximum_number_of_file_systems=32, eviction_policy=None,
+      file_object_cost_function=None, maximum_file_objects_cost=None,
+      block_cache_size=None, block_cache_block_size=65536,
+      block_cache_read_ahead_size=1048576, maximum_number_of_databases=4,
+      maximum_in_memory_database_size=None, gzip_index_path=None):
     """Initializes the resolver context object.
 
     Args:
@@ -19,14 +91,61 @@ class Context(object):
           of file-like objects cached in the context.
       maximum_number_of_file_systems (Optional[int]): maximum number
           of file system objects cached in the context.
+      eviction_policy (Optional[str]): eviction policy of the caches, for
+          example CACHE_EVICTION_POLICY_LRU, where None represents that
+          a CacheFullError is raised when a cache is full.
+      file_object_cost_function (Optional[function]): function to estimate
+          the cost of a cached file-like object, for example its memory usage
+          in bytes.
+      maximum_file_objects_cost (Optional[int]): maximum total cost of
+          the cached file-like objects, where None represents no maximum.
+      block_cache_size (Optional[int]): maximum size in bytes of the block
+          cache of every storage media image, where None represents that
+          storage media images are not block cached.
+      block_cache_block_size (Optional[int]): size in bytes of a block in
+          the block cache.
+      block_cache_read_ahead_size (Optional[int]): maximum number of bytes
+          the block cache reads ahead for sequential reads, where 0 disables
+          read-ahead.
+      maximum_number_of_databases (Optional[int]): maximum number of
+          materialized SQLite databases that are kept cached in the context
+          when they are no longer in use.
+      maximum_in_memory_database_size (Optional[int]): maximum size in bytes
+          of a SQLite database that is loaded in memory instead of copied to
+          a temporary file, where None represents that databases are always
+          copied to a temporary file.
+      gzip_index_path (Optional[str]): path of the directory where gzip
+          indexes are stored, so that they can be reused by other processes,
+          where None represents that gzip indexes are only kept in memory.
     """
     super(Context, self).__init__()
     self._file_object_cache = cache.ObjectsCache(
-        maximum_number_of_file_objects)
+        maximum_number_of_file_objects,
+        cost_function=file_object_cost_function,
+        eviction_policy=eviction_policy,
+        maximum_cost=maximum_file_objects_cost)
     self._file_system_cache = cache.ObjectsCache(
-        maximum_number_of_file_systems)
+        maximum_number_of_file_systems, eviction_policy=eviction_policy)
+    self._block_cache_block_size = block_cache_block_size
+    self._block_cache_files = weakref.WeakSet()
+    self._block_cache_read_ahead_size = block_cache_read_ahead_size
+    self._block_cache_size = block_cache_size
+    # Materializing a SQLite database is expensive, hence the most recently
+    # used databases are kept cached when they are no longer in use.
+    self._database_cache = cache.ObjectsCache(
+        maximum_number_of_databases,
+        eviction_policy=definitions.CACHE_EVICTION_POLICY_LRU)
+    # Indexing a gzip file requires decompressing all its data, hence the gzip
+    # indexes are kept so that a gzip file only needs to be indexed once.
+    self._gzip_index_store = gzipfile.GzipIndexStore(path=gzip_index_path)
+    self._maximum_in_memory_database_size = maximum_in_memory_database_size
     self._mount_points = {}
 
+  @property
+  def maximum_in_memory_database_size(self):
+    """int: maximum size in bytes of an in-memory SQLite database or None."""
+    return self._maximum_in_memory_database_size
+
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
 
@@ -43,6 +162,71 @@ class Context(object):
 
     return ''.join(string_parts)
 
+  def _LookupDatabase(self, path_spec):
+    """Looks up a cached SQLite database without counting a cache miss.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database or None if not cached.
+    """
+    # pylint: disable=protected-access
+    return self._database_cache._LookupObject(path_spec.comparable)
+
+  def _LookupFileObject(self, path_spec):
+    """Looks up a cached file-like object without counting a cache miss.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileIO: a file-like object or None if not cached.
+    """
+    # pylint: disable=protected-access
+    return self._file_object_cache._LookupObject(path_spec.comparable)
+
+  def _LookupFileSystem(self, path_spec):
+    """Looks up a cached file system object without counting a cache miss.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    identifier = self._GetFileSystemCacheIdentifier(path_spec)
+    # pylint: disable=protected-access
+    return self._file_system_cache._LookupObject(identifier)
+
+  def _WrapFileObject(self, path_spec, file_object):
+    """Wraps a file-like object before it is cached.
+
+    Storage media images are wrapped by a block cache file-like object when
+    the block cache is enabled.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_object (FileIO): file-like object.
+
+    Returns:
+      FileIO: file-like object to cache.
+    """
+    if (self._block_cache_size is None or path_spec.type_indicator not in (
+        definitions.STORAGE_MEDIA_IMAGE_TYPE_INDICATORS)):
+      return file_object
+
+    block_cache_file_object = block_cache_io.BlockCacheFile(
+        self, path_spec, file_object,
+        block_size=self._block_cache_block_size,
+        maximum_cache_size=self._block_cache_size,
+        maximum_read_ahead_size=self._block_cache_read_ahead_size)
+    block_cache_file_object.Open()
+
+    self._block_cache_files.add(block_cache_file_object)
+
+    return block_cache_file_object
+
   def DeregisterMountPoint(self, mount_point):
     """Deregisters a path specification mount point.
 
@@ -57,14 +241,29 @@ class Context(object):
 
     del self._mount_points[mount_point]
 
+  def CacheDatabase(self, path_spec, database_object):
+    """Caches a SQLite database based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+      database_object (SQLiteDatabaseFile): SQLite database.
+    """
+    self._database_cache.CacheObject(path_spec.comparable, database_object)
+
   def CacheFileObject(self, path_spec, file_object):
     """Caches a file-like object based on a path specification.
 
     Args:
       path_spec (PathSpec): path specification.
       file_object (FileIO): file-like object.
+
+    Returns:
+      FileIO: cached file-like object, which should be used instead of
+          file_object.
     """
+    file_object = self._WrapFileObject(path_spec, file_object)
     self._file_object_cache.CacheObject(path_spec.comparable, file_object)
+    return file_object
 
   def CacheFileSystem(self, path_spec, file_system):
     """Caches a file system object based on a path specification.
@@ -78,8 +277,10 @@ class Context(object):
 
   def Empty(self):
     """Empties the caches."""
+    self._database_cache.Empty()
     self._file_object_cache.Empty()
     self._file_system_cache.Empty()
+    self._gzip_index_store.Empty()
 
   def ForceRemoveFileObject(self, path_spec):
     """Forces the removal of a file-like object based on a path specification.
@@ -93,6 +294,51 @@ class Context(object):
     vfs_object = self._file_object_cache.GetObject(path_spec.comparable)
     return bool(vfs_object)
 
+  def GetBlockCacheStatistics(self):
+    """Retrieves the combined statistics of the block caches.
+
+    Returns:
+      CacheStatistics: statistics of the block caches of the storage media
+          images that are in use.
+    """
+    statistics = cache.CacheStatistics()
+    for block_cache_file_object in list(self._block_cache_files):
+      block_cache_statistics = block_cache_file_object.GetStatistics()
+      statistics.cost += block_cache_statistics.cost
+      statistics.number_of_cached_values += (
+          block_cache_statistics.number_of_cached_values)
+      statistics.number_of_evictions += (
+          block_cache_statistics.number_of_evictions)
+      statistics.number_of_hits += block_cache_statistics.number_of_hits
+      statistics.number_of_misses += block_cache_statistics.number_of_misses
+
+    return statistics
+
+  def GetDatabase(self, path_spec):
+    """Retrieves a SQLite database defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database or None if not cached.
+    """
+    return self._database_cache.GetObject(path_spec.comparable)
+
+  def GetDatabaseOpenLock(self, path_spec):
+    """Retrieves the lock to open a SQLite database.
+
+    The lock prevents that the same SQLite database is materialized multiple
+    times concurrently, where the resolver context does not require locking.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      object: lock, that can be used in a with statement.
+    """
+    return _NoLock()
+
   def GetFileObject(self, path_spec):
     """Retrieves a file-like object defined by path specification.
 
@@ -121,6 +367,28 @@ class Context(object):
 
     return None
 
+  def GetFileObjectOpenLock(self, path_spec):
+    """Retrieves the lock to open a file-like object.
+
+    The lock prevents that the same file-like object is opened multiple times
+    concurrently, where the resolver context does not require locking.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      object: lock, that can be used in a with statement.
+    """
+    return _NoLock()
+
+  def GetFileObjectCacheStatistics(self):
+    """Retrieves the file-like object cache statistics.
+
+    Returns:
+      CacheStatistics: file-like object cache statistics.
+    """
+    return self._file_object_cache.GetStatistics()
+
   def GetFileSystem(self, path_spec):
     """Retrieves a file system object defined by path specification.
 
@@ -133,6 +401,39 @@ class Context(object):
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     return self._file_system_cache.GetObject(identifier)
 
+  def GetFileSystemOpenLock(self, path_spec):
+    """Retrieves the lock to open a file system object.
+
+    The lock prevents that the same file system object is opened multiple times
+    concurrently, where the resolver context does not require locking.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      object: lock, that can be used in a with statement.
+    """
+    return _NoLock()
+
+  def GetFileSystemCacheStatistics(self):
+    """Retrieves the file system object cache statistics.
+
+    Returns:
+      CacheStatistics: file system object cache statistics.
+    """
+    return self._file_system_cache.GetStatistics()
+
+  def GetGzipIndex(self, path_spec):
+    """Retrieves the gzip index of a gzip file.
+
+    Args:
+      path_spec (PathSpec): path specification of the gzip file.
+
+    Returns:
+      GzipIndex: gzip index or None if not available.
+    """
+    return self._gzip_index_store.GetIndex(path_spec)
+
   def GetMountPoint(self, mount_point):
     """Retrieves the path specification of a mount point.
 
@@ -163,6 +464,15 @@ class Context(object):
 
     self._mount_points[mount_point] = path_spec
 
+  def SetGzipIndex(self, path_spec, gzip_index):
+    """Sets the gzip index of a gzip file.
+
+    Args:
+      path_spec (PathSpec): path specification of the gzip file.
+      gzip_index (GzipIndex): gzip index.
+    """
+    self._gzip_index_store.SetIndex(path_spec, gzip_index)
+
   def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
     """Sets the maximum number of cached file-like objects.
 
@@ -182,3 +492,375 @@ class Context(object):
     """
     self._file_system_cache.SetMaximumNumberOfCachedValues(
         maximum_number_of_file_systems)
+
+
+class ThreadSafeContext(Context):
+  """Thread-safe resolver context.
+
+  The thread-safe resolver context can be shared between threads, for example
+  to read many files from one storage media image with a thread pool:
+
+  * access to the caches and mount points is serialized with a lock;
+  * opening the same file-like or file system object in multiple threads is
+    coalesced, so that the threads share the object opened by the first
+    thread;
+  * cached file-like objects are wrapped by a thread-safe file-like object
+    where every thread has its own current offset and reads of the shared
+    file-like object are serialized.
+
+  Note that file system objects are shared between threads as-is, hence their
+  back-end must support being used from multiple threads.
+  """
+
+  def __init__(
+      self, maximum_number_of_file_objects=256,
+      maximum_number_of_file_systems=32, eviction_policy=None,
+      file_object_cost_function=None, maximum_file_objects_cost=None,
+      block_cache_size=None, block_cache_block_size=65536,
+      block_cache_read_ahead_size=1048576, maximum_number_of_databases=4,
+      maximum_in_memory_database_size=None, gzip_index_path=None):
+    """Initializes the resolver context object.
+
+    Args:
+      maximum_number_of_file_objects (Optional[int]): maximum number
+          of file-like objects cached in the context.
+      maximum_number_of_file_systems (Optional[int]): maximum number
+          of file system objects cached in the context.
+      eviction_policy (Optional[str]): eviction policy of the caches, for
+          example CACHE_EVICTION_POLICY_LRU, where None represents that
+          a CacheFullError is raised when a cache is full.
+      file_object_cost_function (Optional[function]): function to estimate
+          the cost of a cached file-like object, for example its memory usage
+          in bytes.
+      maximum_file_objects_cost (Optional[int]): maximum total cost of
+          the cached file-like objects, where None represents no maximum.
+      block_cache_size (Optional[int]): maximum size in bytes of the block
+          cache of every storage media image, where None represents that
+          storage media images are not block cached.
+      block_cache_block_size (Optional[int]): size in bytes of a block in
+          the block cache.
+      block_cache_read_ahead_size (Optional[int]): maximum number of bytes
+          the block cache reads ahead for sequential reads, where 0 disables
+          read-ahead.
+      maximum_number_of_databases (Optional[int]): maximum number of
+          materialized SQLite databases that are kept cached in the context
+          when they are no longer in use.
+      maximum_in_memory_database_size (Optional[int]): maximum size in bytes
+          of a SQLite database that is loaded in memory instead of copied to
+          a temporary file, where None represents that databases are always
+          copied to a temporary file.
+      gzip_index_path (Optional[str]): path of the directory where gzip
+          indexes are stored, so that they can be reused by other processes,
+          where None represents that gzip indexes are only kept in memory.
+    """
+    super(ThreadSafeContext, self).__init__(
+        maximum_number_of_file_objects=maximum_number_of_file_objects,
+        maximum_number_of_file_systems=maximum_number_of_file_systems,
+        eviction_policy=eviction_policy,
+        file_object_cost_function=file_object_cost_function,
+        maximum_file_objects_cost=maximum_file_objects_cost,
+        block_cache_size=block_cache_size,
+        block_cache_block_size=block_cache_block_size,
+        block_cache_read_ahead_size=block_cache_read_ahead_size,
+        maximum_number_of_databases=maximum_number_of_databases,
+        maximum_in_memory_database_size=maximum_in_memory_database_size,
+        gzip_index_path=gzip_index_path)
+    self._lock = threading.RLock()
+    self._open_locks = {}
+    self._open_locks_lock = threading.Lock()
+
+  def _LookupDatabase(self, path_spec):
+    """Looks up a cached SQLite database without counting a cache miss.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self)._LookupDatabase(path_spec)
+
+  def _LookupFileObject(self, path_spec):
+    """Looks up a cached file-like object without counting a cache miss.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      ThreadSafeFile: a thread-safe file-like object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self)._LookupFileObject(path_spec)
+
+  def _LookupFileSystem(self, path_spec):
+    """Looks up a cached file system object without counting a cache miss.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self)._LookupFileSystem(path_spec)
+
+  def _WrapFileObject(self, path_spec, file_object):
+    """Wraps a file-like object before it is cached.
+
+    The file-like object is wrapped by a thread-safe file-like object, after
+    it has been wrapped by a block cache file-like object if applicable.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_object (FileIO): file-like object.
+
+    Returns:
+      ThreadSafeFile: thread-safe file-like object to cache.
+    """
+    file_object = super(ThreadSafeContext, self)._WrapFileObject(
+        path_spec, file_object)
+
+    thread_safe_file_object = thread_safe_file_io.ThreadSafeFile(
+        self, path_spec, file_object)
+    thread_safe_file_object.Open()
+
+    return thread_safe_file_object
+
+  def DeregisterMountPoint(self, mount_point):
+    """Deregisters a path specification mount point.
+
+    Args:
+      mount_point (str): mount point identifier.
+
+    Raises:
+      KeyError: if the corresponding mount point is not set.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).DeregisterMountPoint(mount_point)
+
+  def CacheDatabase(self, path_spec, database_object):
+    """Caches a SQLite database based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+      database_object (SQLiteDatabaseFile): SQLite database.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).CacheDatabase(path_spec, database_object)
+
+  def CacheFileObject(self, path_spec, file_object):
+    """Caches a file-like object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_object (FileIO): file-like object.
+
+    Returns:
+      ThreadSafeFile: cached thread-safe file-like object, which should be
+          used instead of file_object.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).CacheFileObject(
+          path_spec, file_object)
+
+  def CacheFileSystem(self, path_spec, file_system):
+    """Caches a file system object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_system (FileSystem): file system object.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).CacheFileSystem(path_spec, file_system)
+
+  def Empty(self):
+    """Empties the caches."""
+    with self._lock:
+      super(ThreadSafeContext, self).Empty()
+
+  def ForceRemoveFileObject(self, path_spec):
+    """Forces the removal of a file-like object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      bool: True if the file-like object was cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).ForceRemoveFileObject(path_spec)
+
+  def GetBlockCacheStatistics(self):
+    """Retrieves the combined statistics of the block caches.
+
+    Returns:
+      CacheStatistics: statistics of the block caches of the storage media
+          images that are in use.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetBlockCacheStatistics()
+
+  def GetDatabase(self, path_spec):
+    """Retrieves a SQLite database defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetDatabase(path_spec)
+
+  def GetDatabaseOpenLock(self, path_spec):
+    """Retrieves the lock to open a SQLite database.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      object: lock, that can be used in a with statement.
+    """
+    return _OpenLock(
+        self._open_locks, self._open_locks_lock,
+        'database: {0:s}'.format(path_spec.comparable))
+
+  def GetFileObject(self, path_spec):
+    """Retrieves a file-like object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      ThreadSafeFile: a thread-safe file-like object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileObject(path_spec)
+
+  def GetFileObjectCacheStatistics(self):
+    """Retrieves the file-like object cache statistics.
+
+    Returns:
+      CacheStatistics: file-like object cache statistics.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileObjectCacheStatistics()
+
+  def GetFileObjectOpenLock(self, path_spec):
+    """Retrieves the lock to open a file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      object: lock, that can be used in a with statement.
+    """
+    return _OpenLock(
+        self._open_locks, self._open_locks_lock,
+        'file_object: {0:s}'.format(path_spec.comparable))
+
+  def GetFileSystem(self, path_spec):
+    """Retrieves a file system object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileSystem(path_spec)
+
+  def GetFileSystemCacheStatistics(self):
+    """Retrieves the file system object cache statistics.
+
+    Returns:
+      CacheStatistics: file system object cache statistics.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileSystemCacheStatistics()
+
+  def GetFileSystemOpenLock(self, path_spec):
+    """Retrieves the lock to open a file system object.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      object: lock, that can be used in a with statement.
+    """
+    identifier = self._GetFileSystemCacheIdentifier(path_spec)
+    return _OpenLock(
+        self._open_locks, self._open_locks_lock,
+        'file_system: {0:s}'.format(identifier))
+
+  def GetGzipIndex(self, path_spec):
+    """Retrieves the gzip index of a gzip file.
+
+    Args:
+      path_spec (PathSpec): path specification of the gzip file.
+
+    Returns:
+      GzipIndex: gzip index or None if not available.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetGzipIndex(path_spec)
+
+  def GetMountPoint(self, mount_point):
+    """Retrieves the path specification of a mount point.
+
+    Args:
+      mount_point (str): mount point identifier.
+
+    Returns:
+      PathSpec: path specification of the mount point or None if the mount
+          point does not exists.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetMountPoint(mount_point)
+
+  def RegisterMountPoint(self, mount_point, path_spec):
+    """Registers a path specification mount point.
+
+    Args:
+      mount_point (str): mount point identifier.
+      path_spec (PathSpec): path specification of the mount point.
+
+    Raises:
+      KeyError: if the corresponding mount point is already set.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).RegisterMountPoint(mount_point, path_spec)
+
+  def SetGzipIndex(self, path_spec, gzip_index):
+    """Sets the gzip index of a gzip file.
+
+    Args:
+      path_spec (PathSpec): path specification of the gzip file.
+      gzip_index (GzipIndex): gzip index.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).SetGzipIndex(path_spec, gzip_index)
+
+  def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
+    """Sets the maximum number of cached file-like objects.
+
+    Args:
+      maximum_number_of_file_objects (int): maximum number of file-like
+          objects cached in the context.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).SetMaximumNumberOfFileObjects(
+          maximum_number_of_file_objects)
+
+  def SetMaximumNumberOfFileSystems(self, maximum_number_of_file_systems):
+    """Sets the maximum number of cached file system objects.
+
+    Args:
+      maximum_number_of_file_systems (int): maximum number of file system
+          objects cached in the context.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).SetMaximumNumberOfFileSystems(
+          maximum_number_of_file_systems)
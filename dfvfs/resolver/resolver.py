@@ -35,6 +35,60 @@ class Resolver(object):
 
     return cls._resolver_helpers_manager.GetHelper(type_indicator)
 
+  @classmethod
+  def _OpenNewFileObject(cls, path_spec_object, resolver_context):
+    """Opens and caches a new file-like object.
+
+    Args:
+      path_spec_object (PathSpec): path specification.
+      resolver_context (Context): resolver context.
+
+    Returns:
+      FileIO: file-like object.
+
+    Raises:
+      BackEndError: if the file object cannot be opened.
+    """
+    resolver_helper = cls._GetResolverHelper(path_spec_object.type_indicator)
+    file_object = resolver_helper.NewFileObject(
+        resolver_context, path_spec_object)
+
+    try:
+      file_object.Open()
+    except (IOError, ValueError) as exception:
+      raise errors.BackEndError(
+          'Unable to open file object with error: {0!s}'.format(exception))
+
+    return resolver_context.CacheFileObject(path_spec_object, file_object)
+
+  @classmethod
+  def _OpenNewFileSystem(cls, path_spec_object, resolver_context):
+    """Opens and caches a new file system object.
+
+    Args:
+      path_spec_object (PathSpec): path specification.
+      resolver_context (Context): resolver context.
+
+    Returns:
+      FileSystem: file system.
+
+    Raises:
+      BackEndError: if the file system cannot be opened.
+    """
+    resolver_helper = cls._GetResolverHelper(path_spec_object.type_indicator)
+    file_system = resolver_helper.NewFileSystem(
+        resolver_context, path_spec_object)
+
+    try:
+      file_system.Open()
+    except (IOError, ValueError) as exception:
+      raise errors.BackEndError(
+          'Unable to open file system with error: {0!s}'.format(exception))
+
+    resolver_context.CacheFileSystem(path_spec_object, file_system)
+
+    return file_system
+
   @classmethod
   def OpenFileEntry(cls, path_spec_object, resolver_context=None):
     """Opens a file entry object defined by path specification.
@@ -99,17 +153,14 @@ class Resolver(object):
 
     file_object = resolver_context.GetFileObject(path_spec_object)
     if not file_object:
-      resolver_helper = cls._GetResolverHelper(path_spec_object.type_indicator)
-      file_object = resolver_helper.NewFileObject(
-          resolver_context, path_spec_object)
-
-      try:
-        file_object.Open()
-      except (IOError, ValueError) as exception:
-        raise errors.BackEndError(
-            'Unable to open file object with error: {0!s}'.format(exception))
-
-      resolver_context.CacheFileObject(path_spec_object, file_object)
+      with resolver_context.GetFileObjectOpenLock(path_spec_object):
+        # Check the cache again in case the file-like object was opened
+        # while waiting for the lock, without counting the cache miss twice.
+        # pylint: disable=protected-access
+        file_object = resolver_context._LookupFileObject(path_spec_object)
+        if not file_object:
+          file_object = cls._OpenNewFileObject(
+              path_spec_object, resolver_context)
 
     return file_object
 
@@ -157,16 +208,13 @@ class Resolver(object):
 
     file_system = resolver_context.GetFileSystem(path_spec_object)
     if not file_system:
-      resolver_helper = cls._GetResolverHelper(path_spec_object.type_indicator)
-      file_system = resolver_helper.NewFileSystem(
-          resolver_context, path_spec_object)
-
-      try:
-        file_system.Open()
-      except (IOError, ValueError) as exception:
-        raise errors.BackEndError(
-            'Unable to open file system with error: {0!s}'.format(exception))
-
-      resolver_context.CacheFileSystem(path_spec_object, file_system)
+      with resolver_context.GetFileSystemOpenLock(path_spec_object):
+        # Check the cache again in case the file system was opened while
+        # waiting for the lock, without counting the cache miss twice.
+        # pylint: disable=protected-access
+        file_system = resolver_context._LookupFileSystem(path_spec_object)
+        if not file_system:
+          file_system = cls._OpenNewFileSystem(
+              path_spec_object, resolver_context)
 
     return file_system
@@ -153,6 +153,42 @@ class APFSFileEntry(file_entry.FileEntry):
         yield APFSFileEntry(
             self._resolver_context, self._file_system, path_spec)
 
+  def _LookupBackEndFileEntry(self, location):
+    """Looks up a back-end file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      tuple[bool, pyfsapfs.file_entry]: True if the back end supports the lookup
+          and the back-end file entry or None if not available.
+
+    Raises:
+      IOError: if the back-end file entry could not be looked up.
+      OSError: if the back-end file entry could not be looked up.
+    """
+    path_spec = apfs_path_spec.APFSPathSpec(
+        location=location, parent=self.path_spec.parent)
+    return True, self._file_system.GetAPFSFileEntryByPathSpec(path_spec)
+
+  def _NewSubFileEntry(self, location, fsapfs_file_entry):
+    """Creates a sub file entry from a back-end file entry.
+
+    Args:
+      location (str): location of the sub file entry.
+      fsapfs_file_entry (pyfsapfs.file_entry): back-end file entry.
+
+    Returns:
+      APFSFileEntry: a sub file entry.
+    """
+    path_spec = apfs_path_spec.APFSPathSpec(
+        identifier=fsapfs_file_entry.identifier,
+        location=location, parent=self.path_spec.parent)
+
+    return APFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsapfs_file_entry=fsapfs_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
@@ -8,6 +8,7 @@ from dfvfs.path import apfs_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 from dfvfs.vfs import apfs_file_entry
+from dfvfs.vfs import walk_record
 
 
 class APFSFileSystem(file_system.FileSystem):
@@ -35,6 +36,65 @@ class APFSFileSystem(file_system.FileSystem):
     """
     self._fsapfs_volume = None
 
+  def _GetWalkRecord(self, fsapfs_file_entry, name, path, parent_identifier):
+    """Retrieves a walk record from a pyfsapfs file entry.
+
+    Args:
+      fsapfs_file_entry (pyfsapfs.file_entry): APFS file entry.
+      name (str): name of the file entry.
+      path (str): path of the file entry or None if not available.
+      parent_identifier (int): identifier of the parent file entry or None
+          if not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    # pylint: disable=protected-access
+    entry_type = apfs_file_entry.APFSFileEntry._ENTRY_TYPES.get(
+        fsapfs_file_entry.file_mode & 0xf000, None)
+
+    return walk_record.WalkRecord(
+        name, path, identifier=fsapfs_file_entry.identifier,
+        parent_identifier=parent_identifier, entry_type=entry_type,
+        size=fsapfs_file_entry.size,
+        access_time=fsapfs_file_entry.get_access_time_as_integer(),
+        change_time=fsapfs_file_entry.get_inode_change_time_as_integer(),
+        creation_time=fsapfs_file_entry.get_creation_time_as_integer(),
+        modification_time=fsapfs_file_entry.get_modification_time_as_integer())
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    Args:
+      file_entry (APFSFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    fsapfs_file_entry = file_entry.GetAPFSFileEntry()
+    record = self._GetWalkRecord(
+        fsapfs_file_entry, file_entry.name,
+        getattr(file_entry.path_spec, 'location', None), None)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append((fsapfs_file_entry, record))
+
+    while directories:
+      fsapfs_file_entry, parent_record = directories.pop()
+
+      for fsapfs_sub_file_entry in fsapfs_file_entry.sub_file_entries:
+        name = fsapfs_sub_file_entry.name
+        record = self._GetWalkRecord(
+            fsapfs_sub_file_entry, name,
+            self._JoinWalkPath(parent_record.path, name),
+            parent_record.identifier)
+        yield record
+
+        if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append((fsapfs_sub_file_entry, record))
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -176,6 +176,42 @@ class EXTFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield EXTFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def _LookupBackEndFileEntry(self, location):
+    """Looks up a back-end file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      tuple[bool, pyfsext.file_entry]: True if the back end supports the lookup
+          and the back-end file entry or None if not available.
+
+    Raises:
+      IOError: if the back-end file entry could not be looked up.
+      OSError: if the back-end file entry could not be looked up.
+    """
+    path_spec = ext_path_spec.EXTPathSpec(
+        location=location, parent=self.path_spec.parent)
+    return True, self._file_system.GetEXTFileEntryByPathSpec(path_spec)
+
+  def _NewSubFileEntry(self, location, fsext_file_entry):
+    """Creates a sub file entry from a back-end file entry.
+
+    Args:
+      location (str): location of the sub file entry.
+      fsext_file_entry (pyfsext.file_entry): back-end file entry.
+
+    Returns:
+      EXTFileEntry: a sub file entry.
+    """
+    path_spec = ext_path_spec.EXTPathSpec(
+        inode=fsext_file_entry.inode_number,
+        location=location, parent=self.path_spec.parent)
+
+    return EXTFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsext_file_entry=fsext_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
@@ -9,6 +9,7 @@ from dfvfs.path import ext_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 from dfvfs.vfs import ext_file_entry
+from dfvfs.vfs import walk_record
 
 
 class EXTFileSystem(file_system.FileSystem):
@@ -38,6 +39,68 @@ class EXTFileSystem(file_system.FileSystem):
     self._fsext_volume = None
     self._file_object = None
 
+  def _GetWalkRecord(self, fsext_file_entry, name, path, parent_identifier):
+    """Retrieves a walk record from a pyfsext file entry.
+
+    Args:
+      fsext_file_entry (pyfsext.file_entry): EXT file entry.
+      name (str): name of the file entry.
+      path (str): path of the file entry or None if not available.
+      parent_identifier (int): inode number of the parent file entry or None
+          if not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    # pylint: disable=protected-access
+    entry_type = ext_file_entry.EXTFileEntry._ENTRY_TYPES.get(
+        fsext_file_entry.file_mode & 0xf000, None)
+
+    # Creation time can be None if not present and 0 if not set.
+    creation_time = fsext_file_entry.get_creation_time_as_integer() or None
+
+    return walk_record.WalkRecord(
+        name, path, identifier=fsext_file_entry.inode_number,
+        parent_identifier=parent_identifier, entry_type=entry_type,
+        size=fsext_file_entry.size,
+        access_time=fsext_file_entry.get_access_time_as_integer(),
+        change_time=fsext_file_entry.get_inode_change_time_as_integer(),
+        creation_time=creation_time,
+        modification_time=fsext_file_entry.get_modification_time_as_integer())
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    Args:
+      file_entry (EXTFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    fsext_file_entry = file_entry.GetEXTFileEntry()
+    record = self._GetWalkRecord(
+        fsext_file_entry, file_entry.name,
+        getattr(file_entry.path_spec, 'location', None), None)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append((fsext_file_entry, record))
+
+    while directories:
+      fsext_file_entry, parent_record = directories.pop()
+
+      for fsext_sub_file_entry in fsext_file_entry.sub_file_entries:
+        name = fsext_sub_file_entry.name
+        record = self._GetWalkRecord(
+            fsext_sub_file_entry, name,
+            self._JoinWalkPath(parent_record.path, name),
+            parent_record.identifier)
+        yield record
+
+        if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append((fsext_sub_file_entry, record))
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -7,6 +7,7 @@ a directory or file system metadata.
 
 import abc
 
+from dfvfs.file_io import extents_file_io
 from dfvfs.lib import decorators
 from dfvfs.lib import definitions
 from dfvfs.resolver import resolver
@@ -95,6 +96,22 @@ class FileEntry(object):
       Directory: a directory.
     """
 
+  def _GetExtentsDataStreamSize(self, data_stream_object):
+    """Retrieves the size of a data stream that can be read from its extents.
+
+    The data of a data stream can only be read directly from its extents when
+    the data is stored unmodified in the extents, that is when the data stream
+    is not resident, compressed or encrypted.
+
+    Args:
+      data_stream_object (DataStream): data stream.
+
+    Returns:
+      int: size of the data stream or None if the data stream cannot be read
+          from its extents.
+    """
+    return None
+
   def _GetLink(self):
     """Retrieves the link.
 
@@ -182,6 +199,78 @@ class FileEntry(object):
       FileEntry: a sub file entry.
     """
 
+  def _LookupBackEndFileEntry(self, location):
+    """Looks up a back-end file entry by location.
+
+    File entries of back ends that can look up a file entry by location,
+    without reading all the sub file entries of its parent, should override
+    this method and _NewSubFileEntry.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      tuple[bool, object]: True if the back end supports the lookup and
+          the back-end file entry or None if not available.
+
+    Raises:
+      IOError: if the back-end file entry could not be looked up.
+      OSError: if the back-end file entry could not be looked up.
+    """
+    return False, None
+
+  def _LookupSubFileEntryByName(self, name):
+    """Looks up a sub file entry by name in the back end.
+
+    The sub file entry is looked up by location, which for most back ends uses
+    the directory indexes of the file system, instead of reading all the sub
+    file entries. The lookup can be case sensitive or case insensitive
+    depending on the back end.
+
+    Args:
+      name (str): name of the sub file entry.
+
+    Returns:
+      tuple[bool, FileEntry]: True if the back end supports the lookup and
+          the sub file entry or None if not available.
+    """
+    location = getattr(self.path_spec, 'location', None)
+    if (self.entry_type != definitions.FILE_ENTRY_TYPE_DIRECTORY or
+        location is None):
+      return False, None
+
+    # Names that cannot be looked up by location are left to the name index.
+    if (not name or name in ('.', '..') or
+        self._file_system.PATH_SEPARATOR in name):
+      return False, None
+
+    sub_location = self._file_system.JoinPath([location, name])
+
+    try:
+      is_supported, back_end_file_entry = self._LookupBackEndFileEntry(
+          sub_location)
+    except (IOError, OSError):
+      return False, None
+
+    if not is_supported or not back_end_file_entry:
+      return is_supported, None
+
+    sub_location = self._file_system.JoinPath([
+        location, back_end_file_entry.name])
+    return True, self._NewSubFileEntry(sub_location, back_end_file_entry)
+
+  def _NewSubFileEntry(self, location, back_end_file_entry):
+    """Creates a sub file entry from a back-end file entry.
+
+    Args:
+      location (str): location of the sub file entry.
+      back_end_file_entry (object): back-end file entry.
+
+    Returns:
+      FileEntry: a sub file entry.
+    """
+    return None
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
@@ -316,6 +405,57 @@ class FileEntry(object):
     """
     return []
 
+  def GetExtentsFileObject(self, data_stream_name=''):
+    """Retrieves a file-like object that reads a data stream from its extents.
+
+    The file-like object reads the data directly from the file-like object
+    that contains the file system, such as a volume, which bypasses the file
+    system back end. This is only supported for data streams that are not
+    resident, compressed or encrypted.
+
+    Args:
+      data_stream_name (Optional[str]): name of the data stream, where an empty
+          string represents the default data stream.
+
+    Returns:
+      ExtentsFile: a file-like object or None if the data stream is not
+          available or cannot be read from its extents.
+    """
+    data_stream_object = self.GetDataStream(data_stream_name)
+    if not data_stream_object:
+      return None
+
+    data_stream_size = self._GetExtentsDataStreamSize(data_stream_object)
+    if data_stream_size is None:
+      return None
+
+    extents_size = 0
+    extents = data_stream_object.GetExtents()
+    for data_stream_extent in extents:
+      if data_stream_extent.extent_type not in (
+          definitions.EXTENT_TYPE_DATA, definitions.EXTENT_TYPE_SPARSE):
+        return None
+
+      extents_size += data_stream_extent.size
+
+    # The data is stored elsewhere, for example inline in the metadata.
+    if extents_size < data_stream_size:
+      return None
+
+    parent_path_spec = getattr(self.path_spec, 'parent', None)
+    if not parent_path_spec:
+      return None
+
+    file_object = resolver.Resolver.OpenFileObject(
+        parent_path_spec, resolver_context=self._resolver_context)
+
+    extents_file_object = extents_file_io.ExtentsFile(
+        self._resolver_context, self.path_spec, file_object, extents,
+        data_stream_size)
+    extents_file_object.Open()
+
+    return extents_file_object
+
   def GetFileObject(self, data_stream_name=''):
     """Retrieves a file-like object of a specific data stream.
 
@@ -356,9 +496,40 @@ class FileEntry(object):
     """
     return None
 
+  def GetSubFileEntriesByName(self, name, case_sensitive=True):
+    """Retrieves the sub file entries that match a name.
+
+    Case insensitive, a name can match multiple sub file entries, such as
+    "Foo" and "foo", which are looked up in the name index of the sub file
+    entries.
+
+    Args:
+      name (str): name of the file entry.
+      case_sensitive (Optional[bool]): True if the name is case sensitive.
+
+    Yields:
+      FileEntry: a sub file entry.
+    """
+    if case_sensitive:
+      sub_file_entry = self.GetSubFileEntryByName(name)
+      if sub_file_entry:
+        yield sub_file_entry
+
+    else:
+      _, lower_case_names = self._file_system.GetSubFileEntryNameIndex(self)
+
+      for path_spec in lower_case_names.get(name.lower(), []):
+        sub_file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+        if sub_file_entry:
+          yield sub_file_entry
+
   def GetSubFileEntryByName(self, name, case_sensitive=True):
     """Retrieves a sub file entry by name.
 
+    The sub file entry is looked up in the back end if supported, otherwise
+    in the name index of the sub file entries, which is cached by the file
+    system.
+
     Args:
       name (str): name of the file entry.
       case_sensitive (Optional[bool]): True if the name is case sensitive.
@@ -366,18 +537,33 @@ class FileEntry(object):
     Returns:
       FileEntry: a file entry or None if not available.
     """
-    name_lower = name.lower()
-    matching_sub_file_entry = None
-
-    for sub_file_entry in self.sub_file_entries:
-      if sub_file_entry.name == name:
-        return sub_file_entry
-
-      if not case_sensitive and sub_file_entry.name.lower() == name_lower:
-        if not matching_sub_file_entry:
-          matching_sub_file_entry = sub_file_entry
+    is_supported, sub_file_entry = self._LookupSubFileEntryByName(name)
+    if is_supported:
+      if sub_file_entry:
+        if sub_file_entry.name == name:
+          return sub_file_entry
+
+        if (not case_sensitive and
+            sub_file_entry.name.lower() == name.lower()):
+          return sub_file_entry
+
+      # Since the lookup in the back end is either case sensitive or case
+      # insensitive, an exact match does not exist.
+      elif case_sensitive:
+        return None
+
+    names, lower_case_names = self._file_system.GetSubFileEntryNameIndex(self)
+
+    path_spec = names.get(name, None)
+    if not path_spec and not case_sensitive:
+      path_specs = lower_case_names.get(name.lower(), None)
+      if path_specs:
+        path_spec = path_specs[0]
+
+    if not path_spec:
+      return None
 
-    return matching_sub_file_entry
+    return self._file_system.GetFileEntryByPathSpec(path_spec)
 
   @decorators.deprecated
   def GetStat(self):
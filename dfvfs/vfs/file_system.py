@@ -2,8 +2,12 @@
 """The Virtual File System (VFS) file system interface."""
 
 import abc
+import collections
+
+from dfdatetime import definitions as dfdatetime_definitions
 
 from dfvfs.lib import decorators
+from dfvfs.vfs import walk_record
 
 
 class FileSystem(object):
@@ -17,6 +21,24 @@ class FileSystem(object):
 
   PATH_SEPARATOR = '/'
 
+  # Maximum number of directories of which the name index of the sub file
+  # entries is cached, where 0 disables caching.
+  _MAXIMUM_NUMBER_OF_NAME_INDEXES = 16
+
+  _NANOSECONDS_PER_SECOND = 1000000000
+
+  # Number of nanoseconds per fraction of second, per dfDateTime precision.
+  _NANOSECONDS_PER_FRACTION_OF_SECOND = {
+      dfdatetime_definitions.PRECISION_1_MILLISECOND: 1000000,
+      dfdatetime_definitions.PRECISION_10_MILLISECONDS: 10000000,
+      dfdatetime_definitions.PRECISION_100_MILLISECONDS: 100000000,
+      dfdatetime_definitions.PRECISION_1_MICROSECOND: 1000,
+      dfdatetime_definitions.PRECISION_10_MICROSECONDS: 10000,
+      dfdatetime_definitions.PRECISION_100_MICROSECONDS: 100000,
+      dfdatetime_definitions.PRECISION_1_NANOSECOND: 1,
+      dfdatetime_definitions.PRECISION_10_NANOSECONDS: 10,
+      dfdatetime_definitions.PRECISION_100_NANOSECONDS: 100}
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file system.
 
@@ -30,6 +52,7 @@ class FileSystem(object):
     """
     super(FileSystem, self).__init__()
     self._is_open = False
+    self._name_indexes = collections.OrderedDict()
     self._path_spec = path_spec
     self._resolver_context = resolver_context
 
@@ -55,6 +78,105 @@ class FileSystem(object):
       IOError: if the close failed.
     """
 
+  def _GetPosixTimeInNanoseconds(self, date_time):
+    """Retrieves a POSIX timestamp in nanoseconds from date and time values.
+
+    Args:
+      date_time (dfdatetime.DateTimeValues): date and time values.
+
+    Returns:
+      int: number of nanoseconds since 1970-01-01 00:00:00 or None if not
+          available.
+    """
+    if date_time is None:
+      return None
+
+    timestamp, fraction_of_second = (
+        date_time.CopyToPosixTimestampWithFractionOfSecond())
+    if timestamp is None:
+      return None
+
+    timestamp *= self._NANOSECONDS_PER_SECOND
+
+    nanoseconds_per_fraction_of_second = (
+        self._NANOSECONDS_PER_FRACTION_OF_SECOND.get(date_time.precision, None))
+    if fraction_of_second and nanoseconds_per_fraction_of_second:
+      timestamp += fraction_of_second * nanoseconds_per_fraction_of_second
+
+    return timestamp
+
+  def _GetWalkRecordFromFileEntry(self, file_entry, parent_identifier):
+    """Retrieves a walk record from a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      parent_identifier (int): identifier of the parent file entry or None if
+          not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    stat_attribute = file_entry.GetStatAttribute()
+    identifier = getattr(stat_attribute, 'inode_number', None)
+
+    return walk_record.WalkRecord(
+        file_entry.name, getattr(file_entry.path_spec, 'location', None),
+        identifier=identifier,
+        parent_identifier=parent_identifier,
+        entry_type=file_entry.entry_type, size=file_entry.size,
+        is_allocated=file_entry.IsAllocated(),
+        access_time=self._GetPosixTimeInNanoseconds(file_entry.access_time),
+        change_time=self._GetPosixTimeInNanoseconds(file_entry.change_time),
+        creation_time=self._GetPosixTimeInNanoseconds(
+            file_entry.creation_time),
+        modification_time=self._GetPosixTimeInNanoseconds(
+            file_entry.modification_time))
+
+  def _JoinWalkPath(self, path, name):
+    """Joins the path of a parent walk record with a name.
+
+    Args:
+      path (str): path of the parent walk record or None if not available.
+      name (str): name of the file entry or None if not available.
+
+    Returns:
+      str: path or None if not available.
+    """
+    if path is None or name is None:
+      return None
+
+    if path == self.PATH_SEPARATOR:
+      return ''.join([path, name])
+
+    return self.PATH_SEPARATOR.join([path, name])
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    This is the fall through implementation that creates a file entry for
+    every sub file entry. File systems that can retrieve the metadata
+    directly from their back-end should override this method.
+
+    Args:
+      file_entry (FileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    record = self._GetWalkRecordFromFileEntry(file_entry, None)
+    yield record
+
+    file_entries = [(file_entry, record.identifier)]
+    while file_entries:
+      file_entry, identifier = file_entries.pop()
+
+      for sub_file_entry in file_entry.sub_file_entries:
+        record = self._GetWalkRecordFromFileEntry(sub_file_entry, identifier)
+        yield record
+
+        if sub_file_entry.IsDirectory():
+          file_entries.append((sub_file_entry, record.identifier))
+
   @abc.abstractmethod
   def _Open(self, mode='rb'):
     """Opens the file system object defined by path specification.
@@ -200,6 +322,49 @@ class FileSystem(object):
       FileEntry: a file entry or None if not available.
     """
 
+  def GetSubFileEntryNameIndex(self, file_entry):
+    """Retrieves the name index of the sub file entries of a file entry.
+
+    The name index is built when first requested and is cached for the most
+    recently used directories.
+
+    Args:
+      file_entry (FileEntry): file entry, such as a directory.
+
+    Returns:
+      tuple[dict[str, PathSpec], dict[str, list[PathSpec]]]: path
+          specification of the sub file entries by name, where the first sub
+          file entry is used if multiple sub file entries have the same name,
+          and path specifications of all the sub file entries by lower case
+          name.
+    """
+    lookup_key = file_entry.path_spec.comparable
+
+    name_index = self._name_indexes.get(lookup_key, None)
+    if name_index:
+      self._name_indexes.move_to_end(lookup_key)
+      return name_index
+
+    names = {}
+    lower_case_names = {}
+    for sub_file_entry in file_entry.sub_file_entries:
+      name = sub_file_entry.name
+      if name is None:
+        continue
+
+      names.setdefault(name, sub_file_entry.path_spec)
+      lower_case_names.setdefault(name.lower(), []).append(
+          sub_file_entry.path_spec)
+
+    name_index = (names, lower_case_names)
+
+    if self._MAXIMUM_NUMBER_OF_NAME_INDEXES > 0:
+      self._name_indexes[lookup_key] = name_index
+      while len(self._name_indexes) > self._MAXIMUM_NUMBER_OF_NAME_INDEXES:
+        self._name_indexes.popitem(last=False)
+
+    return name_index
+
   def JoinPath(self, path_segments):
     """Joins the path segments into a path.
 
@@ -258,6 +423,32 @@ class FileSystem(object):
     self._Open(mode=mode)
     self._is_open = True
 
+  def Walk(self, path_spec=None):
+    """Walks the file system and retrieves metadata-only records.
+
+    Walking the file system is faster than retrieving the file entries since
+    most file systems retrieve the metadata directly from their back-end
+    without creating a file entry or path specification per file entry.
+
+    The records are yielded in depth-first order, where the record of
+    a directory is always yielded before the records of its sub file entries.
+
+    Args:
+      path_spec (Optional[PathSpec]): path specification of the file entry
+          to start the walk, where None represents the root file entry.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    if path_spec:
+      file_entry = self.GetFileEntryByPathSpec(path_spec)
+    else:
+      file_entry = self.GetRootFileEntry()
+
+    if file_entry:
+      for record in self._WalkFileEntry(file_entry):
+        yield record
+
   def SplitPath(self, path):
     """Splits the path into path segments.
 
@@ -190,6 +190,42 @@ class HFSFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield HFSFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def _LookupBackEndFileEntry(self, location):
+    """Looks up a back-end file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      tuple[bool, pyfshfs.file_entry]: True if the back end supports the lookup
+          and the back-end file entry or None if not available.
+
+    Raises:
+      IOError: if the back-end file entry could not be looked up.
+      OSError: if the back-end file entry could not be looked up.
+    """
+    path_spec = hfs_path_spec.HFSPathSpec(
+        location=location, parent=self.path_spec.parent)
+    return True, self._file_system.GetHFSFileEntryByPathSpec(path_spec)
+
+  def _NewSubFileEntry(self, location, fshfs_file_entry):
+    """Creates a sub file entry from a back-end file entry.
+
+    Args:
+      location (str): location of the sub file entry.
+      fshfs_file_entry (pyfshfs.file_entry): back-end file entry.
+
+    Returns:
+      HFSFileEntry: a sub file entry.
+    """
+    path_spec = hfs_path_spec.HFSPathSpec(
+        identifier=fshfs_file_entry.identifier,
+        location=location, parent=self.path_spec.parent)
+
+    return HFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fshfs_file_entry=fshfs_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
@@ -9,6 +9,7 @@ from dfvfs.path import hfs_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 from dfvfs.vfs import hfs_file_entry
+from dfvfs.vfs import walk_record
 
 
 class HFSFileSystem(file_system.FileSystem):
@@ -18,6 +19,9 @@ class HFSFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_HFS
 
+  # Number of seconds between 1904-01-01 and 1970-01-01.
+  _HFS_TO_POSIX_TIME_DELTA = 2082844800
+
   def __init__(self, resolver_context, path_spec):
     """Initializes an HFS file system.
 
@@ -38,6 +42,86 @@ class HFSFileSystem(file_system.FileSystem):
     self._fshfs_volume = None
     self._file_object = None
 
+  def _GetPosixTimeFromHFSTime(self, timestamp):
+    """Retrieves a POSIX timestamp in nanoseconds from a HFS timestamp.
+
+    Args:
+      timestamp (int): HFS timestamp, which contains the number of seconds
+          since 1904-01-01 00:00:00, or None if not available.
+
+    Returns:
+      int: number of nanoseconds since 1970-01-01 00:00:00 or None if not
+          available.
+    """
+    if timestamp is None:
+      return None
+
+    return (timestamp - self._HFS_TO_POSIX_TIME_DELTA) * (
+        self._NANOSECONDS_PER_SECOND)
+
+  def _GetWalkRecord(self, fshfs_file_entry, name, path, parent_identifier):
+    """Retrieves a walk record from a pyfshfs file entry.
+
+    Args:
+      fshfs_file_entry (pyfshfs.file_entry): HFS file entry.
+      name (str): name of the file entry.
+      path (str): path of the file entry or None if not available.
+      parent_identifier (int): identifier of the parent file entry or None
+          if not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    # pylint: disable=protected-access
+    entry_type = hfs_file_entry.HFSFileEntry._ENTRY_TYPES.get(
+        fshfs_file_entry.file_mode & 0xf000, None)
+
+    return walk_record.WalkRecord(
+        name, path, identifier=fshfs_file_entry.identifier,
+        parent_identifier=parent_identifier, entry_type=entry_type,
+        size=fshfs_file_entry.size,
+        access_time=self._GetPosixTimeFromHFSTime(
+            fshfs_file_entry.get_access_time_as_integer()),
+        change_time=self._GetPosixTimeFromHFSTime(
+            fshfs_file_entry.get_entry_modification_time_as_integer()),
+        creation_time=self._GetPosixTimeFromHFSTime(
+            fshfs_file_entry.get_creation_time_as_integer()),
+        modification_time=self._GetPosixTimeFromHFSTime(
+            fshfs_file_entry.get_modification_time_as_integer()))
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    Args:
+      file_entry (HFSFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    fshfs_file_entry = file_entry.GetHFSFileEntry()
+    record = self._GetWalkRecord(
+        fshfs_file_entry, file_entry.name,
+        getattr(file_entry.path_spec, 'location', None), None)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append((fshfs_file_entry, record))
+
+    while directories:
+      fshfs_file_entry, parent_record = directories.pop()
+
+      for fshfs_sub_file_entry in fshfs_file_entry.sub_file_entries:
+        name = fshfs_sub_file_entry.name
+        record = self._GetWalkRecord(
+            fshfs_sub_file_entry, name,
+            self._JoinWalkPath(parent_record.path, name),
+            parent_record.identifier)
+        yield record
+
+        if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append((fshfs_sub_file_entry, record))
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -25,6 +25,8 @@ class NTFSFileEntry(file_entry.FileEntry):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_NTFS
 
+  _ATTRIBUTE_TYPE_DATA = 0x00000080
+
   _ATTRIBUTE_TYPE_CLASS_MAPPINGS = {
       0x00000010: ntfs_attribute.StandardInformationNTFSAttribute,
       0x00000030: ntfs_attribute.FileNameNTFSAttribute,
@@ -116,6 +118,35 @@ class NTFSFileEntry(file_entry.FileEntry):
 
     return ntfs_directory.NTFSDirectory(self._file_system, self.path_spec)
 
+  def _GetExtentsDataStreamSize(self, data_stream_object):
+    """Retrieves the size of a data stream that can be read from its extents.
+
+    Args:
+      data_stream_object (NTFSDataStream): data stream.
+
+    Returns:
+      int: size of the data stream or None if the data stream cannot be read
+          from its extents.
+    """
+    file_attribute_flags = self._fsntfs_file_entry.file_attribute_flags or 0
+    if file_attribute_flags & (
+        pyfsntfs.file_attribute_flags.COMPRESSED |
+        pyfsntfs.file_attribute_flags.ENCRYPTED):
+      return None
+
+    attribute_name = data_stream_object.name or None
+    for fsntfs_attribute in self._fsntfs_file_entry.attributes:
+      if (fsntfs_attribute.attribute_type == self._ATTRIBUTE_TYPE_DATA and
+          fsntfs_attribute.attribute_name == attribute_name):
+        # Data beyond the valid data size is not necessarily zero-filled in
+        # the extents.
+        if fsntfs_attribute.valid_data_size < fsntfs_attribute.data_size:
+          return None
+
+        return fsntfs_attribute.data_size
+
+    return None
+
   def _GetLink(self):
     """Retrieves the link.
 
@@ -190,6 +221,45 @@ class NTFSFileEntry(file_entry.FileEntry):
     return bool(
         file_attribute_flags & pyfsntfs.file_attribute_flags.REPARSE_POINT)
 
+  def _LookupBackEndFileEntry(self, location):
+    """Looks up a back-end file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      tuple[bool, pyfsntfs.file_entry]: True if the back end supports the lookup
+          and the back-end file entry or None if not available.
+
+    Raises:
+      IOError: if the back-end file entry could not be looked up.
+      OSError: if the back-end file entry could not be looked up.
+    """
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=location, parent=self.path_spec.parent)
+    return True, self._file_system.GetNTFSFileEntryByPathSpec(path_spec)
+
+  def _NewSubFileEntry(self, location, fsntfs_file_entry):
+    """Creates a sub file entry from a back-end file entry.
+
+    Args:
+      location (str): location of the sub file entry.
+      fsntfs_file_entry (pyfsntfs.file_entry): back-end file entry.
+
+    Returns:
+      NTFSFileEntry: a sub file entry.
+    """
+    file_reference = fsntfs_file_entry.file_reference
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=location,
+        mft_attribute=fsntfs_file_entry.name_attribute_index,
+        mft_entry=file_reference & self._FILE_REFERENCE_MFT_ENTRY_BITMASK,
+        parent=self.path_spec.parent)
+
+    return NTFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsntfs_file_entry=fsntfs_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
@@ -9,6 +9,7 @@ from dfvfs.path import ntfs_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 from dfvfs.vfs import ntfs_file_entry
+from dfvfs.vfs import walk_record
 
 
 class NTFSFileSystem(file_system.FileSystem):
@@ -21,6 +22,20 @@ class NTFSFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_NTFS
 
+  _FILE_NAME_ATTRIBUTE_TYPE = 0x00000030
+
+  # Name space of a $FILE_NAME attribute that only contains a DOS (8.3) name.
+  _FILE_NAME_SPACE_DOS = 2
+
+  # Number of 100th nano seconds between 1601-01-01 and 1970-01-01.
+  _FILETIME_TO_POSIX_TIME_DELTA = 116444736000000000
+
+  _FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
+
+  # Maximum number of parent directories that are resolved for a location
+  # to protect against cycles in corrupted file systems.
+  _MAXIMUM_DIRECTORY_DEPTH = 1024
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file system object.
 
@@ -67,6 +82,220 @@ class NTFSFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._fsntfs_volume = fsntfs_volume
 
+  def _GetDirectoryLocation(
+      self, file_reference, directories, directory_locations):
+    """Retrieves the location of a directory from the MFT entry names.
+
+    Args:
+      file_reference (int): NTFS file reference of the directory.
+      directories (dict[int, tuple[str, int, int, bool]]): name, parent file
+          reference, sequence number and allocation status per MFT entry
+          of the directories that were read.
+      directory_locations (dict[int, str]): locations per MFT entry of
+          the directories of which the location was resolved.
+
+    Returns:
+      str: location of the directory or None if the location cannot be
+          resolved, for example because a parent directory has not been read
+          yet or was reallocated.
+    """
+    mft_entries = []
+    names = []
+
+    while len(mft_entries) < self._MAXIMUM_DIRECTORY_DEPTH:
+      mft_entry = file_reference & self._FILE_REFERENCE_MFT_ENTRY_BITMASK
+      sequence_number = file_reference >> 48
+
+      directory = directories.get(mft_entry, None)
+      if not directory:
+        return None
+
+      name, parent_file_reference, directory_sequence_number, is_allocated = (
+          directory)
+
+      # The sequence number of a MFT entry is increased when the entry is
+      # freed, hence deleted file entries can reference their deleted parent
+      # directory with the previous sequence number.
+      if sequence_number != directory_sequence_number and (
+          is_allocated or sequence_number != directory_sequence_number - 1):
+        return None
+
+      location = directory_locations.get(mft_entry, None)
+      if location is not None:
+        break
+
+      if mft_entry in mft_entries:
+        return None
+
+      mft_entries.append(mft_entry)
+      names.append(name)
+      file_reference = parent_file_reference
+
+    else:
+      return None
+
+    for mft_entry, name in zip(reversed(mft_entries), reversed(names)):
+      location = self._JoinLocationAndName(location, name)
+      directory_locations[mft_entry] = location
+
+    return location
+
+  def _GetFileNames(self, fsntfs_file_entry):
+    """Retrieves the names of a NTFS file entry.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+
+    Returns:
+      list[tuple[int, str, int]]: attribute index, name and parent file
+          reference of the $FILE_NAME attributes, except for DOS names.
+    """
+    file_names = []
+    for attribute_index, fsntfs_attribute in enumerate(
+        fsntfs_file_entry.attributes):
+      if fsntfs_attribute.attribute_type != self._FILE_NAME_ATTRIBUTE_TYPE:
+        continue
+
+      if fsntfs_attribute.name_space == self._FILE_NAME_SPACE_DOS:
+        continue
+
+      file_names.append((
+          attribute_index, fsntfs_attribute.name,
+          fsntfs_attribute.parent_file_reference))
+
+    return file_names
+
+  def _GetPosixTimeFromFiletime(self, timestamp):
+    """Retrieves a POSIX timestamp in nanoseconds from a FILETIME timestamp.
+
+    Args:
+      timestamp (int): FILETIME timestamp, which contains the number of
+          100th nano seconds since 1601-01-01 00:00:00, or None if not
+          available.
+
+    Returns:
+      int: number of nanoseconds since 1970-01-01 00:00:00 or None if not
+          available.
+    """
+    if timestamp is None:
+      return None
+
+    return (timestamp - self._FILETIME_TO_POSIX_TIME_DELTA) * 100
+
+  def _GetWalkRecord(self, fsntfs_file_entry, name, path, parent_identifier):
+    """Retrieves a walk record from a pyfsntfs file entry.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+      name (str): name of the file entry.
+      path (str): path of the file entry or None if not available.
+      parent_identifier (int): MFT entry number of the parent file entry or
+          None if not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    file_attribute_flags = fsntfs_file_entry.file_attribute_flags
+    if file_attribute_flags is not None and (
+        file_attribute_flags & pyfsntfs.file_attribute_flags.REPARSE_POINT):
+      entry_type = definitions.FILE_ENTRY_TYPE_LINK
+    elif fsntfs_file_entry.has_directory_entries_index():
+      entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
+    else:
+      entry_type = definitions.FILE_ENTRY_TYPE_FILE
+
+    mft_entry = (
+        fsntfs_file_entry.file_reference &
+        self._FILE_REFERENCE_MFT_ENTRY_BITMASK)
+
+    return walk_record.WalkRecord(
+        name, path, identifier=mft_entry, parent_identifier=parent_identifier,
+        entry_type=entry_type, size=fsntfs_file_entry.size,
+        is_allocated=fsntfs_file_entry.is_allocated(),
+        access_time=self._GetPosixTimeFromFiletime(
+            fsntfs_file_entry.get_access_time_as_integer()),
+        change_time=self._GetPosixTimeFromFiletime(
+            fsntfs_file_entry.get_entry_modification_time_as_integer()),
+        creation_time=self._GetPosixTimeFromFiletime(
+            fsntfs_file_entry.get_creation_time_as_integer()),
+        modification_time=self._GetPosixTimeFromFiletime(
+            fsntfs_file_entry.get_modification_time_as_integer()))
+
+  def _JoinLocationAndName(self, location, name):
+    """Joins a directory location and the name of a directory entry.
+
+    This is faster than JoinPath since the location is already normalized.
+
+    Args:
+      location (str): location of the directory.
+      name (str): name of the directory entry.
+
+    Returns:
+      str: location of the directory entry.
+    """
+    if location == self.LOCATION_ROOT:
+      return ''.join([self.PATH_SEPARATOR, name])
+
+    return self.PATH_SEPARATOR.join([location, name])
+
+  def _NewFileEntryInMFTOrder(
+      self, fsntfs_file_entry, mft_entry, mft_attribute, location):
+    """Creates a new file entry found during MFT order enumeration.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+      mft_entry (int): MFT entry.
+      mft_attribute (int): index of the $FILE_NAME attribute.
+      location (str): location or None if not available.
+
+    Returns:
+      NTFSFileEntry: file entry.
+    """
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=location, mft_attribute=mft_attribute, mft_entry=mft_entry,
+        parent=self._path_spec.parent)
+    return ntfs_file_entry.NTFSFileEntry(
+        self._resolver_context, self, path_spec,
+        fsntfs_file_entry=fsntfs_file_entry)
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    Args:
+      file_entry (NTFSFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    fsntfs_file_entry = file_entry.GetNTFSFileEntry()
+    record = self._GetWalkRecord(
+        fsntfs_file_entry, file_entry.name,
+        getattr(file_entry.path_spec, 'location', None), None)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append((fsntfs_file_entry, record))
+
+    while directories:
+      fsntfs_file_entry, parent_record = directories.pop()
+
+      for fsntfs_sub_file_entry in fsntfs_file_entry.sub_file_entries:
+        name = fsntfs_sub_file_entry.name
+
+        # Ignore references to self or parent.
+        if name in ('.', '..'):
+          continue
+
+        record = self._GetWalkRecord(
+            fsntfs_sub_file_entry, name,
+            self._JoinWalkPath(parent_record.path, name),
+            parent_record.identifier)
+        yield record
+
+        if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append((fsntfs_sub_file_entry, record))
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -139,6 +368,101 @@ class NTFSFileSystem(file_system.FileSystem):
         self._resolver_context, self, path_spec,
         fsntfs_file_entry=fsntfs_file_entry)
 
+  def GetFileEntriesInMFTOrder(self, include_deleted=False):
+    """Retrieves the file entries in the order of the MFT.
+
+    Instead of walking the file system directory by directory, which reads
+    MFT entries in a random order, the MFT entries are read sequentially.
+    The locations of the file entries are resolved from the names and
+    parent file references of the directories that were read before. File
+    entries of which a parent directory is stored after them in the MFT are
+    returned after all MFT entries have been read.
+
+    A file entry is returned for every name of a file entry, except DOS
+    names, hence hard linked files are returned once per name. Extension MFT
+    entries are not returned as separate file entries.
+
+    Args:
+      include_deleted (Optional[bool]): True if deleted file entries, those
+          stored in unallocated MFT entries, should be returned as well.
+          The location of a deleted file entry is None if its parent
+          directory cannot be resolved.
+
+    Yields:
+      NTFSFileEntry: file entry.
+
+    Raises:
+      BackEndError: if the root directory cannot be read.
+    """
+    try:
+      fsntfs_root_directory = self._fsntfs_volume.get_root_directory()
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    root_file_reference = fsntfs_root_directory.file_reference
+
+    directories = {
+        self.MFT_ENTRY_ROOT_DIRECTORY: (
+            '', root_file_reference, root_file_reference >> 48, True)}
+    directory_locations = {self.MFT_ENTRY_ROOT_DIRECTORY: self.LOCATION_ROOT}
+
+    yield self.GetRootFileEntry()
+
+    unresolved_file_names = []
+    for mft_entry in range(self._fsntfs_volume.number_of_file_entries):
+      if mft_entry == self.MFT_ENTRY_ROOT_DIRECTORY:
+        continue
+
+      try:
+        fsntfs_file_entry = self._fsntfs_volume.get_file_entry(mft_entry)
+      except IOError:
+        continue
+
+      if (fsntfs_file_entry.is_empty() or
+          fsntfs_file_entry.base_record_file_reference):
+        continue
+
+      is_allocated = fsntfs_file_entry.is_allocated()
+      if not is_allocated and not include_deleted:
+        continue
+
+      file_names = self._GetFileNames(fsntfs_file_entry)
+      if not file_names:
+        continue
+
+      if fsntfs_file_entry.has_directory_entries_index():
+        _, name, parent_file_reference = file_names[0]
+        directories[mft_entry] = (
+            name, parent_file_reference,
+            fsntfs_file_entry.file_reference >> 48, is_allocated)
+
+      for mft_attribute, name, parent_file_reference in file_names:
+        location = self._GetDirectoryLocation(
+            parent_file_reference, directories, directory_locations)
+        if location is None:
+          unresolved_file_names.append((
+              mft_entry, mft_attribute, name, parent_file_reference))
+          continue
+
+        location = self._JoinLocationAndName(location, name)
+        yield self._NewFileEntryInMFTOrder(
+            fsntfs_file_entry, mft_entry, mft_attribute, location)
+
+    for mft_entry, mft_attribute, name, parent_file_reference in (
+        unresolved_file_names):
+      try:
+        fsntfs_file_entry = self._fsntfs_volume.get_file_entry(mft_entry)
+      except IOError:
+        continue
+
+      location = self._GetDirectoryLocation(
+          parent_file_reference, directories, directory_locations)
+      if location is not None:
+        location = self._JoinLocationAndName(location, name)
+
+      yield self._NewFileEntryInMFTOrder(
+          fsntfs_file_entry, mft_entry, mft_attribute, location)
+
   def GetNTFSFileEntryByPathSpec(self, path_spec):
     """Retrieves the NTFS file entry for a path specification.
 
@@ -20,6 +20,25 @@ class OSDirectory(directory.Directory):
     Yields:
       OSPathSpec: a path specification.
 
+    Raises:
+      AccessError: if the access to list the directory was denied.
+      BackEndError: if the directory could not be listed.
+    """
+    for path_spec, _ in self.GetOSDirectoryEntries():
+      yield path_spec
+
+  def GetOSDirectoryEntries(self):
+    """Retrieves directory entries and their operating system directory entry.
+
+    os.scandir() already retrieves the type of a directory entry, and on
+    Windows also its stat information, when listing the directory, hence
+    these can be used to create sub file entries without additional system
+    calls.
+
+    Yields:
+      tuple[OSPathSpec, os.DirEntry]: path specification and operating system
+          directory entry.
+
     Raises:
       AccessError: if the access to list the directory was denied.
       BackEndError: if the directory could not be listed.
@@ -28,13 +47,16 @@ class OSDirectory(directory.Directory):
     if location is not None:
       # Windows will raise WindowsError, which can be caught by OSError,
       # if the process has no access to list the directory. The os.access()
-      # function cannot be used since it will return true even when os.listdir()
-      # fails.
+      # function cannot be used since it will return true even when
+      # os.scandir() fails.
       try:
-        for directory_entry in os.listdir(location):
-          directory_entry_location = self._file_system.JoinPath([
-              location, directory_entry])
-          yield os_path_spec.OSPathSpec(location=directory_entry_location)
+        with os.scandir(location) as scandir_iterator:
+          for os_directory_entry in scandir_iterator:
+            directory_entry_location = self._file_system.JoinPath([
+                location, os_directory_entry.name])
+            path_spec = os_path_spec.OSPathSpec(
+                location=directory_entry_location)
+            yield path_spec, os_directory_entry
 
       # Note that PermissionError needs to be defined before OSError.
       except PermissionError as exception:
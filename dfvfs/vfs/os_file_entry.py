@@ -29,7 +29,9 @@ class OSFileEntry(file_entry.FileEntry):
 
   _OS_IS_WINDOWS = platform.system() == 'Windows'
 
-  def __init__(self, resolver_context, file_system, path_spec, is_root=False):
+  def __init__(
+      self, resolver_context, file_system, path_spec, is_root=False,
+      os_directory_entry=None):
     """Initializes a file entry.
 
     Args:
@@ -38,6 +40,9 @@ class OSFileEntry(file_entry.FileEntry):
       path_spec (PathSpec): path specification.
       is_root (Optional[bool]): True if the file entry is the root file entry
           of the corresponding file system.
+      os_directory_entry (Optional[os.DirEntry]): operating system directory
+          entry of the file entry, as retrieved by os.scandir(), which is used
+          to retrieve the stat information.
     """
     location = getattr(path_spec, 'location', None)
 
@@ -57,7 +62,13 @@ class OSFileEntry(file_entry.FileEntry):
       # a WindowsError can be raised as well. We are not catching that since
       # that error does not exist on non-Windows platforms.
       try:
-        stat_info = os.lstat(location)
+        if os_directory_entry:
+          stat_info = os_directory_entry.stat(follow_symlinks=False)
+
+        # On Windows the stat information of a directory entry does not
+        # contain the inode number, device and number of links.
+        if not stat_info or not stat_info.st_ino:
+          stat_info = os.lstat(location)
       except (IOError, OSError):
         stat_info = None
 
@@ -76,8 +87,11 @@ class OSFileEntry(file_entry.FileEntry):
       # If location contains a trailing segment separator and points to
       # a symbolic link to a directory stat info will not indicate
       # the file entry as a symbolic link. The following check ensures
-      # that the LINK type is correctly detected.
-      is_link = os.path.islink(location)
+      # that the LINK type is correctly detected. The location of
+      # a directory entry does not contain a trailing segment separator.
+      is_link = False
+      if not os_directory_entry:
+        is_link = os.path.islink(location)
 
       # The stat info member st_mode can have multiple types e.g.
       # LINK and DIRECTORY in case of a symbolic link to a directory
@@ -191,8 +205,11 @@ class OSFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield OSFileEntry(self._resolver_context, self._file_system, path_spec)
+      for path_spec, os_directory_entry in (
+          self._directory.GetOSDirectoryEntries()):
+        yield OSFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            os_directory_entry=os_directory_entry)
 
   @property
   def access_time(self):
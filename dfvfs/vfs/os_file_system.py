@@ -3,6 +3,7 @@
 
 import os
 import platform
+import stat
 
 import pysmdev
 
@@ -11,6 +12,7 @@ from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.vfs import file_system
 from dfvfs.vfs import os_file_entry
+from dfvfs.vfs import walk_record
 
 
 class OSFileSystem(file_system.FileSystem):
@@ -23,6 +25,22 @@ class OSFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_OS
 
+  # The name indexes of the sub file entries are not cached since the file
+  # system can change while it is being read.
+  _MAXIMUM_NUMBER_OF_NAME_INDEXES = 0
+
+  # Mappings of stat file types to dfVFS file entry types.
+  _ENTRY_TYPES = {
+      stat.S_IFBLK: definitions.FILE_ENTRY_TYPE_DEVICE,
+      stat.S_IFCHR: definitions.FILE_ENTRY_TYPE_DEVICE,
+      stat.S_IFDIR: definitions.FILE_ENTRY_TYPE_DIRECTORY,
+      stat.S_IFIFO: definitions.FILE_ENTRY_TYPE_PIPE,
+      stat.S_IFLNK: definitions.FILE_ENTRY_TYPE_LINK,
+      stat.S_IFREG: definitions.FILE_ENTRY_TYPE_FILE,
+      stat.S_IFSOCK: definitions.FILE_ENTRY_TYPE_SOCKET}
+
+  _OS_IS_WINDOWS = platform.system() == 'Windows'
+
   def _Close(self):
     """Closes the file system.
 
@@ -31,6 +49,45 @@ class OSFileSystem(file_system.FileSystem):
     """
     return
 
+  def _GetWalkRecord(self, os_directory_entry, parent_identifier):
+    """Retrieves a walk record from an operating system directory entry.
+
+    Args:
+      os_directory_entry (os.DirEntry): operating system directory entry.
+      parent_identifier (int): inode number of the parent file entry or None
+          if not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    try:
+      stat_info = os_directory_entry.stat(follow_symlinks=False)
+    except OSError:
+      return walk_record.WalkRecord(
+          os_directory_entry.name, os_directory_entry.path,
+          parent_identifier=parent_identifier)
+
+    # Per Python os.stat() documentation the value of stat_results.st_ctime
+    # contains the creation time on Windows.
+    if self._OS_IS_WINDOWS:
+      change_time = None
+      creation_time = stat_info.st_ctime_ns
+    else:
+      change_time = stat_info.st_ctime_ns
+      creation_time = getattr(stat_info, 'st_birthtime_ns', None)
+      if creation_time is None:
+        creation_time = getattr(stat_info, 'st_birthtime', None)
+        if creation_time is not None:
+          creation_time = int(creation_time) * self._NANOSECONDS_PER_SECOND
+
+    return walk_record.WalkRecord(
+        os_directory_entry.name, os_directory_entry.path,
+        identifier=stat_info.st_ino, parent_identifier=parent_identifier,
+        entry_type=self._ENTRY_TYPES.get(stat.S_IFMT(stat_info.st_mode), None),
+        size=stat_info.st_size, access_time=stat_info.st_atime_ns,
+        change_time=change_time, creation_time=creation_time,
+        modification_time=stat_info.st_mtime_ns)
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -48,6 +105,56 @@ class OSFileSystem(file_system.FileSystem):
       raise errors.PathSpecError(
           'Unsupported path specification with parent.')
 
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    The directories are listed with os.scandir() and the metadata is read
+    from the directory entries, without creating a file entry or path
+    specification. Symbolic links to directories are not followed.
+
+    Args:
+      file_entry (OSFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+
+    Raises:
+      AccessError: if the access to list a directory was denied.
+      BackEndError: if a directory could not be listed.
+    """
+    record = self._GetWalkRecordFromFileEntry(file_entry, None)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append(record)
+
+    while directories:
+      parent_record = directories.pop()
+
+      # Windows will raise WindowsError, which can be caught by OSError,
+      # if the process has no access to list the directory.
+      try:
+        with os.scandir(parent_record.path) as scandir_iterator:
+          for os_directory_entry in scandir_iterator:
+            record = self._GetWalkRecord(
+                os_directory_entry, parent_record.identifier)
+            yield record
+
+            if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+              directories.append(record)
+
+      # Note that PermissionError needs to be defined before OSError.
+      except PermissionError as exception:
+        raise errors.AccessError(
+            'Access to directory: {0:s} denied with error: {1!s}'.format(
+                parent_record.path, exception))
+
+      except OSError as exception:
+        raise errors.BackEndError(
+            'Unable to list directory: {0:s} with error: {1!s}'.format(
+                parent_record.path, exception))
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -119,21 +119,16 @@ class TARFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      tar_file = self._file_system.GetTARFile()
-      if tar_file:
-        for path_spec in self._directory.entries:
-          location = getattr(path_spec, 'location', None)
-          if location is None:
-            continue
-
-          kwargs = {}
-          try:
-            kwargs['tar_info'] = tar_file.getmember(location[1:])
-          except KeyError:
-            kwargs['is_virtual'] = True
-
-          yield TARFileEntry(
-              self._resolver_context, self._file_system, path_spec, **kwargs)
+      for path_spec in self._directory.entries:
+        kwargs = {}
+        tar_info = self._file_system.GetTARInfoByPathSpec(path_spec)
+        if tar_info:
+          kwargs['tar_info'] = tar_info
+        else:
+          kwargs['is_virtual'] = True
+
+        yield TARFileEntry(
+            self._resolver_context, self._file_system, path_spec, **kwargs)
 
   @property
   def modification_time(self):
@@ -199,20 +194,6 @@ class TARFileEntry(file_entry.FileEntry):
       PathSpecError: if the path specification is incorrect.
     """
     if not self._tar_info:
-      location = getattr(self.path_spec, 'location', None)
-      if location is None:
-        raise errors.PathSpecError('Path specification missing location.')
-
-      if not location.startswith(self._file_system.LOCATION_ROOT):
-        raise errors.PathSpecError('Invalid location in path specification.')
-
-      if len(location) == 1:
-        return None
-
-      tar_file = self._file_system.GetTARFile()
-      try:
-        self._tar_info = tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+      self._tar_info = self._file_system.GetTARInfoByPathSpec(self.path_spec)
 
     return self._tar_info
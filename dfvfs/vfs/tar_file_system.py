@@ -31,7 +31,9 @@ class TARFileSystem(file_system.FileSystem):
     """
     super(TARFileSystem, self).__init__(resolver_context, path_spec)
     self._file_object = None
+    self._sub_paths_per_directory = None
     self._tar_file = None
+    self._tar_info_per_path = None
     self.encoding = encoding
 
   def _Close(self):
@@ -42,8 +44,64 @@ class TARFileSystem(file_system.FileSystem):
     """
     self._tar_file.close()
     self._tar_file = None
+    self._tar_info_per_path = None
+    self._sub_paths_per_directory = None
     self._file_object = None
 
+  def _GetTARPath(self, location):
+    """Retrieves the TAR path of a location.
+
+    The TAR path is the location without the leading and trailing path
+    separators and without empty path segments.
+
+    Args:
+      location (str): location.
+
+    Returns:
+      str: TAR path, where an empty string represents the root.
+    """
+    path_segments = self.SplitPath(location)
+    return self.PATH_SEPARATOR.join(path_segments)
+
+  def _IndexTARFile(self, tar_file):
+    """Builds the index of the paths in a TAR file.
+
+    The index maps every path to its TAR info and every directory to its sub
+    paths, including directories that are not stored in the TAR file but are
+    implied by the paths of the members, also referred to as virtual
+    directories. This prevents that every directory listing or lookup has to
+    iterate all the members of the TAR file.
+
+    Args:
+      tar_file (tarfile.TARFile): TAR file.
+    """
+    self._sub_paths_per_directory = {'': {}}
+    self._tar_info_per_path = {}
+
+    for tar_info in tar_file.getmembers():
+      path_segments = self.SplitPath(tar_info.name)
+      if not path_segments:
+        continue
+
+      # Note that like tarfile.TarFile.getmember() the last member with
+      # a specific path is used.
+      path = self.PATH_SEPARATOR.join(path_segments)
+      self._tar_info_per_path[path] = tar_info
+
+      parent_path = ''
+      for segment_index in range(1, len(path_segments) + 1):
+        sub_path = self.PATH_SEPARATOR.join(path_segments[:segment_index])
+
+        sub_paths = self._sub_paths_per_directory.get(parent_path, None)
+        if sub_paths is None:
+          sub_paths = {}
+          self._sub_paths_per_directory[parent_path] = sub_paths
+
+        # A dictionary is used as an insertion ordered set.
+        sub_paths[sub_path] = None
+
+        parent_path = sub_path
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -75,6 +133,8 @@ class TARFileSystem(file_system.FileSystem):
     except tarfile.ReadError as exception:
       raise IOError(exception)
 
+    self._IndexTARFile(tar_file)
+
     self._file_object = file_object
     self._tar_file = tar_file
 
@@ -93,23 +153,10 @@ class TARFileSystem(file_system.FileSystem):
         not location.startswith(self.LOCATION_ROOT)):
       return False
 
-    if len(location) == 1:
-      return True
-
-    try:
-      self._tar_file.getmember(location[1:])
-      return True
-    except KeyError:
-      pass
-
-    # Check if location could be a virtual directory.
-    for name in self._tar_file.getnames():
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    tar_path = self._GetTARPath(location)
+    return bool(
+        tar_path in self._tar_info_per_path or
+        tar_path in self._sub_paths_per_directory)
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -131,9 +178,10 @@ class TARFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs['tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
+    tar_info = self._tar_info_per_path.get(self._GetTARPath(location), None)
+    if tar_info:
+      kwargs['tar_info'] = tar_info
+    else:
       kwargs['is_virtual'] = True
 
     return tar_file_entry.TARFileEntry(
@@ -176,11 +224,28 @@ class TARFileSystem(file_system.FileSystem):
     if not location.startswith(self.LOCATION_ROOT):
       raise errors.PathSpecError('Invalid location in path specification.')
 
-    tar_file = None
-    if len(location) > 1:
-      try:
-        tar_file = self._tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+    return self._tar_info_per_path.get(self._GetTARPath(location), None)
+
+  def GetTARSubPathsByPathSpec(self, path_spec):
+    """Retrieves the TAR paths of the sub file entries for a path specification.
+
+    Args:
+      path_spec (PathSpec): a path specification.
+
+    Returns:
+      list[str]: TAR paths of the sub file entries, without a leading path
+          separator, in the order the members are stored in the TAR file.
+
+    Raises:
+      PathSpecError: if the path specification is incorrect.
+    """
+    location = getattr(path_spec, 'location', None)
+    if location is None:
+      raise errors.PathSpecError('Path specification missing location.')
+
+    if not location.startswith(self.LOCATION_ROOT):
+      raise errors.PathSpecError('Invalid location in path specification.')
 
-    return tar_file
+    sub_paths = self._sub_paths_per_directory.get(
+        self._GetTARPath(location), None)
+    return list(sub_paths or [])
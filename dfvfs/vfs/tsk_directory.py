@@ -20,6 +20,19 @@ class TSKDirectory(directory.Directory):
     Yields:
       TSKPathSpec: a path specification.
 
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    for path_spec, _ in self.GetTSKFiles():
+      yield path_spec
+
+  def GetTSKDirectoryEntries(self):
+    """Retrieves the names and SleuthKit file objects of directory entries.
+
+    Yields:
+      tuple[str, pytsk3.File]: name, or None if not available, and TSK file of
+          a directory entry.
+
     Raises:
       BackEndError: if pytsk3 cannot open the directory.
     """
@@ -98,17 +111,37 @@ class TSKDirectory(directory.Directory):
             # Continue here since we cannot represent the directory entry.
             continue
 
-          if directory_entry:
-            # Ignore references to self or parent.
-            if directory_entry in ['.', '..']:
-              continue
+          # Ignore references to self or parent.
+          if directory_entry in ['.', '..']:
+            continue
+
+        yield directory_entry, tsk_directory_entry
 
-            if not location or location == self._file_system.PATH_SEPARATOR:
-              directory_entry = self._file_system.JoinPath([directory_entry])
-            else:
-              directory_entry = self._file_system.JoinPath([
-                  location, directory_entry])
+  def GetTSKFiles(self):
+    """Retrieves directory entries and their SleuthKit file objects.
+
+    pytsk3 already opens the file object of a directory entry when iterating
+    the directory, hence these file objects can be used to create sub file
+    entries without having to open them again by inode.
+
+    Yields:
+      tuple[TSKPathSpec, pytsk3.File]: path specification and TSK file of
+          a directory entry.
+
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    location = getattr(self.path_spec, 'location', None)
 
-        yield tsk_path_spec.TSKPathSpec(
-            inode=directory_entry_inode, location=directory_entry,
-            parent=self.path_spec.parent)
+    for directory_entry, tsk_directory_entry in self.GetTSKDirectoryEntries():
+      if directory_entry:
+        if not location or location == self._file_system.PATH_SEPARATOR:
+          directory_entry = self._file_system.JoinPath([directory_entry])
+        else:
+          directory_entry = self._file_system.JoinPath([
+              location, directory_entry])
+
+      path_spec = tsk_path_spec.TSKPathSpec(
+          inode=tsk_directory_entry.info.meta.addr, location=directory_entry,
+          parent=self.path_spec.parent)
+      yield path_spec, tsk_directory_entry
@@ -266,6 +266,21 @@ class TSKFileEntry(file_entry.FileEntry):
   _ATTRIBUTE_TYPE_CLASS_MAPPINGS = {
       pytsk3.TSK_FS_ATTR_TYPE_HFS_EXT_ATTR: tsk_attribute.TSKExtendedAttribute}
 
+  # Mappings of TSK file system metadata types to dfVFS file entry types.
+  # TODO: implement support for:
+  # pytsk3.TSK_FS_META_TYPE_UNDEF
+  # pytsk3.TSK_FS_META_TYPE_SHAD
+  # pytsk3.TSK_FS_META_TYPE_WHT
+  # pytsk3.TSK_FS_META_TYPE_VIRT
+  _ENTRY_TYPES = {
+      pytsk3.TSK_FS_META_TYPE_BLK: definitions.FILE_ENTRY_TYPE_DEVICE,
+      pytsk3.TSK_FS_META_TYPE_CHR: definitions.FILE_ENTRY_TYPE_DEVICE,
+      pytsk3.TSK_FS_META_TYPE_DIR: definitions.FILE_ENTRY_TYPE_DIRECTORY,
+      pytsk3.TSK_FS_META_TYPE_FIFO: definitions.FILE_ENTRY_TYPE_PIPE,
+      pytsk3.TSK_FS_META_TYPE_LNK: definitions.FILE_ENTRY_TYPE_LINK,
+      pytsk3.TSK_FS_META_TYPE_REG: definitions.FILE_ENTRY_TYPE_FILE,
+      pytsk3.TSK_FS_META_TYPE_SOCK: definitions.FILE_ENTRY_TYPE_SOCKET}
+
   def __init__(
       self, resolver_context, file_system, path_spec, is_root=False,
       is_virtual=False, parent_inode=None, tsk_file=None):
@@ -305,25 +320,7 @@ class TSKFileEntry(file_entry.FileEntry):
     tsk_fs_meta_type = getattr(
         tsk_file.info.meta, 'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
 
-    if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_REG:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_FILE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_LNK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_LINK
-    elif tsk_fs_meta_type in (
-        pytsk3.TSK_FS_META_TYPE_CHR, pytsk3.TSK_FS_META_TYPE_BLK):
-      self.entry_type = definitions.FILE_ENTRY_TYPE_DEVICE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_FIFO:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_PIPE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_SOCK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_SOCKET
-
-    # TODO: implement support for:
-    # pytsk3.TSK_FS_META_TYPE_UNDEF
-    # pytsk3.TSK_FS_META_TYPE_SHAD
-    # pytsk3.TSK_FS_META_TYPE_WHT
-    # pytsk3.TSK_FS_META_TYPE_VIRT
+    self.entry_type = self._ENTRY_TYPES.get(tsk_fs_meta_type, None)
 
   def _GetAttributes(self):
     """Retrieves the attributes.
@@ -403,6 +400,30 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return self._data_streams
 
+  def _GetDefaultDataAttribute(self):
+    """Retrieves the attribute of the default data stream.
+
+    Returns:
+      pytsk3.Attribute: TSK attribute of the default data stream or None if
+          not available.
+    """
+    for pytsk_attribute in self._tsk_file:
+      if not getattr(pytsk_attribute, 'info', None):
+        continue
+
+      attribute_name = getattr(pytsk_attribute.info, 'name', None)
+      attribute_type = getattr(pytsk_attribute.info, 'type', None)
+
+      # The data stream is returned as a name-less attribute of type
+      # pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA or
+      # pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA
+      if not attribute_name and attribute_type in (
+          pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA,
+          pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA):
+        return pytsk_attribute
+
+    return None
+
   def _GetDirectory(self):
     """Retrieves a directory.
 
@@ -414,6 +435,45 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return tsk_directory.TSKDirectory(self._file_system, self.path_spec)
 
+  def _GetExtentsDataStreamSize(self, data_stream_object):
+    """Retrieves the size of a data stream that can be read from its extents.
+
+    Args:
+      data_stream_object (TSKDataStream): data stream.
+
+    Returns:
+      int: size of the data stream or None if the data stream cannot be read
+          from its extents.
+    """
+    # pytsk3 does not expose the initialized size of a NTFS data stream,
+    # hence data beyond the initialized size cannot be zero-filled.
+    if self._file_system.IsNTFS():
+      return None
+
+    # pylint: disable=protected-access
+    pytsk_attribute = data_stream_object._tsk_attribute
+    if not pytsk_attribute:
+      if self.entry_type != definitions.FILE_ENTRY_TYPE_FILE:
+        return None
+
+      pytsk_attribute = self._GetDefaultDataAttribute()
+
+    if not pytsk_attribute:
+      return None
+
+    attribute_flags = getattr(pytsk_attribute.info, 'flags', 0)
+    if (not attribute_flags & pytsk3.TSK_FS_ATTR_NONRES or
+        attribute_flags & (pytsk3.TSK_FS_ATTR_COMP | pytsk3.TSK_FS_ATTR_ENC)):
+      return None
+
+    for tsk_attr_run in pytsk_attribute:
+      if tsk_attr_run.flags & (
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_ENCRYPTED |
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER):
+        return None
+
+    return getattr(pytsk_attribute.info, 'size', None)
+
   def _GetLink(self):
     """Retrieves the link.
 
@@ -517,8 +577,12 @@ class TSKFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
+      parent_inode = getattr(self._tsk_file.info.meta, 'addr', None)
+
+      for path_spec, tsk_file in self._directory.GetTSKFiles():
+        yield TSKFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            parent_inode=parent_inode, tsk_file=tsk_file)
 
   def _GetTimeValue(self, name):
     """Retrieves a date and time value.
@@ -708,22 +772,7 @@ class TSKFileEntry(file_entry.FileEntry):
     if self.entry_type != definitions.FILE_ENTRY_TYPE_FILE:
       return []
 
-    data_attribute = None
-    for pytsk_attribute in self._tsk_file:
-      if not getattr(pytsk_attribute, 'info', None):
-        continue
-
-      attribute_name = getattr(pytsk_attribute.info, 'name', None)
-      attribute_type = getattr(pytsk_attribute.info, 'type', None)
-
-      # The data stream is returned as a name-less attribute of type
-      # pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA or
-      # pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA
-      if not attribute_name and attribute_type in (
-          pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA,
-          pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA):
-        data_attribute = pytsk_attribute
-        break
+    data_attribute = self._GetDefaultDataAttribute()
 
     extents = []
     if data_attribute:
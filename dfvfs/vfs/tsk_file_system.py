@@ -9,7 +9,9 @@ from dfvfs.lib import tsk_image
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
+from dfvfs.vfs import tsk_directory
 from dfvfs.vfs import tsk_file_entry
+from dfvfs.vfs import walk_record
 
 
 class TSKFileSystem(file_system.FileSystem):
@@ -63,6 +65,158 @@ class TSKFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._tsk_file_system = tsk_file_system
 
+  def _GetWalkRecord(
+      self, tsk_file, name, path, parent_identifier, time_value_names):
+    """Retrieves a walk record from a SleuthKit file object.
+
+    Args:
+      tsk_file (pytsk3.File): TSK file.
+      name (str): name of the file entry or None if not available.
+      path (str): path of the file entry or None if not available.
+      parent_identifier (int): inode number of the parent file entry or None
+          if not available.
+      time_value_names (tuple[str, str, str, str]): names of the access,
+          change, creation and modification time values supported by the file
+          system, where None represents an unsupported time value.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    tsk_fs_meta = tsk_file.info.meta
+
+    # pylint: disable=protected-access
+    entry_type = tsk_file_entry.TSKFileEntry._ENTRY_TYPES.get(
+        getattr(tsk_fs_meta, 'type', pytsk3.TSK_FS_META_TYPE_UNDEF), None)
+
+    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+    flags = getattr(tsk_fs_meta, 'flags', 0)
+
+    access_time, change_time, creation_time, modification_time = [
+        self._GetWalkTimestamp(tsk_fs_meta, time_value_name)
+        for time_value_name in time_value_names]
+
+    return walk_record.WalkRecord(
+        name, path, identifier=getattr(tsk_fs_meta, 'addr', None),
+        parent_identifier=parent_identifier, entry_type=entry_type,
+        size=getattr(tsk_fs_meta, 'size', None),
+        is_allocated=bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC),
+        access_time=access_time, change_time=change_time,
+        creation_time=creation_time, modification_time=modification_time)
+
+  def _GetWalkTimestamp(self, tsk_fs_meta, name):
+    """Retrieves a POSIX timestamp in nanoseconds from SleuthKit metadata.
+
+    Args:
+      tsk_fs_meta (pytsk3.TSK_FS_META): TSK file system metadata.
+      name (str): name of the time value, for example "atime", or None if
+          the time value is not supported by the file system.
+
+    Returns:
+      int: number of nanoseconds since 1970-01-01 00:00:00 or None if not
+          available.
+    """
+    if not name:
+      return None
+
+    timestamp = getattr(tsk_fs_meta, name, None)
+    if timestamp is None:
+      return None
+
+    # Note that pytsk3 can return 0 for an ext4 creation time even if the
+    # inode does not contain it.
+    if (name == 'crtime' and timestamp == 0 and
+        self._tsk_fs_type == pytsk3.TSK_FS_TYPE_EXT4):
+      return None
+
+    timestamp *= self._NANOSECONDS_PER_SECOND
+
+    # pylint: disable=protected-access
+    if self._tsk_fs_type in tsk_file_entry.TSKFileEntry._TSK_HAS_NANO_FS_TYPES:
+      fraction_of_second = getattr(
+          tsk_fs_meta, '{0:s}_nano'.format(name), None)
+      if fraction_of_second:
+        # Sleuthkit 4.2.0 switched from 100 nano seconds granularity to
+        # 1 nano second granularity.
+        if pytsk3.TSK_VERSION_NUM < 0x040200ff:
+          fraction_of_second *= 100
+
+        timestamp += fraction_of_second
+
+    return timestamp
+
+  def _GetWalkTimeValueNames(self):
+    """Retrieves the names of the time values supported by the file system.
+
+    Returns:
+      tuple[str, str, str, str]: names of the access, change, creation and
+          modification time values, where None represents an unsupported time
+          value.
+    """
+    file_system_type = self.GetFsType()
+
+    # pylint: disable=protected-access
+    file_entry_class = tsk_file_entry.TSKFileEntry
+    time_value_names = []
+    for name, file_system_types in (
+        ('atime', file_entry_class._TSK_ATIME_FS_TYPES),
+        ('ctime', file_entry_class._TSK_CTIME_FS_TYPES),
+        ('crtime', file_entry_class._TSK_CRTIME_FS_TYPES),
+        ('mtime', file_entry_class._TSK_MTIME_FS_TYPES)):
+      if file_system_type not in file_system_types:
+        name = None
+      time_value_names.append(name)
+
+    return tuple(time_value_names)
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    pytsk3 opens the file object of every directory entry when iterating
+    a directory, hence the metadata is read directly from these file objects
+    without creating a file entry or path specification.
+
+    Args:
+      file_entry (TSKFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    time_value_names = self._GetWalkTimeValueNames()
+
+    record = self._GetWalkRecord(
+        file_entry.GetTSKFile(), file_entry.name,
+        getattr(file_entry.path_spec, 'location', None), None,
+        time_value_names)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append(record)
+
+    # Directories are only walked once to protect against cycles in
+    # corrupted file systems.
+    walked_directories = set()
+
+    while directories:
+      parent_record = directories.pop()
+      if parent_record.identifier in walked_directories:
+        continue
+
+      walked_directories.add(parent_record.identifier)
+
+      path_spec = tsk_path_spec.TSKPathSpec(
+          inode=parent_record.identifier, parent=self._path_spec.parent)
+      directory = tsk_directory.TSKDirectory(self, path_spec)
+
+      for name, tsk_file in directory.GetTSKDirectoryEntries():
+        record = self._GetWalkRecord(
+            tsk_file, name, self._JoinWalkPath(parent_record.path, name),
+            parent_record.identifier, time_value_names)
+        yield record
+
+        if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append(record)
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
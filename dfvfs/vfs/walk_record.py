@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""The Virtual File System (VFS) walk record."""
+
+
+class WalkRecord(object):
+  """Metadata-only record of a file entry.
+
+  A walk record is a lightweight alternative to a file entry for bulk listings
+  of a file system. The timestamps are integers and are not converted into
+  dfDateTime objects.
+
+  Attributes:
+    access_time (int): access time, in number of nanoseconds since
+        1970-01-01 00:00:00 (POSIX epoch), or None if not available.
+    change_time (int): (inode) change time, in number of nanoseconds since
+        1970-01-01 00:00:00 (POSIX epoch), or None if not available.
+    creation_time (int): creation time, in number of nanoseconds since
+        1970-01-01 00:00:00 (POSIX epoch), or None if not available.
+    identifier (int): identifier of the file entry within the file system,
+        such as an inode number or MFT entry number, or None if not
+        available.
+    is_allocated (bool): True if the file entry is allocated.
+    modification_time (int): modification time, in number of nanoseconds since
+        1970-01-01 00:00:00 (POSIX epoch), or None if not available.
+    name (str): name of the file entry, which does not include the full path.
+    parent_identifier (int): identifier of the parent file entry or None if
+        not available.
+    path (str): path of the file entry or None if not available.
+    size (int): size of the file entry in bytes or None if not available.
+    type (str): file entry type, for example FILE_ENTRY_TYPE_FILE, or None if
+        not available.
+  """
+
+  __slots__ = (
+      'access_time', 'change_time', 'creation_time', 'identifier',
+      'is_allocated', 'modification_time', 'name', 'parent_identifier',
+      'path', 'size', 'type')
+
+  def __init__(
+      self, name, path, identifier=None, parent_identifier=None,
+      entry_type=None, size=None, is_allocated=True, access_time=None,
+      change_time=None, creation_time=None, modification_time=None):
+    """Initializes a walk record.
+
+    Args:
+      name (str): name of the file entry, which does not include the full
+          path.
+      path (str): path of the file entry or None if not available.
+      identifier (Optional[int]): identifier of the file entry within
+          the file system.
+      parent_identifier (Optional[int]): identifier of the parent file entry.
+      entry_type (Optional[str]): file entry type.
+      size (Optional[int]): size of the file entry in bytes.
+      is_allocated (Optional[bool]): True if the file entry is allocated.
+      access_time (Optional[int]): access time, in number of nanoseconds since
+          1970-01-01 00:00:00 (POSIX epoch).
+      change_time (Optional[int]): (inode) change time, in number of
+          nanoseconds since 1970-01-01 00:00:00 (POSIX epoch).
+      creation_time (Optional[int]): creation time, in number of nanoseconds
+          since 1970-01-01 00:00:00 (POSIX epoch).
+      modification_time (Optional[int]): modification time, in number of
+          nanoseconds since 1970-01-01 00:00:00 (POSIX epoch).
+    """
+    super(WalkRecord, self).__init__()
+    self.access_time = access_time
+    self.change_time = change_time
+    self.creation_time = creation_time
+    self.identifier = identifier
+    self.is_allocated = is_allocated
+    self.modification_time = modification_time
+    self.name = name
+    self.parent_identifier = parent_identifier
+    self.path = path
+    self.size = size
+    self.type = entry_type
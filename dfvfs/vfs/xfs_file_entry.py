@@ -173,6 +173,42 @@ class XFSFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield XFSFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def _LookupBackEndFileEntry(self, location):
+    """Looks up a back-end file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      tuple[bool, pyfsxfs.file_entry]: True if the back end supports the lookup
+          and the back-end file entry or None if not available.
+
+    Raises:
+      IOError: if the back-end file entry could not be looked up.
+      OSError: if the back-end file entry could not be looked up.
+    """
+    path_spec = xfs_path_spec.XFSPathSpec(
+        location=location, parent=self.path_spec.parent)
+    return True, self._file_system.GetXFSFileEntryByPathSpec(path_spec)
+
+  def _NewSubFileEntry(self, location, fsxfs_file_entry):
+    """Creates a sub file entry from a back-end file entry.
+
+    Args:
+      location (str): location of the sub file entry.
+      fsxfs_file_entry (pyfsxfs.file_entry): back-end file entry.
+
+    Returns:
+      XFSFileEntry: a sub file entry.
+    """
+    path_spec = xfs_path_spec.XFSPathSpec(
+        inode=fsxfs_file_entry.inode_number,
+        location=location, parent=self.path_spec.parent)
+
+    return XFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsxfs_file_entry=fsxfs_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
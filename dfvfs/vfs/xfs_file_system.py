@@ -8,6 +8,7 @@ from dfvfs.lib import errors
 from dfvfs.path import xfs_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
+from dfvfs.vfs import walk_record
 from dfvfs.vfs import xfs_file_entry
 
 
@@ -37,6 +38,65 @@ class XFSFileSystem(file_system.FileSystem):
     self._fsxfs_volume = None
     self._file_object = None
 
+  def _GetWalkRecord(self, fsxfs_file_entry, name, path, parent_identifier):
+    """Retrieves a walk record from a pyfsxfs file entry.
+
+    Args:
+      fsxfs_file_entry (pyfsxfs.file_entry): XFS file entry.
+      name (str): name of the file entry.
+      path (str): path of the file entry or None if not available.
+      parent_identifier (int): inode number of the parent file entry or None
+          if not available.
+
+    Returns:
+      WalkRecord: walk record.
+    """
+    # pylint: disable=protected-access
+    entry_type = xfs_file_entry.XFSFileEntry._ENTRY_TYPES.get(
+        fsxfs_file_entry.file_mode & 0xf000, None)
+
+    return walk_record.WalkRecord(
+        name, path, identifier=fsxfs_file_entry.inode_number,
+        parent_identifier=parent_identifier, entry_type=entry_type,
+        size=fsxfs_file_entry.size,
+        access_time=fsxfs_file_entry.get_access_time_as_integer(),
+        change_time=fsxfs_file_entry.get_inode_change_time_as_integer(),
+        creation_time=fsxfs_file_entry.get_creation_time_as_integer(),
+        modification_time=fsxfs_file_entry.get_modification_time_as_integer())
+
+  def _WalkFileEntry(self, file_entry):
+    """Walks a file entry and its sub file entries.
+
+    Args:
+      file_entry (XFSFileEntry): file entry to start the walk.
+
+    Yields:
+      WalkRecord: walk record.
+    """
+    fsxfs_file_entry = file_entry.GetXFSFileEntry()
+    record = self._GetWalkRecord(
+        fsxfs_file_entry, file_entry.name,
+        getattr(file_entry.path_spec, 'location', None), None)
+    yield record
+
+    directories = []
+    if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      directories.append((fsxfs_file_entry, record))
+
+    while directories:
+      fsxfs_file_entry, parent_record = directories.pop()
+
+      for fsxfs_sub_file_entry in fsxfs_file_entry.sub_file_entries:
+        name = fsxfs_sub_file_entry.name
+        record = self._GetWalkRecord(
+            fsxfs_sub_file_entry, name,
+            self._JoinWalkPath(parent_record.path, name),
+            parent_record.identifier)
+        yield record
+
+        if record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append((fsxfs_sub_file_entry, record))
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -118,21 +118,16 @@ class ZipFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      zip_file = self._file_system.GetZipFile()
-      if zip_file:
-        for path_spec in self._directory.entries:
-          location = getattr(path_spec, 'location', None)
-          if location is None:
-            continue
-
-          kwargs = {}
-          try:
-            kwargs['zip_info'] = zip_file.getinfo(location[1:])
-          except KeyError:
-            kwargs['is_virtual'] = True
-
-          yield ZipFileEntry(
-              self._resolver_context, self._file_system, path_spec, **kwargs)
+      for path_spec in self._directory.entries:
+        kwargs = {}
+        zip_info = self._file_system.GetZipInfoByPathSpec(path_spec)
+        if zip_info:
+          kwargs['zip_info'] = zip_info
+        else:
+          kwargs['is_virtual'] = True
+
+        yield ZipFileEntry(
+            self._resolver_context, self._file_system, path_spec, **kwargs)
 
   @property
   def modification_time(self):
@@ -199,20 +194,6 @@ class ZipFileEntry(file_entry.FileEntry):
       PathSpecError: if the path specification is incorrect.
     """
     if not self._zip_info:
-      location = getattr(self.path_spec, 'location', None)
-      if location is None:
-        raise errors.PathSpecError('Path specification missing location.')
-
-      if not location.startswith(self._file_system.LOCATION_ROOT):
-        raise errors.PathSpecError('Invalid location in path specification.')
-
-      if len(location) == 1:
-        return None
-
-      zip_file = self._file_system.GetZipFile()
-      try:
-        self._zip_info = zip_file.getinfo(location[1:])
-      except KeyError:
-        pass
+      self._zip_info = self._file_system.GetZipInfoByPathSpec(self.path_spec)
 
     return self._zip_info
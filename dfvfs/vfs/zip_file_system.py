@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The ZIP file system implementation."""
 
+import array
 import zipfile
 
 from dfvfs.lib import definitions
@@ -30,7 +31,11 @@ class ZipFileSystem(file_system.FileSystem):
     """
     super(ZipFileSystem, self).__init__(resolver_context, path_spec)
     self._file_object = None
+    self._path_numbers = None
+    self._paths = None
+    self._sub_path_numbers = None
     self._zip_file = None
+    self._zip_info_numbers = None
     self.encoding = encoding
 
   def _Close(self):
@@ -41,8 +46,89 @@ class ZipFileSystem(file_system.FileSystem):
     """
     self._zip_file.close()
     self._zip_file = None
+    self._path_numbers = None
+    self._paths = None
+    self._sub_path_numbers = None
+    self._zip_info_numbers = None
     self._file_object = None
 
+  def _GetPathNumber(self, location):
+    """Retrieves the number of the path of a location in the path index.
+
+    Args:
+      location (str): location.
+
+    Returns:
+      int: number of the path or None if the location is not in the path
+          index.
+    """
+    path_segments = self.SplitPath(location)
+    return self._path_numbers.get(self.PATH_SEPARATOR.join(path_segments), None)
+
+  def _IndexZipFile(self, zip_file):
+    """Builds the index of the paths in a ZIP file.
+
+    The index contains every path in the ZIP file, without leading and trailing
+    path separators, and the directories that are not stored in the ZIP file
+    but are implied by the paths of the members, also referred to as virtual
+    directories. The paths are numbered in the order they are first encountered
+    and to keep the index compact for ZIP files with millions of members,
+    the ZIP info and sub paths of a path are stored as path and ZIP info
+    numbers in arrays.
+
+    Args:
+      zip_file (zipfile.ZipFile): ZIP file.
+    """
+    path_numbers = {'': 0}
+    paths = ['']
+    sub_path_numbers = {}
+    zip_info_numbers = array.array('q', [-1])
+
+    for zip_info_number, zip_info in enumerate(zip_file.infolist()):
+      filename = getattr(zip_info, 'filename', None)
+      if filename is not None and not isinstance(filename, str):
+        try:
+          filename = filename.decode(self.encoding)
+        except UnicodeDecodeError:
+          filename = None
+
+      if not filename:
+        continue
+
+      path_number = 0
+      path = ''
+      for path_segment in self.SplitPath(filename):
+        parent_path_number = path_number
+
+        if path:
+          path = self.PATH_SEPARATOR.join([path, path_segment])
+        else:
+          path = path_segment
+
+        path_number = path_numbers.get(path, None)
+        if path_number is None:
+          path_number = len(paths)
+          path_numbers[path] = path_number
+          paths.append(path)
+          zip_info_numbers.append(-1)
+
+          sub_paths = sub_path_numbers.get(parent_path_number, None)
+          if sub_paths is None:
+            sub_paths = array.array('Q')
+            sub_path_numbers[parent_path_number] = sub_paths
+
+          sub_paths.append(path_number)
+
+      # Note that like zipfile.ZipFile.getinfo() the last member with
+      # a specific path is used.
+      if path_number:
+        zip_info_numbers[path_number] = zip_info_number
+
+    self._path_numbers = path_numbers
+    self._paths = paths
+    self._sub_path_numbers = sub_path_numbers
+    self._zip_info_numbers = zip_info_numbers
+
   def _Open(self, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -65,6 +151,8 @@ class ZipFileSystem(file_system.FileSystem):
 
     zip_file = zipfile.ZipFile(file_object, 'r')  # pylint: disable=consider-using-with
 
+    self._IndexZipFile(zip_file)
+
     self._file_object = file_object
     self._zip_file = zip_file
 
@@ -83,23 +171,7 @@ class ZipFileSystem(file_system.FileSystem):
         not location.startswith(self.LOCATION_ROOT)):
       return False
 
-    if len(location) == 1:
-      return True
-
-    try:
-      self._zip_file.getinfo(location[1:])
-      return True
-    except KeyError:
-      pass
-
-    # Check if location could be a virtual directory.
-    for name in self._zip_file.namelist():
-      # The ZIP info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    return self._GetPathNumber(location) is not None
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -121,9 +193,10 @@ class ZipFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs['zip_info'] = self._zip_file.getinfo(location[1:])
-    except KeyError:
+    zip_info = self.GetZipInfoByPathSpec(path_spec)
+    if zip_info:
+      kwargs['zip_info'] = zip_info
+    else:
       kwargs['is_virtual'] = True
 
     return zip_file_entry.ZipFileEntry(
@@ -166,7 +239,47 @@ class ZipFileSystem(file_system.FileSystem):
     if not location.startswith(self.LOCATION_ROOT):
       raise errors.PathSpecError('Invalid location in path specification.')
 
-    if len(location) > 1:
-      return self._zip_file.getinfo(location[1:])
+    path_number = self._GetPathNumber(location)
+    if path_number is None:
+      return None
+
+    zip_info_number = self._zip_info_numbers[path_number]
+    if zip_info_number < 0:
+      return None
+
+    return self._zip_file.infolist()[zip_info_number]
+
+  def GetZipSubPathsByPathSpec(self, path_spec):
+    """Retrieves the ZIP paths of the sub file entries for a path specification.
+
+    Args:
+      path_spec (PathSpec): a path specification.
+
+    Yields:
+      str: ZIP path of a sub file entry, without a leading path separator,
+          in the order the members are stored in the ZIP file. Like ZIP file
+          names the path of a directory ends with a path separator.
+
+    Raises:
+      PathSpecError: if the path specification is incorrect.
+    """
+    location = getattr(path_spec, 'location', None)
+    if location is None:
+      raise errors.PathSpecError('Path specification missing location.')
+
+    if not location.startswith(self.LOCATION_ROOT):
+      raise errors.PathSpecError('Invalid location in path specification.')
+
+    path_number = self._GetPathNumber(location)
+    if path_number is not None:
+      zip_info_list = self._zip_file.infolist()
+
+      for sub_path_number in self._sub_path_numbers.get(path_number, []):
+        path = self._paths[sub_path_number]
+
+        zip_info_number = self._zip_info_numbers[sub_path_number]
+        if zip_info_number < 0 or zip_info_list[
+            zip_info_number].filename.endswith(self.PATH_SEPARATOR):
+          path = ''.join([path, self.PATH_SEPARATOR])
 
-    return None
+        yield path
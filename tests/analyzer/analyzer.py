@@ -330,6 +330,41 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetTypeIndicatorsPerFormatCategory(self):
+    """Tests the GetTypeIndicatorsPerFormatCategory function."""
+    test_file = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    expected_type_indicators_per_category = {
+        definitions.FORMAT_CATEGORY_UNDEFINED: [],
+        definitions.FORMAT_CATEGORY_ARCHIVE: [],
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: [],
+        definitions.FORMAT_CATEGORY_ENCODED_STREAM: [],
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+            definitions.TYPE_INDICATOR_QCOW],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: []}
+    type_indicators_per_category = (
+        analyzer.Analyzer.GetTypeIndicatorsPerFormatCategory(path_spec))
+    self.assertEqual(
+        type_indicators_per_category, expected_type_indicators_per_category)
+
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    expected_type_indicators_per_category = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [
+            definitions.PREFERRED_EXT_BACK_END],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: []}
+    type_indicators_per_category = (
+        analyzer.Analyzer.GetTypeIndicatorsPerFormatCategory(
+            path_spec, format_categories=[
+                definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+                definitions.FORMAT_CATEGORY_VOLUME_SYSTEM]))
+    self.assertEqual(
+        type_indicators_per_category, expected_type_indicators_per_category)
+
   def testGetVolumeSystemTypeIndicatorsAPM(self):
     """Tests the GetVolumeSystemTypeIndicators function on APM partitions."""
     test_file = self._GetTestFilePath(['apm.dmg'])
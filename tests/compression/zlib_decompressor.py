@@ -29,6 +29,25 @@ class ZlibDecompressorTestCase(test_lib.DecompressorTestCase):
     with self.assertRaises(errors.BackEndError):
       decompressor.Decompress(b'This is a test.')
 
+  def testCopy(self):
+    """Tests the Copy method."""
+    decompressor = zlib_decompressor.ZlibDecompressor()
+
+    compressed_data = (
+        b'x\x9c\x0b\xc9\xc8,V\x00\xa2D\x85\x92\xd4\xe2\x12=\x00)\x97\x05$')
+
+    uncompressed_data, _ = decompressor.Decompress(compressed_data[:8])
+    self.assertEqual(uncompressed_data, b'This ')
+
+    decompressor_copy = decompressor.Copy()
+    self.assertIsNotNone(decompressor_copy)
+
+    uncompressed_data, _ = decompressor.Decompress(compressed_data[8:])
+    self.assertEqual(uncompressed_data, b'is a test.')
+
+    uncompressed_data, _ = decompressor_copy.Decompress(compressed_data[8:])
+    self.assertEqual(uncompressed_data, b'is a test.')
+
 
 class DeflateDecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the zlib decompressor object."""
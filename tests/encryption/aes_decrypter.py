@@ -85,6 +85,43 @@ class AESDecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(decrypted_data, b'')
     self.assertEqual(remaining_encrypted_data, partial_encrypted_data)
 
+  def testDecryptRange(self):
+    """Tests the DecryptRange method."""
+    encrypted_data = (
+        b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xceB\x01\xdb8E7\xfe'
+        b'\x92j\xf0\x1d(\xb9\x9f\xad\x13')
+
+    def _ReadEncryptedData(offset, size):
+      """Reads encrypted data."""
+      return encrypted_data[offset:offset + size]
+
+    for cipher_mode in (
+        definitions.ENCRYPTION_MODE_CBC, definitions.ENCRYPTION_MODE_CFB,
+        definitions.ENCRYPTION_MODE_ECB, definitions.ENCRYPTION_MODE_OFB):
+      decrypter = aes_decrypter.AESDecrypter(
+          cipher_mode=cipher_mode,
+          initialization_vector=self._AES_INITIALIZATION_VECTOR,
+          key=self._AES_KEY)
+
+      self.assertTrue(decrypter.SupportsRandomAccess())
+
+      expected_decrypted_data, _ = decrypter.Decrypt(
+          encrypted_data, finalize=True)
+
+      for offset, size in ((0, 32), (20, 8), (14, 4), (30, 10), (40, 4)):
+        decrypted_data = decrypter.DecryptRange(
+            _ReadEncryptedData, offset, size)
+        self.assertEqual(
+            decrypted_data, expected_decrypted_data[offset:offset + size])
+
+    decrypter = aes_decrypter.AESDecrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+        initialization_vector=self._AES_INITIALIZATION_VECTOR,
+        key=self._AES_KEY)
+
+    decrypted_data = decrypter.DecryptRange(_ReadEncryptedData, 16, 16)
+    self.assertEqual(decrypted_data, b'ncrypted text!!!')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -28,6 +28,26 @@ class RC4DecrypterTestCase(test_lib.DecrypterTestCase):
     expected_decrypted_data = b'\x01\x02\x03\x04\x05\x06\x07\x08'
     self.assertEqual(decrypted_data, expected_decrypted_data)
 
+  def testDecryptRange(self):
+    """Tests the DecryptRange method."""
+    encrypted_data = b'\xef6\xcd\x14\xfe\xf5+y'
+
+    def _ReadEncryptedData(offset, size):
+      """Reads encrypted data."""
+      return encrypted_data[offset:offset + size]
+
+    decrypter = rc4_decrypter.RC4Decrypter(key=b'test1')
+    self.assertTrue(decrypter.SupportsRandomAccess())
+
+    decrypted_data = decrypter.DecryptRange(_ReadEncryptedData, 4, 4)
+    self.assertEqual(decrypted_data, b'\x05\x06\x07\x08')
+
+    decrypted_data = decrypter.DecryptRange(_ReadEncryptedData, 1, 2)
+    self.assertEqual(decrypted_data, b'\x02\x03')
+
+    decrypted_data = decrypter.DecryptRange(_ReadEncryptedData, 6, 4)
+    self.assertEqual(decrypted_data, b'\x07\x08')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the block cache file-like object."""
+
+import os
+import unittest
+
+from dfvfs.file_io import block_cache_io
+from dfvfs.file_io import fake_file_io
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class BlockCacheFileTest(shared_test_lib.BaseTestCase):
+  """Tests the block cache file-like object."""
+
+  _FILE_DATA = bytes(bytearray(range(256))) * 4
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._path_spec = fake_path_spec.FakePathSpec(location='/test.raw')
+
+    self._fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, self._path_spec, self._FILE_DATA)
+    self._fake_file_object.Open()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    with self.assertRaises(ValueError):
+      block_cache_io.BlockCacheFile(
+          self._resolver_context, self._path_spec, self._fake_file_object,
+          block_size=0)
+
+    with self.assertRaises(ValueError):
+      block_cache_io.BlockCacheFile(
+          self._resolver_context, self._path_spec, self._fake_file_object,
+          block_size=64, maximum_cache_size=32)
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = block_cache_io.BlockCacheFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        block_size=64, maximum_cache_size=256, maximum_read_ahead_size=0)
+    file_object.Open()
+
+    self.assertEqual(file_object.get_size(), 1024)
+
+    file_object.seek(60, os.SEEK_SET)
+    self.assertEqual(file_object.read(8), self._FILE_DATA[60:68])
+    self.assertEqual(file_object.get_offset(), 68)
+
+    statistics = file_object.GetStatistics()
+    self.assertEqual(statistics.cost, 128)
+    self.assertEqual(statistics.number_of_cached_values, 2)
+    self.assertEqual(statistics.number_of_hits, 0)
+    self.assertEqual(statistics.number_of_misses, 2)
+
+    file_object.seek(64, os.SEEK_SET)
+    self.assertEqual(file_object.read(64), self._FILE_DATA[64:128])
+
+    statistics = file_object.GetStatistics()
+    self.assertEqual(statistics.number_of_hits, 1)
+    self.assertEqual(statistics.number_of_misses, 2)
+
+    file_object.seek(-5, os.SEEK_END)
+    self.assertEqual(file_object.read(), self._FILE_DATA[-5:])
+
+    file_object.seek(2000, os.SEEK_SET)
+    self.assertEqual(file_object.read(2), b'')
+
+    # Test a read that is larger than the cache.
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), self._FILE_DATA)
+
+    with self.assertRaises(IOError):
+      file_object.seek(-10, os.SEEK_SET)
+
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = block_cache_io.BlockCacheFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        block_size=64, maximum_cache_size=256, maximum_read_ahead_size=0)
+    file_object.Open()
+
+    file_object.seek(10, os.SEEK_SET)
+    self.assertEqual(file_object.read_at(500, 100), self._FILE_DATA[500:600])
+    self.assertEqual(file_object.get_offset(), 10)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-10, 5)
+
+  def testReadEviction(self):
+    """Test that the least recently used blocks are evicted."""
+    file_object = block_cache_io.BlockCacheFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        block_size=64, maximum_cache_size=128, maximum_read_ahead_size=0)
+    file_object.Open()
+
+    for offset in (0, 512, 0, 768, 0):
+      self.assertEqual(
+          file_object.read_at(offset, 16), self._FILE_DATA[offset:offset + 16])
+
+    statistics = file_object.GetStatistics()
+    self.assertEqual(statistics.number_of_cached_values, 2)
+    self.assertEqual(statistics.number_of_evictions, 1)
+    self.assertEqual(statistics.number_of_hits, 2)
+    self.assertEqual(statistics.number_of_misses, 3)
+
+  def testReadAhead(self):
+    """Test that blocks are read ahead for sequential reads."""
+    file_object = block_cache_io.BlockCacheFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        block_size=64, maximum_cache_size=1024, maximum_read_ahead_size=256)
+    file_object.Open()
+
+    data = []
+    for _ in range(16):
+      data.append(file_object.read(64))
+
+    self.assertEqual(b''.join(data), self._FILE_DATA)
+
+    statistics = file_object.GetStatistics()
+    self.assertEqual(statistics.number_of_cached_values, 16)
+    self.assertLess(statistics.number_of_misses, 16)
+    self.assertEqual(
+        statistics.number_of_hits + statistics.number_of_misses, 16)
+
+
+if __name__ == '__main__':
+  unittest.main()
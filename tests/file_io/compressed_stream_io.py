@@ -49,6 +49,22 @@ class BZIP2CompressedStreamTest(test_lib.SylogTestCase):
 
     self._TestGetSizeFileObject(file_object)
 
+  def testSetUncompressedStreamSize(self):
+    """Tests the SetUncompressedStreamSize function."""
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+
+    with self.assertRaises(ValueError):
+      file_object.SetUncompressedStreamSize(-1)
+
+    file_object.SetUncompressedStreamSize(1247)
+    file_object.Open()
+
+    self._TestGetSizeFileObject(file_object)
+
+    with self.assertRaises(IOError):
+      file_object.SetUncompressedStreamSize(1247)
+
   def testSeek(self):
     """Test the seek functionality."""
     file_object = compressed_stream_io.CompressedStream(
@@ -256,6 +272,32 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
     file_object.seek(-10, os.SEEK_END)
     self.assertEqual(file_object.read(5), b'times')
 
+  def testSeekWithCheckpoints(self):
+    """Test the seek functionality with decompressor state checkpoints."""
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    with open(test_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+    # pylint: disable=protected-access
+    file_object._CHECKPOINT_INTERVAL = 128
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 32
+    file_object.Open()
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+    self.assertGreater(len(file_object._checkpoints), 1)
+
+    for offset in (1000, 200, 1200, 0, 700, 129):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(40), expected_data[offset:offset + 40])
+
+    file_object.seek(100, os.SEEK_SET)
+    self.assertEqual(file_object.read(), expected_data[100:])
+
   def testRead(self):
     """Test the read functionality."""
     file_object = compressed_stream_io.CompressedStream(
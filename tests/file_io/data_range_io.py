@@ -84,6 +84,14 @@ class DataRangeTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object, base_offset=0)
 
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = data_range_io.DataRange(
+        self._resolver_context, self._data_range_path_spec)
+    file_object.Open()
+
+    self._TestReadAtFileObject(file_object, base_offset=0)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -75,6 +75,14 @@ class Base16EncodedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadAtFileObject(file_object)
+
 
 class Base32EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base32 encoded stream file-like object."""
@@ -142,6 +150,8 @@ class Base32EncodedStreamTest(test_lib.SylogTestCase):
 class Base64EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base64 encoded stream file-like object."""
 
+  # pylint: disable=protected-access
+
   def setUp(self):
     """Sets up the needed objects used throughout the test."""
     self._resolver_context = context.Context()
@@ -201,6 +211,25 @@ class Base64EncodedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadAtFileObject(file_object)
+
+  def testHasLineIndex(self):
+    """Test the _HasLineIndex function."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    result = file_object._HasLineIndex()
+    self.assertTrue(result)
+    self.assertEqual(len(file_object._line_index), 2)
+    self.assertEqual(file_object._line_index_decoded_size, 1247)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -90,6 +90,14 @@ class AESEncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadAtFileObject(file_object)
+
 
 class AESEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
   """The unit test for a AES encrypted stream file-like object.
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the extents file-like object."""
+
+import os
+import unittest
+
+from dfvfs.file_io import extents_file_io
+from dfvfs.file_io import fake_file_io
+from dfvfs.lib import definitions
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import extent
+
+from tests import test_lib as shared_test_lib
+
+
+class ExtentsFileTest(shared_test_lib.BaseTestCase):
+  """Tests the extents file-like object."""
+
+  _FILE_DATA = bytes(bytearray(range(256))) * 4
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._path_spec = fake_path_spec.FakePathSpec(location='/test.raw')
+
+    self._fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, self._path_spec, self._FILE_DATA)
+    self._fake_file_object.Open()
+
+    self._extents = [
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=512, size=64),
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=576, size=64),
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_SPARSE, offset=0, size=64),
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=128, size=64)]
+
+    self._expected_data = b''.join([
+        self._FILE_DATA[512:640], b'\x00' * 64, self._FILE_DATA[128:192]])
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    file_object = extents_file_io.ExtentsFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        self._extents, 256)
+
+    # The 2 physically adjacent data extents are merged into a single run.
+    self.assertEqual(file_object.number_of_runs, 3)
+
+    with self.assertRaises(ValueError):
+      extents_file_io.ExtentsFile(
+          self._resolver_context, self._path_spec, self._fake_file_object,
+          self._extents, -1)
+
+    compressed_extents = [
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_COMPRESSED, offset=0,
+            size=64)]
+
+    with self.assertRaises(ValueError):
+      extents_file_io.ExtentsFile(
+          self._resolver_context, self._path_spec, self._fake_file_object,
+          compressed_extents, 64)
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = extents_file_io.ExtentsFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        self._extents, 250)
+    file_object.Open()
+
+    self.assertEqual(file_object.get_size(), 250)
+
+    self.assertEqual(file_object.read(), self._expected_data[:250])
+    self.assertEqual(file_object.get_offset(), 250)
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.seek(120, os.SEEK_SET)
+    self.assertEqual(file_object.read(80), self._expected_data[120:200])
+    self.assertEqual(file_object.get_offset(), 200)
+
+    file_object.seek(-10, os.SEEK_END)
+    self.assertEqual(file_object.read(100), self._expected_data[240:250])
+
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = extents_file_io.ExtentsFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        self._extents, 256)
+    file_object.Open()
+
+    self.assertEqual(file_object.read_at(60, 8), self._expected_data[60:68])
+    self.assertEqual(file_object.read_at(0, 256), self._expected_data)
+    self.assertEqual(file_object.read_at(256, 8), b'')
+    self.assertEqual(file_object.get_offset(), 0)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-1, 8)
+
+  def testReadBeyondLastExtent(self):
+    """Test reading data beyond the last extent."""
+    file_object = extents_file_io.ExtentsFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        self._extents[:1], 96)
+    file_object.Open()
+
+    expected_data = b''.join([self._FILE_DATA[512:576], b'\x00' * 32])
+    self.assertEqual(file_object.read(), expected_data)
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = extents_file_io.ExtentsFile(
+        self._resolver_context, self._path_spec, self._fake_file_object,
+        self._extents, 256)
+    file_object.Open()
+
+    file_object.seek(10, os.SEEK_SET)
+    file_object.seek(5, os.SEEK_CUR)
+    self.assertEqual(file_object.get_offset(), 15)
+
+    file_object.seek(-6, os.SEEK_END)
+    self.assertEqual(file_object.get_offset(), 250)
+
+    with self.assertRaises(IOError):
+      file_object.seek(-10, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      file_object.seek(10, 5)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,10 +2,15 @@
 # -*- coding: utf-8 -*-
 """Tests for the gzip file-like object."""
 
+import shutil
+import tempfile
 import unittest
 
+from unittest import mock
+
 from dfvfs.file_io import gzip_file_io
 from dfvfs.lib import definitions
+from dfvfs.lib import gzipfile
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 
@@ -76,6 +81,80 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     self.assertEqual(file_object.uncompressed_data_size, 2994187)
 
+  def testOpenWithIndexStore(self):
+    """Tests opening a file with a gzip index from the resolver context."""
+    file_object = gzip_file_io.GzipFile(
+        self._resolver_context, self._gzip_path_spec)
+    file_object.Open()
+
+    gzip_index = self._resolver_context.GetGzipIndex(
+        self._gzip_path_spec.parent)
+    self.assertIsNotNone(gzip_index)
+    self.assertEqual(file_object.index, gzip_index)
+
+    file_object = gzip_file_io.GzipFile(
+        self._resolver_context, self._gzip_path_spec)
+    file_object.Open()
+
+    self.assertEqual(file_object.index, gzip_index)
+    self._TestReadFileObject(file_object)
+
+    # The gzip indexes are not shared between resolver contexts.
+    resolver_context = context.Context()
+    file_object = gzip_file_io.GzipFile(
+        resolver_context, self._gzip_path_spec)
+    file_object.Open()
+
+    self.assertNotEqual(file_object.index, gzip_index)
+
+    self._resolver_context.Empty()
+    self.assertIsNone(self._resolver_context.GetGzipIndex(
+        self._gzip_path_spec.parent))
+
+  def testOpenWithIndexStorePath(self):
+    """Tests opening a file with a gzip index stored in a directory."""
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      resolver_context = context.Context(gzip_index_path=temporary_directory)
+      file_object = gzip_file_io.GzipFile(
+          resolver_context, self._gzip_path_spec)
+      file_object.Open()
+
+      expected_json_string = file_object.index.WriteSerialized()
+
+      # Another resolver context, for example in another process, reuses
+      # the stored gzip index.
+      resolver_context = context.Context(gzip_index_path=temporary_directory)
+      file_object = gzip_file_io.GzipFile(
+          resolver_context, self._gzip_path_spec)
+
+      with mock.patch.object(
+          gzipfile.GzipMember, '_ReadMemberHeader') as read_member_mock:
+        file_object.Open()
+        self.assertEqual(read_member_mock.call_count, 0)
+
+      self.assertEqual(
+          file_object.index.WriteSerialized(), expected_json_string)
+      self._TestReadFileObject(file_object)
+
+      # A stale gzip index is not used and is replaced.
+      resolver_context = context.Context(gzip_index_path=temporary_directory)
+      resolver_context.SetGzipIndex(
+          self._gzip_path_spec.parent, gzipfile.GzipIndex(
+              file_object.index.compressed_data_size, digest='bogus'))
+
+      resolver_context = context.Context(gzip_index_path=temporary_directory)
+      file_object = gzip_file_io.GzipFile(
+          resolver_context, self._gzip_path_spec)
+      file_object.Open()
+
+      self.assertEqual(
+          file_object.index.WriteSerialized(), expected_json_string)
+      self._TestReadFileObject(file_object)
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
   def testReadMultipleMembers(self):
     """Tests reading a file that contains multiple gzip members."""
     test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
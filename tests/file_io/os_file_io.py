@@ -135,6 +135,38 @@ class OSFileTest(shared_test_lib.BaseTestCase):
 
     # TODO: add boundary scenarios.
 
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec2)
+
+    # Try read_at without the file object being open.
+    with self.assertRaises(IOError):
+      file_object.read_at(10, 5)
+
+    file_object.Open()
+
+    file_object.seek(2, os.SEEK_SET)
+    self.assertEqual(file_object.read_at(10, 5), b'other')
+    self.assertEqual(file_object.get_offset(), 2)
+
+    self.assertEqual(file_object.read_at(300, 2), b'')
+
+    # A size of None or a negative size reads all remaining data.
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+    file_object.Open()
+
+    expected_buffer = (
+        b'treasure chest,-,1111\n'
+        b'uber secret laire,admin,admin\n')
+
+    self.assertEqual(file_object.read_at(64, None), expected_buffer)
+    self.assertEqual(file_object.read_at(64, -1), expected_buffer)
+    self.assertEqual(file_object.read_at(300, None), b'')
+    self.assertEqual(file_object.get_offset(), 0)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-10, 5)
+
   def testGetOffset(self):
     """Test the get offset functionality."""
     file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
@@ -2,8 +2,10 @@
 # -*- coding: utf-8 -*-
 """Tests for the file-like object implementation using pyqcow."""
 
+import os
 import unittest
 
+from dfvfs.file_io import qcow_file_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import factory as path_spec_factory
@@ -49,6 +51,30 @@ class QCOWFileTest(test_lib.Ext2ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._qcow_path_spec)
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = qcow_file_io.QCOWFile(
+        self._resolver_context, self._qcow_path_spec)
+    file_object.Open()
+
+    file_object.seek(0x400, os.SEEK_SET)
+    expected_data = file_object.read(0x80)
+
+    file_object.seek(0x10, os.SEEK_SET)
+    expected_next_data = file_object.read(0x20)
+
+    file_object.seek(0x10, os.SEEK_SET)
+    self.assertEqual(file_object.read_at(0x400, 0x80), expected_data)
+    self.assertEqual(file_object.read_at(0x440, 0x40), expected_data[0x40:])
+
+    # The current offset is not changed by reading at an offset.
+    self.assertEqual(file_object.get_offset(), 0x10)
+    self.assertEqual(file_object.read(0x20), expected_next_data)
+
+    file_object.read_at(0x400, 0x80)
+    file_object.seek(-0x20, os.SEEK_CUR)
+    self.assertEqual(file_object.read(0x20), expected_next_data)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,6 +2,10 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite blob file-like object."""
 
+import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 
 from dfvfs.file_io import sqlite_blob_file_io
@@ -9,6 +13,7 @@ from dfvfs.lib import definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 
+from tests import test_lib as shared_test_lib
 from tests.file_io import test_lib
 
 
@@ -100,6 +105,177 @@ class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testSharedDatabase(self):
+    """Test that the database is shared by the file-like objects."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object.Open()
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_SQLITE_BLOB, column_name='blob',
+        parent=self._sqlite_blob_path_spec.parent,
+        row_condition=('identifier', '==', 'myblob'), table_name='blobs')
+    other_file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, path_spec)
+    other_file_object.Open()
+
+    # pylint: disable=protected-access
+    self.assertIs(
+        other_file_object._database_object, file_object._database_object)
+    self.assertFalse(file_object._database_object.is_in_memory)
+
+    file_object.close()
+    other_file_object.close()
+
+    database_object = self._resolver_context.GetDatabase(
+        self._sqlite_blob_path_spec.parent)
+    self.assertIsNotNone(database_object)
+
+  def testReadInMemory(self):
+    """Test the read functionality with a database loaded in memory."""
+    resolver_context = context.Context(
+        maximum_in_memory_database_size=1024 * 1024)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        resolver_context, self._sqlite_blob_path_spec)
+    file_object.Open()
+
+    # pylint: disable=protected-access
+    if not file_object._database_object.is_in_memory:
+      raise unittest.SkipTest('sqlite3 is missing deserialize support.')
+
+    self._TestReadFileObject(file_object)
+
+
+class SQLiteBlobFileIncrementalTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object with incremental reads."""
+
+  # pylint: disable=protected-access
+
+  _BLOB_DATA = bytes(bytearray(range(256))) * 16
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+
+    test_path = os.path.join(self._temporary_directory, 'blob.db')
+    connection = sqlite3.connect(test_path)
+    connection.execute('CREATE TABLE blobs (identifier TEXT, blob BLOB)')
+    connection.execute(
+        'INSERT INTO blobs VALUES (?, ?)', ('myblob', self._BLOB_DATA))
+    # Tables with columns that shadow the names of the row identifier.
+    connection.execute('CREATE TABLE rowids (rowid INTEGER, blob BLOB)')
+    connection.execute(
+        'INSERT INTO rowids VALUES (?, ?)', (2, self._BLOB_DATA[:256]))
+    connection.execute(
+        'INSERT INTO rowids VALUES (?, ?)', (1, self._BLOB_DATA))
+    connection.execute(
+        'CREATE TABLE oids (rowid TEXT, _rowid_ TEXT, oid TEXT, blob BLOB)')
+    connection.execute(
+        'INSERT INTO oids VALUES (?, ?, ?, ?)',
+        ('a', 'b', 'c', self._BLOB_DATA))
+    connection.commit()
+    connection.close()
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    self._sqlite_blob_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_SQLITE_BLOB, column_name='blob',
+        parent=test_os_path_spec, row_condition=('identifier', '==', 'myblob'),
+        table_name='blobs')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _TestReadIncremental(self, file_object):
+    """Tests reading a blob incrementally.
+
+    Args:
+      file_object (SQLiteBlobFile): file-like object.
+    """
+    self.assertIsNone(file_object._blob)
+    self.assertEqual(file_object.get_size(), len(self._BLOB_DATA))
+
+    data = file_object.read(1000)
+    self.assertEqual(data, self._BLOB_DATA[:1000])
+
+    file_object.seek(-100, os.SEEK_END)
+    data = file_object.read(1000)
+    self.assertEqual(data, self._BLOB_DATA[-100:])
+    self.assertEqual(file_object.get_offset(), len(self._BLOB_DATA))
+
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read()
+    self.assertEqual(data, self._BLOB_DATA)
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object._MAXIMUM_BLOB_SIZE_IN_MEMORY = 0
+    file_object.Open()
+
+    self._TestReadIncremental(file_object)
+
+  def testReadWithSubstr(self):
+    """Test the read functionality without incremental blob I/O support."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object._MAXIMUM_BLOB_SIZE_IN_MEMORY = 0
+    file_object.Open()
+
+    file_object._database_object._HAS_BLOBOPEN = False
+
+    self._TestReadIncremental(file_object)
+
+  def testReadWithShadowedRowIdentifier(self):
+    """Test the read functionality with a column named rowid."""
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_SQLITE_BLOB, column_name='blob',
+        parent=self._sqlite_blob_path_spec.parent, row_condition=(
+            'rowid', '==', 1), table_name='rowids')
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, test_path_spec)
+    file_object._MAXIMUM_BLOB_SIZE_IN_MEMORY = 0
+    file_object.Open()
+
+    self._TestReadIncremental(file_object)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, test_path_spec)
+    file_object.Open()
+
+    self.assertEqual(file_object.read(), self._BLOB_DATA)
+
+    # All the names of the row identifier are shadowed by columns.
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_SQLITE_BLOB, column_name='blob',
+        parent=self._sqlite_blob_path_spec.parent, row_index=0,
+        table_name='oids')
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, test_path_spec)
+    file_object._MAXIMUM_BLOB_SIZE_IN_MEMORY = 0
+    file_object.Open()
+
+    self.assertEqual(file_object._blob, self._BLOB_DATA)
+
+    with self.assertRaises(IOError):
+      file_object._database_object.ReadBlob('oids', 'blob', 'a', 0, 16)
+
+  def testReadInMemory(self):
+    """Test the read functionality of a blob that is kept in memory."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object.Open()
+
+    self.assertEqual(file_object._blob, self._BLOB_DATA)
+    self.assertEqual(file_object.read(), self._BLOB_DATA)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -674,6 +674,37 @@ class SylogTestCase(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_object.get_offset(), expected_offset)
 
+  def _TestReadAtFileObject(self, file_object, base_offset=167):
+    """Runs the read at offset tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(10, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = file_object.read_at(base_offset, 95)
+
+    self.assertEqual(read_buffer, expected_buffer)
+
+    # The current offset should not change.
+    self.assertEqual(file_object.get_offset(), 10)
+
+    read_buffer = file_object.read_at(base_offset + 10, 5)
+    self.assertEqual(read_buffer, b'53:01')
+
+    read_buffer = file_object.read_at(2000, 2)
+    self.assertEqual(read_buffer, b'')
+
+    self.assertEqual(file_object.get_offset(), 10)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-10, 5)
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the thread-safe file-like object."""
+
+import os
+import threading
+import unittest
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import thread_safe_file_io
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class ThreadSafeFileTest(shared_test_lib.BaseTestCase):
+  """Tests the thread-safe file-like object."""
+
+  _FILE_DATA = b'This is a test file with some data.'
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._path_spec = fake_path_spec.FakePathSpec(location='/test.txt')
+
+    self._fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, self._path_spec, self._FILE_DATA)
+    self._fake_file_object.Open()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = thread_safe_file_io.ThreadSafeFile(
+        self._resolver_context, self._path_spec, self._fake_file_object)
+    file_object.Open()
+
+    self.assertEqual(file_object.get_size(), 35)
+
+    file_object.seek(10, os.SEEK_SET)
+    self.assertEqual(file_object.read(4), b'test')
+    self.assertEqual(file_object.get_offset(), 14)
+
+    # Moving the shared file-like object does not affect the cursor.
+    self._fake_file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(5), b' file')
+
+    file_object.seek(-5, os.SEEK_END)
+    self.assertEqual(file_object.read(), b'data.')
+
+  def testReadPerThread(self):
+    """Test that every thread has its own current offset."""
+    file_object = thread_safe_file_io.ThreadSafeFile(
+        self._resolver_context, self._path_spec, self._fake_file_object)
+    file_object.Open()
+
+    file_object.seek(10, os.SEEK_SET)
+
+    results = []
+
+    def _ReadFileObject():
+      """Reads the file-like object in another thread."""
+      results.append(file_object.get_offset())
+      results.append(file_object.read(4))
+
+    thread = threading.Thread(target=_ReadFileObject)
+    thread.start()
+    thread.join()
+
+    self.assertEqual(results, [0, b'This'])
+    self.assertEqual(file_object.get_offset(), 10)
+    self.assertEqual(file_object.read(4), b'test')
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = thread_safe_file_io.ThreadSafeFile(
+        self._resolver_context, self._path_spec, self._fake_file_object)
+    file_object.Open()
+
+    file_object.seek(5, os.SEEK_SET)
+    file_object.seek(5, os.SEEK_CUR)
+    self.assertEqual(file_object.get_offset(), 10)
+
+    with self.assertRaises(IOError):
+      file_object.seek(-20, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      file_object.seek(10, 5)
+
+    self.assertEqual(file_object.get_offset(), 10)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 """Tests for the zip extracted file-like object."""
 
+import os
 import unittest
 
+from unittest import mock
+
+from dfvfs.file_io import compressed_stream_io
 from dfvfs.file_io import zip_file_io
 from dfvfs.lib import definitions
 from dfvfs.path import factory as path_spec_factory
@@ -15,6 +19,8 @@ from tests.file_io import test_lib
 class ZipFileTest(test_lib.SylogTestCase):
   """Tests a zip extracted file-like object."""
 
+  # pylint: disable=protected-access
+
   def setUp(self):
     """Sets up the needed objects used throughout the test."""
     super(ZipFileTest, self).setUp()
@@ -58,6 +64,42 @@ class ZipFileTest(test_lib.SylogTestCase):
 
     # TODO: add tests for read > UNCOMPRESSED_DATA_BUFFER_SIZE
 
+  def testReadAt(self):
+    """Test the read_at functionality."""
+    file_object = zip_file_io.ZipFile(
+        self._resolver_context, self._zip_path_spec)
+    file_object.Open()
+
+    self.assertIsInstance(
+        file_object._member_data_file_object,
+        compressed_stream_io.CompressedStream)
+
+    self._TestReadAtFileObject(file_object)
+
+  def testReadWithZipFile(self):
+    """Test the read functionality using zipfile."""
+    with mock.patch.object(
+        zip_file_io.ZipFile, '_OpenMemberDataFileObject', return_value=None):
+      file_object = zip_file_io.ZipFile(
+          self._resolver_context, self._zip_path_spec)
+      file_object.Open()
+
+    self.assertIsNone(file_object._member_data_file_object)
+
+    self._TestReadFileObject(file_object)
+    self._TestSeekFileObject(file_object)
+    self._TestReadAtFileObject(file_object)
+
+    file_object._UNCOMPRESSED_DATA_BUFFER_SIZE = 64
+
+    # Test reading forward and backward across buffers.
+    file_object.seek(1000, os.SEEK_SET)
+    self.assertEqual(file_object.read(5), b'me.my')
+    file_object.seek(-10, os.SEEK_END)
+    self.assertEqual(file_object.read(5), b'times')
+
+    self._TestReadFileObject(file_object)
+
 
 if __name__ == '__main__':
   unittest.main()
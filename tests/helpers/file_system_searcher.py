@@ -446,6 +446,121 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     self.assertEqual(result, (False, False))
 
 
+class CompiledFindSpecsTest(shared_test_lib.BaseTestCase):
+  """Tests for the compiled find specifications."""
+
+  # pylint: disable=protected-access
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    find_specs = [
+        file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE]),
+        file_system_searcher.FindSpec(
+            location='/usr/lib', location_separator='/'),
+        file_system_searcher.FindSpec(
+            case_sensitive=False, location_glob='/USR/lib/python*',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_regex='/usr/[bad', location_separator='/')]
+
+    compiled_find_specs = file_system_searcher.CompiledFindSpecs(find_specs)
+    self.assertEqual(
+        compiled_find_specs.find_specs_without_location, find_specs[:1])
+
+    root_node = compiled_find_specs.root_node
+    self.assertEqual(list(root_node.case_sensitive_children.keys()), ['usr'])
+    self.assertEqual(list(root_node.case_insensitive_children.keys()), ['usr'])
+    self.assertEqual(root_node.pattern_children, {})
+
+    trie_node = root_node.case_sensitive_children['usr']
+    self.assertEqual(
+        list(trie_node.case_sensitive_children.keys()), ['lib'])
+    self.assertEqual(trie_node.pattern_children, {})
+
+    trie_node = trie_node.case_sensitive_children['lib']
+    self.assertEqual(trie_node.find_specs, find_specs[1:2])
+    self.assertFalse(trie_node.HasChildNodes())
+
+    trie_node = root_node.case_insensitive_children['usr']
+    trie_node = trie_node.case_insensitive_children['lib']
+    self.assertEqual(len(trie_node.pattern_children), 1)
+
+    child_nodes = trie_node.GetMatchingChildNodes('Python2.7')
+    self.assertEqual(len(child_nodes), 1)
+    self.assertEqual(child_nodes[0].find_specs, find_specs[2:3])
+
+  def testGetLiteralFromRegex(self):
+    """Test the _GetLiteralFromRegex function."""
+    compiled_find_specs = file_system_searcher.CompiledFindSpecs([])
+
+    literal = compiled_find_specs._GetLiteralFromRegex('Windows')
+    self.assertEqual(literal, 'Windows')
+
+    literal = compiled_find_specs._GetLiteralFromRegex(r'\$Extend')
+    self.assertEqual(literal, '$Extend')
+
+    literal = compiled_find_specs._GetLiteralFromRegex(r'file\.txt')
+    self.assertEqual(literal, 'file.txt')
+
+    literal = compiled_find_specs._GetLiteralFromRegex('file.txt')
+    self.assertIsNone(literal)
+
+    literal = compiled_find_specs._GetLiteralFromRegex(r'file\d')
+    self.assertIsNone(literal)
+
+    literal = compiled_find_specs._GetLiteralFromRegex('file\\')
+    self.assertIsNone(literal)
+
+  def testCompiledFindWithFakeFileSystem(self):
+    """Test the CompiledFind function with a fake file system."""
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    file_system_builder.AddFile('/etc/passwd', b'root:x:0:0')
+    file_system_builder.AddFile('/usr/lib/libc.so', b'ELF')
+    file_system_builder.AddFile('/usr/lib/python3/os.py', b'import abc')
+    file_system_builder.AddFile('/usr/lib/python3/re.py', b'import sre')
+    file_system_builder.AddFile('/Var/log', b'log1')
+    file_system_builder.AddFile('/var/log', b'log2')
+
+    mount_point = fake_path_spec.FakePathSpec(location='/')
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system_builder.file_system, mount_point)
+
+    find_specs_list = [
+        None,
+        [file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])],
+        [file_system_searcher.FindSpec(
+            location='/etc/passwd', location_separator='/'),
+         file_system_searcher.FindSpec(
+             case_sensitive=False, location='/USR/LIB/LIBC.SO',
+             location_separator='/'),
+         file_system_searcher.FindSpec(
+             location_glob='/usr/lib/*/*.py', location_separator='/'),
+         file_system_searcher.FindSpec(
+             location_regex='/usr/bogus/.*', location_separator='/')],
+        [file_system_searcher.FindSpec(
+            case_sensitive=False, location='/VAR/log',
+            location_separator='/')]]
+
+    for find_specs in find_specs_list:
+      expected_locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in searcher.Find(find_specs=find_specs)])
+
+      compiled_find_specs = file_system_searcher.CompiledFindSpecs(
+          find_specs or [file_system_searcher.FindSpec()])
+      locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in searcher.CompiledFind(compiled_find_specs)])
+
+      self.assertEqual(locations, expected_locations)
+
+    # Case insensitive, a literal location segment matches multiple sub file
+    # entries.
+    self.assertEqual(locations, ['/Var/log', '/var/log'])
+
+
 class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
   """Tests for the file system searcher."""
 
@@ -473,6 +588,43 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
         self._resolver_context, self._tsk_path_spec)
     self._tsk_file_system.Open()
 
+  def testCompiledFind(self):
+    """Test the CompiledFind function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._raw_path_spec)
+
+    find_specs_list = [
+        [file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])],
+        [file_system_searcher.FindSpec(
+            location='/$Extend/$RmMetadata', location_separator='/'),
+         file_system_searcher.FindSpec(
+             location=['$Extend', '$RmMetadata', '$TxfLog', '$TxfLog.blf']),
+         file_system_searcher.FindSpec(
+             case_sensitive=False, location='/PASSWORDS.TXT',
+             location_separator='/')],
+        [file_system_searcher.FindSpec(
+            location_glob='/*/$RmMetadata', location_separator='/'),
+         file_system_searcher.FindSpec(
+             location_glob=['$Extend', '$RmMetadata', '*', '*.blf']),
+         file_system_searcher.FindSpec(
+             location_regex=[r'\$Extend', r'\$RmMetadata', '.*', '.*[.]blf'])]]
+
+    for find_specs in find_specs_list:
+      expected_locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in searcher.Find(find_specs=find_specs)])
+
+      compiled_find_specs = file_system_searcher.CompiledFindSpecs(find_specs)
+      path_spec_generator = searcher.CompiledFind(compiled_find_specs)
+      self.assertIsNotNone(path_spec_generator)
+
+      locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in path_spec_generator])
+
+      self.assertEqual(locations, expected_locations)
+
   def testFind(self):
     """Test the Find function."""
     searcher = file_system_searcher.FileSystemSearcher(
@@ -782,6 +934,62 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
     test_relative_path = searcher.GetRelativePath(first_path_spec)
     self.assertEqual(test_relative_path, expected_relative_path)
 
+  def testParallelFind(self):
+    """Test the ParallelFind function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._raw_path_spec)
+
+    find_specs_list = [
+        None,
+        [file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])],
+        [file_system_searcher.FindSpec(
+            location_glob='/*/$RmMetadata', location_separator='/'),
+         file_system_searcher.FindSpec(
+             location_glob=['$Extend', '$RmMetadata', '*', '*.blf'])]]
+
+    for find_specs in find_specs_list:
+      expected_locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in searcher.Find(find_specs=find_specs)])
+
+      path_spec_generator = searcher.ParallelFind(
+          find_specs=find_specs, number_of_workers=3,
+          maximum_number_of_queued_results=2)
+      self.assertIsNotNone(path_spec_generator)
+
+      locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in path_spec_generator])
+
+      self.assertEqual(locations, expected_locations)
+
+      # With a full tasks queue the workers search the directories themselves.
+      path_spec_generator = searcher.ParallelFind(
+          find_specs=find_specs, number_of_workers=3,
+          maximum_number_of_queued_results=2, maximum_number_of_queued_tasks=1)
+
+      locations = sorted([
+          getattr(path_spec, 'location', '')
+          for path_spec in path_spec_generator])
+
+      self.assertEqual(locations, expected_locations)
+
+    # Test that closing the generator early stops the workers.
+    path_spec_generator = searcher.ParallelFind(
+        number_of_workers=2, maximum_number_of_queued_results=1)
+    next(path_spec_generator)
+    path_spec_generator.close()
+
+    with self.assertRaises(ValueError):
+      list(searcher.ParallelFind(number_of_workers=0))
+
+    with self.assertRaises(ValueError):
+      list(searcher.ParallelFind(maximum_number_of_queued_results=0))
+
+    with self.assertRaises(ValueError):
+      list(searcher.ParallelFind(maximum_number_of_queued_tasks=0))
+
 
 if __name__ == '__main__':
   unittest.main()
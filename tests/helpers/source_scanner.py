@@ -2,9 +2,16 @@
 # -*- coding: utf-8 -*-
 """Tests for the source scanner object."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
+from unittest import mock
+
+from dfvfs.analyzer import analyzer
 from dfvfs.helpers import source_scanner
+from dfvfs.helpers import source_scanner_cache
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import factory as path_spec_factory
@@ -724,6 +731,62 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(len(scan_node.sub_nodes), 0)
 
+  def testScanWithScanResultCache(self):
+    """Test the Scan function with a scan result cache."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      test_scanner = source_scanner.SourceScanner(
+          scan_result_cache=source_scanner_cache.SourceScannerCache(
+              temporary_directory))
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      test_scanner.Scan(scan_context)
+
+      scan_node = self._GetTestScanNode(scan_context)
+      expected_path_spec = scan_node.path_spec
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      with mock.patch.object(test_scanner, '_ScanNode') as scan_node_mock:
+        test_scanner.Scan(scan_context)
+        self.assertEqual(scan_node_mock.call_count, 0)
+
+      self.assertEqual(
+          scan_context.source_type,
+          definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+
+      scan_node = self._GetTestScanNode(scan_context)
+      self.assertEqual(scan_node.path_spec, expected_path_spec)
+      self.assertEqual(
+          scan_node.type_indicator, definitions.PREFERRED_EXT_BACK_END)
+
+      # The scan result is only written after the scan of the source.
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      test_scanner = source_scanner.SourceScanner(
+          scan_result_cache=source_scanner_cache.SourceScannerCache(
+              os.path.join(temporary_directory, 'cache')))
+
+      with mock.patch.object(
+          source_scanner_cache.SourceScannerCache,
+          'WriteScanContext') as write_scan_context_mock:
+        test_scanner.Scan(scan_context)
+        self.assertEqual(write_scan_context_mock.call_count, 1)
+
+        scan_node = self._GetTestScanNode(scan_context)
+        test_scanner.Scan(scan_context, scan_path_spec=scan_node.path_spec)
+        self.assertEqual(write_scan_context_mock.call_count, 1)
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
   def testScanOnNonExisting(self):
     """Test the Scan function on non-existing image file."""
     test_path = self._GetTestFilePath(['nosuchfile.raw'])
@@ -860,6 +923,23 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
     path_spec = self._source_scanner.ScanForStorageMediaImage(test_os_path_spec)
     self.assertIsNone(path_spec)
 
+  def testScanForStorageMediaImageWithIOError(self):
+    """Test the ScanForStorageMediaImage function with an IOError."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    with mock.patch.object(
+        analyzer.Analyzer, 'GetTypeIndicatorsPerFormatCategory',
+        side_effect=IOError('Unable to read.')):
+      with self.assertRaises(errors.BackEndError):
+        self._source_scanner.ScanForStorageMediaImage(test_os_path_spec)
+
+      with self.assertRaises(errors.BackEndError):
+        self._source_scanner.ScanForFileSystem(test_os_path_spec)
+
   def testScanForVolumeSystemOnPartitionedImage(self):
     """Test the ScanForVolumeSystem function on a partitioned image."""
     test_path = self._GetTestFilePath(['mbr.raw'])
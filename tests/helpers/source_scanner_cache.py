@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the source scanner cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import source_scanner
+from dfvfs.helpers import source_scanner_cache
+from dfvfs.lib import definitions
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class SourceScannerCacheTest(shared_test_lib.BaseTestCase):
+  """Tests the source scanner cache."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _GetScanNodeTypeIndicators(self, scan_context):
+    """Retrieves the type indicators of the scan nodes in pre-order.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+
+    Returns:
+      list[tuple[str, bool]]: type indicator and scanned flag of the scan
+          nodes.
+    """
+    type_indicators = []
+    scan_nodes = [scan_context.GetRootScanNode()]
+    while scan_nodes:
+      scan_node = scan_nodes.pop(0)
+      type_indicators.append((scan_node.type_indicator, scan_node.scanned))
+      scan_nodes.extend(scan_node.sub_nodes)
+
+    return type_indicators
+
+  def testGetSourceKey(self):
+    """Tests the _GetSourceKey function."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_cache = source_scanner_cache.SourceScannerCache(
+        self._temporary_directory)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    source_key = test_cache._GetSourceKey(
+        scan_context, resolver_context=self._resolver_context)
+    self.assertIsNotNone(source_key)
+    self.assertEqual(len(source_key), 64)
+
+    test_path = self._GetTestFilePath(['apfs.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    other_source_key = test_cache._GetSourceKey(
+        scan_context, resolver_context=self._resolver_context)
+    self.assertNotEqual(other_source_key, source_key)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(os.path.join(test_path, 'bogus'))
+
+    source_key = test_cache._GetSourceKey(
+        scan_context, resolver_context=self._resolver_context)
+    self.assertIsNone(source_key)
+
+  def testReadAndWriteScanContext(self):
+    """Tests the ReadScanContext and WriteScanContext functions."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_cache = source_scanner_cache.SourceScannerCache(
+        self._temporary_directory)
+    test_scanner = source_scanner.SourceScanner(
+        resolver_context=self._resolver_context)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    result = test_cache.ReadScanContext(
+        scan_context, True, resolver_context=self._resolver_context)
+    self.assertFalse(result)
+
+    test_scanner.Scan(scan_context)
+    expected_type_indicators = self._GetScanNodeTypeIndicators(scan_context)
+
+    result = test_cache.WriteScanContext(
+        scan_context, True, resolver_context=self._resolver_context)
+    self.assertTrue(result)
+    self.assertEqual(len(os.listdir(self._temporary_directory)), 1)
+
+    cached_scan_context = source_scanner.SourceScannerContext()
+    cached_scan_context.OpenSourcePath(test_path)
+
+    result = test_cache.ReadScanContext(
+        cached_scan_context, False, resolver_context=self._resolver_context)
+    self.assertFalse(result)
+
+    result = test_cache.ReadScanContext(
+        cached_scan_context, True, resolver_context=self._resolver_context)
+    self.assertTrue(result)
+
+    self.assertEqual(
+        cached_scan_context.source_type,
+        definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+    self.assertTrue(cached_scan_context.HasFileSystemScanNodes())
+
+    type_indicators = self._GetScanNodeTypeIndicators(cached_scan_context)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    # A scan context that has already been scanned is not read.
+    result = test_cache.ReadScanContext(
+        cached_scan_context, True, resolver_context=self._resolver_context)
+    self.assertFalse(result)
+
+  def testWriteScanContextWithUnwritableCache(self):
+    """Tests the WriteScanContext function with an unwritable cache."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    # The cache directory cannot be created inside a regular file.
+    cache_path = os.path.join(self._temporary_directory, 'file')
+    with open(cache_path, 'wb') as file_object:
+      file_object.write(b'data')
+
+    test_cache = source_scanner_cache.SourceScannerCache(
+        os.path.join(cache_path, 'cache'))
+    test_scanner = source_scanner.SourceScanner(
+        resolver_context=self._resolver_context,
+        scan_result_cache=test_cache)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    # The scan succeeds even though the scan result cannot be written.
+    test_scanner.Scan(scan_context)
+    self.assertTrue(scan_context.HasFileSystemScanNodes())
+
+    result = test_cache.WriteScanContext(
+        scan_context, True, resolver_context=self._resolver_context)
+    self.assertFalse(result)
+    self.assertEqual(os.listdir(self._temporary_directory), ['file'])
+
+  def testReadScanContextWithInvalidData(self):
+    """Tests the ReadScanContext function with an invalid cached scan result."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_cache = source_scanner_cache.SourceScannerCache(
+        self._temporary_directory)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    source_key = test_cache._GetSourceKey(
+        scan_context, resolver_context=self._resolver_context)
+
+    with open(test_cache._GetCacheFilePath(source_key), 'w',
+              encoding='utf-8') as file_object:
+      file_object.write(
+          '{"auto_recurse": true, "scan_nodes": [{"bogus": 1}], '
+          '"version": 1}')
+
+    result = test_cache.ReadScanContext(
+        scan_context, True, resolver_context=self._resolver_context)
+    self.assertFalse(result)
+
+    scan_node = scan_context.GetRootScanNode()
+    self.assertEqual(scan_node.sub_nodes, [])
+    self.assertFalse(scan_node.scanned)
+
+
+if __name__ == '__main__':
+  unittest.main()
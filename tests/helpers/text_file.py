@@ -247,6 +247,42 @@ class TextFileTest(shared_test_lib.BaseTestCase):
     self.assertEqual(lines[3], 'treasure chest,-,1111\n')
     self.assertEqual(lines[4], 'uber secret laire,admin,admin\n')
 
+  def testIterLines(self):
+    """Test the iter_lines() function."""
+    test_path = self._GetTestFilePath(['password.txt'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(
+        test_os_path_spec, resolver_context=self._resolver_context)
+
+    text_file_object = text_file.TextFile(file_object)
+
+    batches = list(text_file_object.iter_lines(batch_size=2))
+
+    self.assertEqual(len(batches), 3)
+    self.assertEqual(batches[0], [
+        'place,user,password\n', 'bank,joesmith,superrich\n'])
+    self.assertEqual(batches[2], ['uber secret laire,admin,admin\n'])
+
+    offset = text_file_object.get_offset()
+    self.assertEqual(offset, 116)
+
+    text_file_object = text_file.TextFile(file_object)
+
+    line = text_file_object.readline(size=5)
+    self.assertEqual(line, 'place')
+
+    batches = list(text_file_object.iter_lines(batch_size=10))
+
+    self.assertEqual(len(batches), 1)
+    self.assertEqual(len(batches[0]), 5)
+    self.assertEqual(batches[0][0], ',user,password\n')
+
+    with self.assertRaises(ValueError):
+      list(text_file_object.iter_lines(batch_size=0))
+
 
 if __name__ == '__main__':
   unittest.main()
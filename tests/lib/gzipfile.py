@@ -7,8 +7,12 @@
 # when using pip.
 
 import os
+import shutil
+import tempfile
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions
 from dfvfs.lib import gzipfile
 from dfvfs.path import factory as path_spec_factory
@@ -21,6 +25,144 @@ from tests import test_lib as shared_test_lib
 # TODO: add tests for GzipMember
 
 
+class GzipIndexTest(shared_test_lib.BaseTestCase):
+  """Tests a gzip index."""
+
+  def testReadWriteSerialized(self):
+    """Tests the ReadSerialized and WriteSerialized functions."""
+    test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_file = gzipfile.GzipCompressedStream()
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(test_os_path_spec)
+
+    test_file.Open(file_object)
+
+    try:
+      json_string = test_file.index.WriteSerialized()
+
+    finally:
+      test_file.close()
+
+    gzip_index = gzipfile.GzipIndex.ReadSerialized(json_string)
+    self.assertIsNotNone(gzip_index)
+    self.assertEqual(gzip_index.compressed_data_size, 57403)
+    self.assertEqual(len(gzip_index.members), 2)
+    self.assertEqual(gzip_index.members[1].uncompressed_data_offset, 262105)
+
+    with self.assertRaises(ValueError):
+      gzipfile.GzipIndex.ReadSerialized('{"format_version": 1}')
+
+    with self.assertRaises(ValueError):
+      gzipfile.GzipIndex.ReadSerialized('bogus')
+
+  def testMatchesFileObject(self):
+    """Tests the MatchesFileObject function."""
+    test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_file = gzipfile.GzipCompressedStream()
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(test_os_path_spec)
+
+    test_file.Open(file_object)
+
+    try:
+      json_string = test_file.index.WriteSerialized()
+
+    finally:
+      test_file.close()
+
+    gzip_index = gzipfile.GzipIndex.ReadSerialized(json_string)
+    self.assertIsNotNone(gzip_index.digest)
+    self.assertTrue(gzip_index.MatchesFileObject(file_object))
+
+    gzip_index.digest = '0' * 64
+    self.assertFalse(gzip_index.MatchesFileObject(file_object))
+
+    # A member index that does not start with a member signature.
+    gzip_index = gzipfile.GzipIndex.ReadSerialized(json_string)
+    gzip_index.members[1].member_start_offset += 1
+    self.assertFalse(gzip_index.MatchesFileObject(file_object))
+
+    # Member indexes that do not span the entire gzip file.
+    gzip_index = gzipfile.GzipIndex.ReadSerialized(json_string)
+    del gzip_index.members[1]
+    self.assertFalse(gzip_index.MatchesFileObject(file_object))
+
+    test_file = gzipfile.GzipCompressedStream()
+    with self.assertRaises(IOError):
+      test_file.Open(file_object, gzip_index=gzip_index)
+
+
+class GzipIndexStoreTest(shared_test_lib.BaseTestCase):
+  """Tests a gzip index store."""
+
+  def testGetAndSetIndex(self):
+    """Tests the GetIndex and SetIndex functions."""
+    index_store = gzipfile.GzipIndexStore(maximum_number_of_indexes=1)
+
+    test_path_spec1 = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location='/test1.gz')
+    test_path_spec2 = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location='/test2.gz')
+
+    gzip_index1 = gzipfile.GzipIndex(100)
+    gzip_index2 = gzipfile.GzipIndex(200)
+
+    index_store.SetIndex(test_path_spec1, gzip_index1)
+    self.assertEqual(index_store.GetIndex(test_path_spec1), gzip_index1)
+
+    index_store.SetIndex(test_path_spec2, gzip_index2)
+    self.assertIsNone(index_store.GetIndex(test_path_spec1))
+    self.assertEqual(index_store.GetIndex(test_path_spec2), gzip_index2)
+
+    index_store.Empty()
+    self.assertIsNone(index_store.GetIndex(test_path_spec2))
+
+    with self.assertRaises(ValueError):
+      gzipfile.GzipIndexStore(maximum_number_of_indexes=0)
+
+  def testGetAndSetIndexWithPath(self):
+    """Tests the GetIndex and SetIndex functions with a directory."""
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location='/test1.gz')
+
+    gzip_index = gzipfile.GzipIndex(100, digest='0123456789abcdef')
+
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      index_store = gzipfile.GzipIndexStore(path=temporary_directory)
+      index_store.SetIndex(test_path_spec, gzip_index)
+
+      self.assertEqual(len(os.listdir(temporary_directory)), 1)
+
+      # The gzip index is read from the directory by another store.
+      index_store = gzipfile.GzipIndexStore(path=temporary_directory)
+      stored_gzip_index = index_store.GetIndex(test_path_spec)
+      self.assertIsNotNone(stored_gzip_index)
+      self.assertEqual(stored_gzip_index.compressed_data_size, 100)
+      self.assertEqual(stored_gzip_index.digest, '0123456789abcdef')
+
+      self.assertIs(index_store.GetIndex(test_path_spec), stored_gzip_index)
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
+    # A directory that is not writable is ignored.
+    index_store = gzipfile.GzipIndexStore(path=os.path.join(
+        self._GetTestFilePath(['syslog.gz']), 'gzip_indexes'))
+    index_store.SetIndex(test_path_spec, gzip_index)
+
+    index_store.Empty()
+    self.assertIsNone(index_store.GetIndex(test_path_spec))
+
+
 class GzipCompressedStreamTest(shared_test_lib.BaseTestCase):
   """Tests a gzip compressed stream file-like object."""
 
@@ -141,6 +283,71 @@ class GzipCompressedStreamTest(shared_test_lib.BaseTestCase):
     finally:
       test_file.close()
 
+  @mock.patch.object(gzipfile.GzipMember, '_ACCESS_POINT_INTERVAL', 256 * 1024)
+  # pylint: disable=protected-access
+  @mock.patch.object(
+      gzipfile._GzipDecompressorState, '_MAXIMUM_READ_SIZE', 16 * 1024)
+  def testReadWithAccessPoints(self):
+    """Tests reading a file using access points."""
+    test_path = self._GetTestFilePath(['corrupt1.gz'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(test_os_path_spec)
+
+    test_file = gzipfile.GzipCompressedStream()
+    test_file.Open(file_object)
+
+    try:
+      member = test_file.members[0]
+      self.assertGreater(member.index.number_of_access_points, 1)
+
+      test_file.seek(0, os.SEEK_SET)
+      expected_data = test_file.read(size=test_file.uncompressed_data_size)
+      self.assertEqual(len(expected_data), 2994187)
+
+      for offset in (2900000, 300000, 1000000, 10):
+        test_file.seek(offset, os.SEEK_SET)
+        data = test_file.read(size=4096)
+        self.assertEqual(data, expected_data[offset:offset + 4096])
+
+      json_string = test_file.index.WriteSerialized()
+
+    finally:
+      test_file.close()
+
+    # Test reading with a gzip index without access points.
+    gzip_index = gzipfile.GzipIndex.ReadSerialized(json_string)
+
+    test_file = gzipfile.GzipCompressedStream()
+    test_file.Open(file_object, gzip_index=gzip_index)
+
+    try:
+      self.assertEqual(test_file.uncompressed_data_size, 2994187)
+
+      member = test_file.members[0]
+      self.assertEqual(member.index.number_of_access_points, 0)
+
+      test_file.seek(2900000, os.SEEK_SET)
+      data = test_file.read(size=4096)
+      self.assertEqual(data, expected_data[2900000:2900000 + 4096])
+
+      self.assertGreater(member.index.number_of_access_points, 1)
+
+      test_file.seek(300000, os.SEEK_SET)
+      data = test_file.read(size=4096)
+      self.assertEqual(data, expected_data[300000:300000 + 4096])
+
+    finally:
+      test_file.close()
+
+    gzip_index.compressed_data_size = 1
+
+    test_file = gzipfile.GzipCompressedStream()
+    with self.assertRaises(IOError):
+      test_file.Open(file_object, gzip_index=gzip_index)
+
   def testReadMultipleMembers(self):
     """Tests reading a file that contains multiple gzip members."""
     test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
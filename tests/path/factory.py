@@ -37,6 +37,37 @@ class FactoryTest(unittest.TestCase):
 
     self.assertIsNotNone(test_path_spec)
 
+  def testInternPathSpec(self):
+    """Tests the InternPathSpec function."""
+    test_os_path_spec = factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location='/test.raw')
+    test_path_spec = factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, location='/test',
+        parent=test_os_path_spec)
+
+    interned_path_spec = factory.Factory.InternPathSpec(test_path_spec)
+    self.assertEqual(interned_path_spec, test_path_spec)
+    self.assertTrue(interned_path_spec.is_frozen)
+    self.assertTrue(interned_path_spec.parent.is_frozen)
+    self.assertFalse(test_path_spec.is_frozen)
+
+    test_os_path_spec = factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location='/test.raw')
+    test_path_spec = factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, location='/other',
+        parent=test_os_path_spec)
+
+    other_interned_path_spec = factory.Factory.InternPathSpec(test_path_spec)
+    self.assertNotEqual(other_interned_path_spec, interned_path_spec)
+    self.assertIs(other_interned_path_spec.parent, interned_path_spec.parent)
+
+    test_path_spec = factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, location='/test',
+        parent=test_os_path_spec)
+
+    other_interned_path_spec = factory.Factory.InternPathSpec(test_path_spec)
+    self.assertIs(other_interned_path_spec, interned_path_spec)
+
   def testIsSystemLevelTypeIndicator(self):
     """Tests the IsSystemLevelTypeIndicator function."""
     result = factory.Factory.IsSystemLevelTypeIndicator(
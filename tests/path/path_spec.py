@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the Virtual File System (VFS) path specification interface."""
 
+import copy
+import pickle
 import unittest
 
 from dfvfs.path import path_spec
@@ -63,6 +65,41 @@ class PathSpecTest(test_lib.PathSpecTestCase):
     test_dict = test_path_spec.CopyToDict()
     self.assertEqual(test_dict, {'attribute': 'MyAttribute'})
 
+  def testFreeze(self):
+    """Tests the Freeze function."""
+    test_parent_path_spec = TestPathSpec()
+    test_path_spec = TestPathSpec(parent=test_parent_path_spec)
+    expected_comparable = test_path_spec.comparable
+    expected_hash = hash(test_path_spec)
+
+    self.assertFalse(test_path_spec.is_frozen)
+
+    test_path_spec.Freeze()
+    self.assertTrue(test_path_spec.is_frozen)
+    self.assertTrue(test_parent_path_spec.is_frozen)
+
+    self.assertEqual(test_path_spec.comparable, expected_comparable)
+    self.assertEqual(hash(test_path_spec), expected_hash)
+
+    test_dict = test_path_spec.CopyToDict()
+    self.assertEqual(test_dict, {
+        'attribute': 'MyAttribute', 'parent': {'attribute': 'MyAttribute'}})
+
+    with self.assertRaises(AttributeError):
+      test_path_spec.attribute = 'OtherAttribute'
+
+    copied_path_spec = copy.deepcopy(test_path_spec)
+    self.assertFalse(copied_path_spec.is_frozen)
+    self.assertEqual(copied_path_spec, test_path_spec)
+
+    copied_path_spec.attribute = 'OtherAttribute'
+    self.assertEqual(copied_path_spec.attribute, 'OtherAttribute')
+
+    unpickled_path_spec = pickle.loads(pickle.dumps(test_path_spec))
+    self.assertFalse(unpickled_path_spec.is_frozen)
+    self.assertIsInstance(unpickled_path_spec, TestPathSpec)
+    self.assertEqual(unpickled_path_spec, test_path_spec)
+
   def testHasParent(self):
     """Tests the HasParent function."""
     test_path_spec = TestPathSpec()
@@ -4,13 +4,27 @@
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import cache
 
 
 class TestVFSObject(object):
-  """Test VFS object."""
+  """Test VFS object.
+
+  Attributes:
+    size (int): size of the test VFS object.
+  """
+
+  def __init__(self, size=0):
+    """Initializes a test VFS object.
+
+    Args:
+      size (Optional[int]): size of the test VFS object.
+    """
+    super(TestVFSObject, self).__init__()
+    self.size = size
 
 
 class ObjectsCacheTest(unittest.TestCase):
@@ -52,6 +66,86 @@ class ObjectsCacheTest(unittest.TestCase):
     with self.assertRaises(errors.CacheFullError):
       cache_object.CacheObject(path_spec.comparable, vfs_object)
 
+  def testCacheWithLFUEvictionPolicy(self):
+    """Tests the cache functionality with the LFU eviction policy."""
+    cache_object = cache.ObjectsCache(
+        2, eviction_policy=definitions.CACHE_EVICTION_POLICY_LFU)
+
+    cache_object.CacheObject('1', TestVFSObject())
+    cache_object.CacheObject('2', TestVFSObject())
+
+    cache_object.GetObject('1')
+    cache_object.GetObject('1')
+    cache_object.GetObject('2')
+
+    cache_object.CacheObject('3', TestVFSObject())
+
+    self.assertIsNotNone(cache_object.GetObject('1'))
+    self.assertIsNone(cache_object.GetObject('2'))
+    self.assertIsNotNone(cache_object.GetObject('3'))
+
+    cache_statistics = cache_object.GetStatistics()
+    self.assertEqual(cache_statistics.number_of_cached_values, 2)
+    self.assertEqual(cache_statistics.number_of_evictions, 1)
+    self.assertEqual(cache_statistics.number_of_hits, 5)
+    self.assertEqual(cache_statistics.number_of_misses, 1)
+
+  def testCacheWithLRUEvictionPolicy(self):
+    """Tests the cache functionality with the LRU eviction policy."""
+    cache_object = cache.ObjectsCache(
+        2, eviction_policy=definitions.CACHE_EVICTION_POLICY_LRU)
+
+    cache_object.CacheObject('1', TestVFSObject())
+    cache_object.CacheObject('2', TestVFSObject())
+
+    # The objects are kept in the cache without other references.
+    self.assertIsNotNone(cache_object.GetObject('1'))
+
+    # Object 2 is the least recently used and is evicted.
+    cache_object.CacheObject('3', TestVFSObject())
+
+    self.assertIsNotNone(cache_object.GetObject('1'))
+    self.assertIsNone(cache_object.GetObject('2'))
+    self.assertIsNotNone(cache_object.GetObject('3'))
+
+    # Objects that are evicted but still referenced remain cached.
+    vfs_object = cache_object.GetObject('1')
+    cache_object.CacheObject('4', TestVFSObject())
+    cache_object.CacheObject('5', TestVFSObject())
+
+    self.assertEqual(cache_object.GetObject('1'), vfs_object)
+
+    cache_statistics = cache_object.GetStatistics()
+    self.assertEqual(cache_statistics.number_of_evictions, 4)
+
+    with self.assertRaises(ValueError):
+      cache.ObjectsCache(1, eviction_policy='bogus')
+
+  def testCacheWithMaximumCost(self):
+    """Tests the cache functionality with a maximum cost."""
+    cache_object = cache.ObjectsCache(
+        10, cost_function=lambda vfs_object: vfs_object.size,
+        eviction_policy=definitions.CACHE_EVICTION_POLICY_LRU,
+        maximum_cost=100)
+
+    cache_object.CacheObject('1', TestVFSObject(size=60))
+    cache_object.CacheObject('2', TestVFSObject(size=30))
+
+    cache_statistics = cache_object.GetStatistics()
+    self.assertEqual(cache_statistics.cost, 90)
+
+    cache_object.CacheObject('3', TestVFSObject(size=30))
+
+    cache_statistics = cache_object.GetStatistics()
+    self.assertEqual(cache_statistics.cost, 60)
+    self.assertEqual(cache_statistics.number_of_evictions, 1)
+
+    self.assertIsNone(cache_object.GetObject('1'))
+
+    # An object with a cost larger than the maximum is not kept in the cache.
+    cache_object.CacheObject('4', TestVFSObject(size=200))
+    self.assertIsNone(cache_object.GetObject('4'))
+
   def testEmpty(self):
     """Tests the Empty method."""
     cache_object = cache.ObjectsCache(5)
@@ -2,12 +2,18 @@
 # -*- coding: utf-8 -*-
 """Tests for the resolver context object."""
 
+import os
 import platform
+import random
+import threading
 import unittest
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.file_io import fake_file_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import gzipfile
+from dfvfs.lib import sqlite_database
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
@@ -22,6 +28,31 @@ class ContextTest(shared_test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  def testCacheDatabase(self):
+    """Tests the cache database functionality."""
+    resolver_context = context.Context()
+
+    self.assertEqual(len(resolver_context._database_cache._values), 0)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test.db')
+    database_object = sqlite_database.SQLiteDatabaseFile()
+
+    resolver_context.CacheDatabase(path_spec, database_object)
+    self.assertEqual(len(resolver_context._database_cache._values), 1)
+
+    cached_object = resolver_context.GetDatabase(path_spec)
+    self.assertEqual(cached_object, database_object)
+
+    # The database stays cached when it is no longer in use.
+    del database_object
+    del cached_object
+
+    cached_object = resolver_context.GetDatabase(path_spec)
+    self.assertIsNotNone(cached_object)
+
+    resolver_context.Empty()
+    self.assertEqual(len(resolver_context._database_cache._values), 0)
+
   def testCacheFileObject(self):
     """Tests the cache file-like object functionality."""
     resolver_context = context.Context()
@@ -52,6 +83,84 @@ class ContextTest(shared_test_lib.BaseTestCase):
     cached_object = resolver_context.GetFileSystem(path_spec)
     self.assertEqual(cached_object, file_system)
 
+  def testGetBlockCacheStatistics(self):
+    """Tests the block cache statistics functionality."""
+    test_path = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_QCOW, parent=test_os_path_spec)
+    test_tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, location='/passwords.txt',
+        parent=test_qcow_path_spec)
+
+    resolver_context = context.Context(block_cache_size=1024 * 1024)
+
+    file_object = resolver.Resolver.OpenFileObject(
+        test_tsk_path_spec, resolver_context=resolver_context)
+    self.assertEqual(len(file_object.read()), 116)
+
+    qcow_file_object = resolver_context.GetFileObject(test_qcow_path_spec)
+    self.assertIsInstance(qcow_file_object, block_cache_io.BlockCacheFile)
+
+    cache_statistics = resolver_context.GetBlockCacheStatistics()
+    self.assertGreater(cache_statistics.number_of_cached_values, 0)
+    self.assertGreater(cache_statistics.number_of_hits, 0)
+    self.assertGreater(cache_statistics.number_of_misses, 0)
+
+    # Without block cache size storage media images are not block cached.
+    resolver_context = context.Context()
+
+    qcow_file_object = resolver.Resolver.OpenFileObject(
+        test_qcow_path_spec, resolver_context=resolver_context)
+    self.assertNotIsInstance(qcow_file_object, block_cache_io.BlockCacheFile)
+
+    cache_statistics = resolver_context.GetBlockCacheStatistics()
+    self.assertEqual(cache_statistics.number_of_cached_values, 0)
+
+  def testGetCacheStatistics(self):
+    """Tests the cache statistics functionality."""
+    resolver_context = context.Context(
+        maximum_number_of_file_objects=1,
+        eviction_policy=definitions.CACHE_EVICTION_POLICY_LRU)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/empty1.txt')
+    path_spec2 = fake_path_spec.FakePathSpec(location='/empty2.txt')
+
+    resolver_context.CacheFileObject(
+        path_spec1, fake_file_io.FakeFile(resolver_context, path_spec1, b''))
+    resolver_context.CacheFileObject(
+        path_spec2, fake_file_io.FakeFile(resolver_context, path_spec2, b''))
+
+    self.assertIsNone(resolver_context.GetFileObject(path_spec1))
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec2))
+
+    cache_statistics = resolver_context.GetFileObjectCacheStatistics()
+    self.assertEqual(cache_statistics.number_of_cached_values, 1)
+    self.assertEqual(cache_statistics.number_of_evictions, 1)
+    self.assertEqual(cache_statistics.number_of_hits, 1)
+    self.assertEqual(cache_statistics.number_of_misses, 1)
+
+    cache_statistics = resolver_context.GetFileSystemCacheStatistics()
+    self.assertEqual(cache_statistics.number_of_cached_values, 0)
+
+  def testGetAndSetGzipIndex(self):
+    """Tests the GetGzipIndex and SetGzipIndex functions."""
+    resolver_context = context.Context()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test.gz')
+    gzip_index = gzipfile.GzipIndex(100)
+
+    self.assertIsNone(resolver_context.GetGzipIndex(path_spec))
+
+    resolver_context.SetGzipIndex(path_spec, gzip_index)
+    self.assertEqual(resolver_context.GetGzipIndex(path_spec), gzip_index)
+
+    resolver_context.Empty()
+    self.assertIsNone(resolver_context.GetGzipIndex(path_spec))
+
   def testGetMountPoint(self):
     """Tests the GetMountPoint function."""
     test_path = self._GetTestFilePath(['ext2.qcow2'])
@@ -145,5 +254,102 @@ class ContextTest(shared_test_lib.BaseTestCase):
       resolver_context.DeregisterMountPoint('C')
 
 
+class ThreadSafeContextTest(shared_test_lib.BaseTestCase):
+  """Tests for the thread-safe resolver context object."""
+
+  _NUMBER_OF_THREADS = 8
+
+  _NUMBER_OF_READS = 200
+
+  def testCacheFileObject(self):
+    """Tests the cache file-like object functionality."""
+    resolver_context = context.ThreadSafeContext()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/empty.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, path_spec, b'')
+    file_object.Open()
+
+    cached_object = resolver_context.CacheFileObject(path_spec, file_object)
+    self.assertNotEqual(cached_object, file_object)
+    self.assertEqual(cached_object.file_object, file_object)
+
+    self.assertEqual(resolver_context.GetFileObject(path_spec), cached_object)
+
+  def testOpenFileObjectStress(self):
+    """Tests opening and reading a file-like object from multiple threads."""
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    with open(test_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    # Skip the first 16 bytes since the data range cannot start at offset 0.
+    expected_data = expected_data[16:]
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_data_range_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_DATA_RANGE, range_offset=16,
+        range_size=len(expected_data), parent=test_os_path_spec)
+
+    resolver_context = context.ThreadSafeContext()
+
+    barrier = threading.Barrier(self._NUMBER_OF_THREADS)
+    errors_per_thread = []
+    file_objects = []
+
+    def _ReadFileObject(thread_index):
+      """Opens and reads the file-like object at random offsets.
+
+      Args:
+        thread_index (int): index of the thread.
+      """
+      random_generator = random.Random(thread_index)
+
+      try:
+        barrier.wait()
+
+        file_object = resolver.Resolver.OpenFileObject(
+            test_data_range_path_spec, resolver_context=resolver_context)
+        file_objects.append(file_object)
+
+        for _ in range(self._NUMBER_OF_READS):
+          offset = random_generator.randint(0, len(expected_data) - 1)
+          size = random_generator.randint(1, 64)
+
+          file_object.seek(offset, os.SEEK_SET)
+          data = file_object.read(size)
+          if data != expected_data[offset:offset + size]:
+            raise ValueError('Unexpected data at offset: {0:d}'.format(
+                offset))
+
+          if file_object.get_offset() != offset + len(data):
+            raise ValueError('Unexpected offset after read.')
+
+      except Exception as exception:  # pylint: disable=broad-except
+        errors_per_thread.append(exception)
+
+    threads = [
+        threading.Thread(target=_ReadFileObject, args=(thread_index, ))
+        for thread_index in range(self._NUMBER_OF_THREADS)]
+
+    for thread in threads:
+      thread.start()
+
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(errors_per_thread, [])
+
+    # All threads should share the same file-like object.
+    self.assertEqual(len(file_objects), self._NUMBER_OF_THREADS)
+    self.assertEqual(len(set(map(id, file_objects))), 1)
+
+    # Every file-like object should be opened and cached only once.
+    cache_statistics = resolver_context.GetFileObjectCacheStatistics()
+    self.assertEqual(cache_statistics.number_of_cached_values, 2)
+    self.assertGreaterEqual(cache_statistics.number_of_misses, 2)
+
+
 if __name__ == '__main__':
   unittest.main()
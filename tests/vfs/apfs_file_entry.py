@@ -303,6 +303,32 @@ class APFSFileEntryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, 'a_directory')
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_APFS,
+        identifier=self._IDENTIFIER_A_DIRECTORY, location='/a_directory',
+        parent=self._apfs_container_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('another_file')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'another_file')
+    self.assertEqual(
+        sub_file_entry.path_spec.identifier, self._IDENTIFIER_ANOTHER_FILE)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('ANOTHER_FILE')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'ANOTHER_FILE', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'another_file')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('bogus')
+    self.assertIsNone(sub_file_entry)
+
   def testIsFunctions(self):
     """Tests the Is? functions."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -115,6 +115,38 @@ class APFSFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
+  def testWalk(self):
+    """Test the Walk function."""
+    file_system = apfs_file_system.APFSFileSystem(
+        self._resolver_context, self._apfs_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    records = {record.path: record for record in file_system.Walk()}
+    self.assertEqual(len(records), 11)
+
+    root_record = records['/']
+    self.assertEqual(root_record.name, '')
+    self.assertEqual(root_record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertIsNone(root_record.parent_identifier)
+
+    record = records['/passwords.txt']
+    self.assertEqual(record.name, 'passwords.txt')
+    self.assertEqual(record.parent_identifier, root_record.identifier)
+    self.assertEqual(record.size, 116)
+    self.assertEqual(record.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertTrue(record.is_allocated)
+    self.assertIsNotNone(record.modification_time)
+
+    directory_record = records['/a_directory']
+    self.assertEqual(
+        directory_record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    record = records['/a_directory/a_file']
+    self.assertEqual(record.parent_identifier, directory_record.identifier)
+    self.assertEqual(record.size, 53)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,7 @@
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import fake_file_system
@@ -87,6 +88,79 @@ class FakeFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
+  def testGetSubFileEntryNameIndex(self):
+    """Tests the GetSubFileEntryNameIndex function."""
+    file_system = fake_file_system.FakeFileSystem(
+        self._resolver_context, self._fake_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.AddFileEntry(
+        '/test_data', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    file_system.AddFileEntry('/test_data/File1.txt', file_data=b'FILE1')
+    file_system.AddFileEntry('/test_data/file2.txt', file_data=b'FILE2')
+
+    file_system.Open()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test_data')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    names, lower_case_names = file_system.GetSubFileEntryNameIndex(file_entry)
+    self.assertEqual(sorted(names.keys()), ['File1.txt', 'file2.txt'])
+    self.assertEqual(
+        sorted(lower_case_names.keys()), ['file1.txt', 'file2.txt'])
+    self.assertEqual(
+        lower_case_names['file1.txt'][0].location, '/test_data/File1.txt')
+
+    name_index = file_system.GetSubFileEntryNameIndex(file_entry)
+    self.assertIs(name_index[0], names)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('FILE1.TXT')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'FILE1.TXT', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'File1.txt')
+
+  def testWalk(self):
+    """Test the Walk function."""
+    file_system = fake_file_system.FakeFileSystem(
+        self._resolver_context, self._fake_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.AddFileEntry(
+        '/test_data', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    file_system.AddFileEntry(
+        '/test_data/testdir_fake',
+        file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    file_system.AddFileEntry(
+        '/test_data/testdir_fake/file1.txt', file_data=b'FILE1')
+    file_system.AddFileEntry(
+        '/test_data/testdir_fake/file2.txt', file_data=b'FILE2')
+
+    file_system.Open()
+
+    records = {record.path: record for record in file_system.Walk()}
+    self.assertEqual(len(records), 5)
+
+    record = records['/test_data/testdir_fake/file1.txt']
+    self.assertEqual(record.name, 'file1.txt')
+    self.assertEqual(record.size, 5)
+    self.assertEqual(record.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertTrue(record.is_allocated)
+
+    record = records['/test_data/testdir_fake']
+    self.assertEqual(record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/test_data/testdir_fake')
+    paths = [record.path for record in file_system.Walk(path_spec=path_spec)]
+    self.assertEqual(paths[0], '/test_data/testdir_fake')
+    self.assertEqual(sorted(paths[1:]), [
+        '/test_data/testdir_fake/file1.txt',
+        '/test_data/testdir_fake/file2.txt'])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -369,6 +369,36 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
     extents = file_entry.GetExtents()
     self.assertEqual(len(extents), 0)
 
+  def testGetExtentsFileObject(self):
+    """Tests the GetExtentsFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_NTFS, location='\\$UpCase', mft_entry=10,
+        parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNotNone(extents_file_object)
+
+    self.assertEqual(extents_file_object.get_size(), 131072)
+
+    file_object = file_entry.GetFileObject()
+    self.assertEqual(extents_file_object.read(), file_object.read())
+
+    # The $Info data stream is resident.
+    extents_file_object = file_entry.GetExtentsFileObject(
+        data_stream_name='$Info')
+    self.assertIsNone(extents_file_object)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_NTFS, location='\\a_directory',
+        mft_entry=self._MFT_ENTRY_A_DIRECTORY, parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNone(extents_file_object)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -426,6 +456,31 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
 
   # TODO: add tests for GetSecurityDescriptor
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_NTFS, location='\\a_directory',
+        mft_entry=self._MFT_ENTRY_A_DIRECTORY, parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('another_file')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'another_file')
+    self.assertEqual(
+        sub_file_entry.path_spec.mft_entry, self._MFT_ENTRY_ANOTHER_FILE)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('ANOTHER_FILE')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'ANOTHER_FILE', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'another_file')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('bogus')
+    self.assertIsNone(sub_file_entry)
+
   def testIsAllocated(self):
     """Test the IsAllocated function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -15,6 +15,8 @@ from tests import test_lib as shared_test_lib
 class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
   """Tests the NTFS file system."""
 
+  # pylint: disable=protected-access
+
   _MFT_ENTRY_PASSWORDS_TXT = 66
 
   def setUp(self):
@@ -95,6 +97,73 @@ class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
 
     self.assertIsNone(file_entry)
 
+  def testGetDirectoryLocation(self):
+    """Tests the _GetDirectoryLocation function."""
+    file_system = ntfs_file_system.NTFSFileSystem(
+        self._resolver_context, self._ntfs_path_spec)
+
+    directories = {
+        5: ('', (5 << 48) | 5, 5, True),
+        64: ('a_directory', (5 << 48) | 5, 1, True),
+        65: ('sub_directory', (1 << 48) | 64, 2, True),
+        66: ('deleted', (5 << 48) | 5, 3, False),
+        67: ('cycle', (1 << 48) | 68, 1, True),
+        68: ('cycle', (1 << 48) | 67, 1, True)}
+    directory_locations = {5: '\\'}
+
+    location = file_system._GetDirectoryLocation(
+        (2 << 48) | 65, directories, directory_locations)
+    self.assertEqual(location, '\\a_directory\\sub_directory')
+    self.assertEqual(directory_locations[64], '\\a_directory')
+
+    # Test a reference to a deleted directory with the previous sequence
+    # number.
+    location = file_system._GetDirectoryLocation(
+        (2 << 48) | 66, directories, directory_locations)
+    self.assertEqual(location, '\\deleted')
+
+    # Test a reference to a reallocated directory.
+    location = file_system._GetDirectoryLocation(
+        (3 << 48) | 65, directories, directory_locations)
+    self.assertIsNone(location)
+
+    # Test a reference to a directory that has not been read.
+    location = file_system._GetDirectoryLocation(
+        (1 << 48) | 99, directories, directory_locations)
+    self.assertIsNone(location)
+
+    location = file_system._GetDirectoryLocation(
+        (1 << 48) | 67, directories, directory_locations)
+    self.assertIsNone(location)
+
+  def testGetFileEntriesInMFTOrder(self):
+    """Tests the GetFileEntriesInMFTOrder function."""
+    file_system = ntfs_file_system.NTFSFileSystem(
+        self._resolver_context, self._ntfs_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    expected_path_specs = set()
+    file_entries = [file_system.GetRootFileEntry()]
+    while file_entries:
+      file_entry = file_entries.pop()
+      expected_path_specs.add((
+          file_entry.path_spec.location, file_entry.path_spec.mft_entry))
+      file_entries.extend(file_entry.sub_file_entries)
+
+    path_specs = set()
+    for file_entry in file_system.GetFileEntriesInMFTOrder():
+      path_specs.add((
+          file_entry.path_spec.location, file_entry.path_spec.mft_entry))
+
+      if file_entry.path_spec.mft_entry == self._MFT_ENTRY_PASSWORDS_TXT:
+        self.assertEqual(file_entry.name, 'passwords.txt')
+
+    self.assertEqual(path_specs, expected_path_specs)
+    self.assertIn(
+        ('\\passwords.txt', self._MFT_ENTRY_PASSWORDS_TXT), path_specs)
+
   # TODO: add tests for GetNTFSFileEntryByPathSpec function.
 
   def testGetRootFileEntry(self):
@@ -110,6 +179,39 @@ class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
+  def testWalk(self):
+    """Test the Walk function."""
+    file_system = ntfs_file_system.NTFSFileSystem(
+        self._resolver_context, self._ntfs_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    records = {record.path: record for record in file_system.Walk()}
+    root_record = records['\\']
+    self.assertEqual(root_record.name, '')
+    self.assertEqual(root_record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertIsNone(root_record.parent_identifier)
+
+    record = records['\\passwords.txt']
+    self.assertEqual(record.name, 'passwords.txt')
+    self.assertEqual(record.parent_identifier, root_record.identifier)
+    self.assertEqual(record.size, 116)
+    self.assertEqual(record.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertTrue(record.is_allocated)
+    self.assertIsNotNone(record.modification_time)
+
+    directory_record = records['\\a_directory']
+    self.assertEqual(
+        directory_record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    record = records['\\a_directory\\a_file']
+    self.assertEqual(record.parent_identifier, directory_record.identifier)
+    self.assertEqual(record.size, 53)
+
+    record = records['\\passwords.txt']
+    self.assertEqual(record.identifier, self._MFT_ENTRY_PASSWORDS_TXT)
+
 
 if __name__ == '__main__':
   unittest.main()
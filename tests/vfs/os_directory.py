@@ -50,6 +50,25 @@ class OSDirectoryTest(shared_test_lib.BaseTestCase):
     entries = list(directory.entries)
     self.assertEqual(len(entries), 6)
 
+  def testGetOSDirectoryEntries(self):
+    """Tests the GetOSDirectoryEntries function."""
+    directory = os_directory.OSDirectory(
+        self._file_system, self._os_path_spec)
+
+    self.assertIsNotNone(directory)
+
+    entries = list(directory.GetOSDirectoryEntries())
+    self.assertEqual(len(entries), 6)
+
+    names = sorted([
+        os_directory_entry.name for _, os_directory_entry in entries])
+    self.assertEqual(names, [
+        'file1.txt', 'file2.txt', 'file3.txt', 'file4.txt', 'file5.txt',
+        'subdir1'])
+
+    for path_spec, os_directory_entry in entries:
+      self.assertEqual(path_spec.location, os_directory_entry.path)
+
 
 if __name__ == '__main__':
   unittest.main()
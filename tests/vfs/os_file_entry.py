@@ -2,8 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the operating system file entry implementation."""
 
+import os
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
@@ -241,6 +244,55 @@ class OSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), expected_sub_file_entry_names)
 
+  def testSubFileEntriesReuseOSDirectoryEntries(self):
+    """Tests that sub file entries reuse the directory entries of scandir."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._os_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    with mock.patch.object(os, 'lstat') as mock_lstat:
+      with mock.patch.object(os.path, 'islink') as mock_islink:
+        sub_file_entries = list(file_entry.sub_file_entries)
+        self.assertEqual(mock_lstat.call_count, 0)
+        self.assertEqual(mock_islink.call_count, 0)
+
+    sub_file_entries_per_name = {
+        sub_file_entry.name: sub_file_entry
+        for sub_file_entry in sub_file_entries}
+    self.assertEqual(len(sub_file_entries_per_name), 6)
+
+    sub_file_entry = sub_file_entries_per_name['file1.txt']
+    self.assertTrue(sub_file_entry.IsFile())
+    self.assertEqual(sub_file_entry.size, 6)
+
+    sub_file_entry = sub_file_entries_per_name['subdir1']
+    self.assertTrue(sub_file_entry.IsDirectory())
+
+  def testInitializeWithOSDirectoryEntryWithoutInode(self):
+    """Tests __init__ with a directory entry without inode number."""
+    test_path = self._GetTestFilePath(['testdir_os', 'file1.txt'])
+    self._SkipIfPathNotExists(test_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    stat_info = os.lstat(test_path)
+
+    # On Windows the stat information of a directory entry has no inode
+    # number, device and number of links.
+    stat_values = list(stat_info)
+    stat_values[1:4] = [0, 0, 0]
+
+    os_directory_entry = mock.Mock()
+    os_directory_entry.stat.return_value = os.stat_result(stat_values)
+
+    file_entry = os_file_entry.OSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        os_directory_entry=os_directory_entry)
+
+    stat_attribute = file_entry.GetStatAttribute()
+    self.assertEqual(stat_attribute.inode_number, stat_info.st_ino)
+    self.assertEqual(stat_attribute.number_of_links, stat_info.st_nlink)
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     test_path = self._GetTestFilePath(['testdir_os', 'file1.txt'])
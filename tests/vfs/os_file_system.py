@@ -180,5 +180,40 @@ class OSFileSystemTest(shared_test_lib.BaseTestCase):
     platform.system = original_platform_system
 
 
+  def testWalk(self):
+    """Test the Walk function."""
+    test_path = self._GetTestFilePath(['testdir_os'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    file_system = os_file_system.OSFileSystem(
+        self._resolver_context, test_os_path_spec)
+
+    records = list(file_system.Walk(path_spec=test_os_path_spec))
+    self.assertEqual(len(records), 8)
+
+    root_record = records[0]
+    self.assertEqual(root_record.path, test_path)
+    self.assertEqual(root_record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    records = {record.path: record for record in records}
+
+    record = records[os.path.join(test_path, 'file1.txt')]
+    self.assertEqual(record.name, 'file1.txt')
+    self.assertEqual(record.parent_identifier, root_record.identifier)
+    self.assertEqual(record.size, 6)
+    self.assertEqual(record.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertIsNotNone(record.modification_time)
+
+    directory_record = records[os.path.join(test_path, 'subdir1')]
+    self.assertEqual(
+        directory_record.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    record = records[os.path.join(test_path, 'subdir1', 'file6.txt')]
+    self.assertEqual(record.parent_identifier, directory_record.identifier)
+
+
 if __name__ == '__main__':
   unittest.main()
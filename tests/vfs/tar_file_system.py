@@ -5,6 +5,7 @@
 import unittest
 
 from dfvfs.lib import definitions
+from dfvfs.lib import errors
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.vfs import tar_file_system
@@ -83,6 +84,12 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
         parent=test_os_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A prefix of a path is not a virtual directory.
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR, location='/File Sys',
+        parent=test_os_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     file_system = tar_file_system.TARFileSystem(
@@ -136,6 +143,77 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, 'Recordings')
 
+  def testGetTARInfoByPathSpec(self):
+    """Test the GetTARInfoByPathSpec function."""
+    test_path = self._GetTestFilePath(['missing_directory_entries.tar'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR, location='/',
+        parent=test_os_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(
+        self._resolver_context, path_spec)
+    file_system.Open()
+
+    tar_info = file_system.GetTARInfoByPathSpec(path_spec)
+    self.assertIsNone(tar_info)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR,
+        location='/Non Missing Directory Entry/test_file.txt',
+        parent=test_os_path_spec)
+    tar_info = file_system.GetTARInfoByPathSpec(path_spec)
+    self.assertIsNotNone(tar_info)
+    self.assertEqual(
+        tar_info.name, 'Non Missing Directory Entry/test_file.txt')
+
+    # Test a virtual directory.
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR, location='/File System',
+        parent=test_os_path_spec)
+    tar_info = file_system.GetTARInfoByPathSpec(path_spec)
+    self.assertIsNone(tar_info)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR, location='bogus',
+        parent=test_os_path_spec)
+    with self.assertRaises(errors.PathSpecError):
+      file_system.GetTARInfoByPathSpec(path_spec)
+
+  def testGetTARSubPathsByPathSpec(self):
+    """Test the GetTARSubPathsByPathSpec function."""
+    test_path = self._GetTestFilePath(['missing_directory_entries.tar'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR, location='/',
+        parent=test_os_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(
+        self._resolver_context, path_spec)
+    file_system.Open()
+
+    sub_paths = file_system.GetTARSubPathsByPathSpec(path_spec)
+    self.assertEqual(sub_paths, ['File System', 'Non Missing Directory Entry'])
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR, location='/File System/',
+        parent=test_os_path_spec)
+    sub_paths = file_system.GetTARSubPathsByPathSpec(path_spec)
+    self.assertEqual(sub_paths, ['File System/Recordings'])
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TAR,
+        location='/Non Missing Directory Entry/test_file.txt',
+        parent=test_os_path_spec)
+    sub_paths = file_system.GetTARSubPathsByPathSpec(path_spec)
+    self.assertEqual(sub_paths, [])
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = tar_file_system.TARFileSystem(
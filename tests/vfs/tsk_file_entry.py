@@ -4,6 +4,8 @@
 
 import unittest
 
+from unittest import mock
+
 import pytsk3
 
 from dfvfs.lib import definitions
@@ -331,6 +333,35 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
     extents = file_entry.GetExtents()
     self.assertEqual(len(extents), 0)
 
+  def testGetExtentsFileObject(self):
+    """Tests the GetExtentsFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=self._INODE_ANOTHER_FILE,
+        location='/a_directory/another_file', parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNotNone(extents_file_object)
+
+    self.assertEqual(extents_file_object.get_size(), 22)
+
+    file_object = file_entry.GetFileObject()
+    self.assertEqual(extents_file_object.read(), file_object.read())
+
+    extents_file_object = file_entry.GetExtentsFileObject(
+        data_stream_name='bogus')
+    self.assertIsNone(extents_file_object)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=self._INODE_A_DIRECTORY,
+        location='/a_directory', parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNone(extents_file_object)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -485,6 +516,30 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_entry.number_of_sub_file_entries, 2)
 
+  def testSubFileEntriesReuseTSKFile(self):
+    """Tests that sub file entries reuse the TSK files of the directory."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=self._INODE_A_DIRECTORY,
+        location='/a_directory', parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    with mock.patch.object(
+        self._file_system, 'GetTSKFileByPathSpec') as mock_get_tsk_file:
+      sub_file_entries = list(file_entry.sub_file_entries)
+      self.assertEqual(mock_get_tsk_file.call_count, 0)
+
+    sub_file_entry_names = sorted([
+        sub_file_entry.name for sub_file_entry in sub_file_entries])
+    self.assertEqual(sub_file_entry_names, ['a_file', 'another_file'])
+
+    sub_file_entry = sub_file_entries[0]
+    self.assertEqual(sub_file_entry._parent_inode, self._INODE_A_DIRECTORY)
+
+    parent_file_entry = sub_file_entry.GetParentFileEntry()
+    self.assertIsNotNone(parent_file_entry)
+    self.assertEqual(parent_file_entry.name, 'a_directory')
+
   def testDataStreams(self):
     """Tests the data streams functionality."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -1155,6 +1210,35 @@ class TSKFileEntryTestHFSPlus(shared_test_lib.BaseTestCase):
     extents = file_entry.GetExtents()
     self.assertEqual(len(extents), 0)
 
+  def testGetExtentsFileObject(self):
+    """Tests the GetExtentsFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=self._INODE_ANOTHER_FILE,
+        location='/a_directory/another_file', parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNotNone(extents_file_object)
+
+    self.assertEqual(extents_file_object.get_size(), 22)
+
+    file_object = file_entry.GetFileObject()
+    self.assertEqual(extents_file_object.read(), file_object.read())
+
+    extents_file_object = file_entry.GetExtentsFileObject(
+        data_stream_name='bogus')
+    self.assertIsNone(extents_file_object)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=self._INODE_A_DIRECTORY,
+        location='/a_directory', parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNone(extents_file_object)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -1696,6 +1780,18 @@ class TSKFileEntryTestNTFS(shared_test_lib.BaseTestCase):
     extents = file_entry.GetExtents()
     self.assertEqual(len(extents), 0)
 
+  def testGetExtentsFileObject(self):
+    """Tests the GetExtentsFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=10, location='/$UpCase',
+        parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    # pytsk3 does not expose the initialized size of NTFS data streams.
+    extents_file_object = file_entry.GetExtentsFileObject()
+    self.assertIsNone(extents_file_object)
+
   def testGetFileObject(self):
     """Tests the GetFileObject function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
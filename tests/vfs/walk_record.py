@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the VFS walk record."""
+
+import unittest
+
+from dfvfs.vfs import walk_record
+
+from tests import test_lib as shared_test_lib
+
+
+class WalkRecordTest(shared_test_lib.BaseTestCase):
+  """Tests the VFS walk record."""
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    test_walk_record = walk_record.WalkRecord('test', '/test')
+    self.assertIsNotNone(test_walk_record)
+    self.assertEqual(test_walk_record.name, 'test')
+    self.assertEqual(test_walk_record.path, '/test')
+    self.assertTrue(test_walk_record.is_allocated)
+    self.assertIsNone(test_walk_record.identifier)
+
+    with self.assertRaises(AttributeError):
+      test_walk_record.bogus = True
+
+
+if __name__ == '__main__':
+  unittest.main()
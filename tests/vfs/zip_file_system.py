@@ -5,6 +5,7 @@
 import unittest
 
 from dfvfs.lib import definitions
+from dfvfs.lib import errors
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.vfs import zip_file_system
@@ -139,6 +140,80 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, 'syslog')
 
+  def testGetZipInfoByPathSpec(self):
+    """Test the GetZipInfoByPathSpec function."""
+    test_path = self._GetTestFilePath(['missing_directory_entries.zip'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/',
+        parent=test_os_path_spec)
+
+    file_system = zip_file_system.ZipFileSystem(
+        self._resolver_context, path_spec)
+    file_system.Open()
+
+    zip_info = file_system.GetZipInfoByPathSpec(path_spec)
+    self.assertIsNone(zip_info)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/folder/syslog',
+        parent=test_os_path_spec)
+    zip_info = file_system.GetZipInfoByPathSpec(path_spec)
+    self.assertIsNotNone(zip_info)
+    self.assertEqual(zip_info.filename, 'folder/syslog')
+
+    # Test a virtual directory.
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/folder/',
+        parent=test_os_path_spec)
+    zip_info = file_system.GetZipInfoByPathSpec(path_spec)
+    self.assertIsNone(zip_info)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/bogus',
+        parent=test_os_path_spec)
+    zip_info = file_system.GetZipInfoByPathSpec(path_spec)
+    self.assertIsNone(zip_info)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='bogus',
+        parent=test_os_path_spec)
+    with self.assertRaises(errors.PathSpecError):
+      file_system.GetZipInfoByPathSpec(path_spec)
+
+  def testGetZipSubPathsByPathSpec(self):
+    """Test the GetZipSubPathsByPathSpec function."""
+    test_path = self._GetTestFilePath(['missing_directory_entries.zip'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/',
+        parent=test_os_path_spec)
+
+    file_system = zip_file_system.ZipFileSystem(
+        self._resolver_context, path_spec)
+    file_system.Open()
+
+    sub_paths = list(file_system.GetZipSubPathsByPathSpec(path_spec))
+    self.assertEqual(sub_paths, ['folder/'])
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/folder/',
+        parent=test_os_path_spec)
+    sub_paths = list(file_system.GetZipSubPathsByPathSpec(path_spec))
+    self.assertEqual(sub_paths, ['folder/syslog', 'folder/wtmp.1'])
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/folder/syslog',
+        parent=test_os_path_spec)
+    sub_paths = list(file_system.GetZipSubPathsByPathSpec(path_spec))
+    self.assertEqual(sub_paths, [])
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = zip_file_system.ZipFileSystem(
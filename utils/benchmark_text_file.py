@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the text file interface for file-like objects.
+
+Reading lines should scale linearly with the number of lines, hence the time
+per line should not depend on the number of lines in the buffer.
+"""
+
+import argparse
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.file_io import fake_file_io
+from dfvfs.helpers import text_file
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+
+def _OpenFileObject(resolver_context, number_of_lines):
+  """Opens a file-like object with short lines.
+
+  Args:
+    resolver_context (Context): resolver context.
+    number_of_lines (int): number of lines.
+
+  Returns:
+    FakeFile: file-like object.
+  """
+  data = b''.join([
+      b'line %07d\n' % line_number for line_number in range(number_of_lines)])
+
+  path_spec = fake_path_spec.FakePathSpec(location='/large.txt')
+  file_object = fake_file_io.FakeFile(resolver_context, path_spec, data)
+  file_object.Open()
+
+  return file_object
+
+
+def _PrintBenchmark(description, number_of_lines, start_time):
+  """Prints the result of a benchmark.
+
+  Args:
+    description (str): description of the benchmark.
+    number_of_lines (int): number of lines read.
+    start_time (float): time the benchmark started.
+  """
+  elapsed_time = time.time() - start_time
+  if elapsed_time:
+    print('{0:s}: {1:d} lines in {2:.3f} seconds ({3:.0f} lines/s)'.format(
+        description, number_of_lines, elapsed_time,
+        number_of_lines / elapsed_time))
+
+
+def BenchmarkIterLines(file_object):
+  """Benchmarks the iter_lines() function.
+
+  Args:
+    file_object (FileIO): file-like object.
+
+  Returns:
+    int: number of lines read.
+  """
+  file_object.seek(0)
+  text_file_object = text_file.TextFile(file_object)
+
+  number_of_lines = 0
+  for lines in text_file_object.iter_lines(batch_size=1024):
+    number_of_lines += len(lines)
+
+  return number_of_lines
+
+
+def BenchmarkReadline(file_object):
+  """Benchmarks the readline() function.
+
+  Args:
+    file_object (FileIO): file-like object.
+
+  Returns:
+    int: number of lines read.
+  """
+  file_object.seek(0)
+  text_file_object = text_file.TextFile(file_object)
+
+  number_of_lines = 0
+  line = text_file_object.readline()
+  while line:
+    number_of_lines += 1
+    line = text_file_object.readline()
+
+  return number_of_lines
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks reading lines with the text file interface.'))
+
+  argument_parser.add_argument(
+      '--number_of_lines', '--number-of-lines', dest='number_of_lines',
+      action='store', type=int, default=250000, metavar='NUMBER', help=(
+          'number of lines to read.'))
+
+  options = argument_parser.parse_args()
+
+  resolver_context = context.Context()
+  file_object = _OpenFileObject(resolver_context, options.number_of_lines)
+
+  for description, function in (
+      ('readline', BenchmarkReadline), ('iter_lines', BenchmarkIterLines)):
+    start_time = time.time()
+    number_of_lines = function(file_object)
+    _PrintBenchmark(description, number_of_lines, start_time)
+
+    if number_of_lines != options.number_of_lines:
+      print('{0:s}: read {1:d} lines, expected {2:d}.'.format(
+          description, number_of_lines, options.number_of_lines))
+      return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
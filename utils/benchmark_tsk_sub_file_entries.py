@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark enumerating the sub file entries of a TSK file system.
+
+The sub file entries reuse the SleuthKit file objects that are opened while
+iterating a directory, which is compared with creating the sub file entries
+from their path specifications, where every sub file entry opens its inode
+again.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.vfs import tsk_file_entry
+
+
+def _OpenFileSystem(resolver_context, source_path):
+  """Opens the TSK file system of a storage media image.
+
+  Args:
+    resolver_context (Context): resolver context.
+    source_path (str): path of the storage media image.
+
+  Returns:
+    TSKFileSystem: file system.
+  """
+  os_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location=source_path)
+
+  scanner = source_scanner.SourceScanner(resolver_context=resolver_context)
+  image_path_spec = scanner.ScanForStorageMediaImage(os_path_spec)
+
+  tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_TSK, location='/',
+      parent=image_path_spec or os_path_spec)
+
+  return resolver.Resolver.OpenFileSystem(
+      tsk_path_spec, resolver_context=resolver_context)
+
+
+def _PrintBenchmark(description, number_of_file_entries, start_time):
+  """Prints the result of a benchmark.
+
+  Args:
+    description (str): description of the benchmark.
+    number_of_file_entries (int): number of file entries enumerated.
+    start_time (float): time the benchmark started.
+  """
+  elapsed_time = time.time() - start_time
+  if number_of_file_entries:
+    print((
+        '{0:s}: {1:d} file entries in {2:.3f} seconds ({3:.1f} us per file '
+        'entry)').format(
+            description, number_of_file_entries, elapsed_time,
+            elapsed_time * 1000000 / number_of_file_entries))
+
+
+def BenchmarkByPathSpecification(file_entry):
+  """Benchmarks creating sub file entries from their path specifications.
+
+  Args:
+    file_entry (TSKFileEntry): file entry of the directory to enumerate.
+
+  Returns:
+    int: number of file entries enumerated.
+  """
+  number_of_file_entries = 0
+
+  file_entries = [file_entry]
+  while file_entries:
+    file_entry = file_entries.pop()
+
+    # pylint: disable=protected-access
+    directory = file_entry._GetDirectory()
+    if not directory:
+      continue
+
+    for path_spec in directory.entries:
+      sub_file_entry = tsk_file_entry.TSKFileEntry(
+          file_entry._resolver_context, file_entry._file_system, path_spec)
+
+      _ = sub_file_entry.name, sub_file_entry.size
+      number_of_file_entries += 1
+
+      if sub_file_entry.IsDirectory():
+        file_entries.append(sub_file_entry)
+
+  return number_of_file_entries
+
+
+def BenchmarkSubFileEntries(file_entry):
+  """Benchmarks the sub_file_entries property.
+
+  Args:
+    file_entry (TSKFileEntry): file entry of the directory to enumerate.
+
+  Returns:
+    int: number of file entries enumerated.
+  """
+  number_of_file_entries = 0
+
+  file_entries = [file_entry]
+  while file_entries:
+    file_entry = file_entries.pop()
+
+    for sub_file_entry in file_entry.sub_file_entries:
+      _ = sub_file_entry.name, sub_file_entry.size
+      number_of_file_entries += 1
+
+      if sub_file_entry.IsDirectory():
+        file_entries.append(sub_file_entry)
+
+  return number_of_file_entries
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks enumerating the sub file entries of a TSK file system.'))
+
+  argument_parser.add_argument(
+      '--number_of_iterations', '--number-of-iterations',
+      dest='number_of_iterations', action='store', type=int, default=500,
+      metavar='NUMBER', help=(
+          'number of times the file system is enumerated.'))
+
+  argument_parser.add_argument(
+      'source', nargs='?', action='store', metavar='PATH',
+      default=os.path.join('test_data', 'ext2.qcow2'), help=(
+          'path of a storage media image that contains a file system '
+          'supported by TSK.'))
+
+  options = argument_parser.parse_args()
+
+  if not os.path.isfile(options.source):
+    print('No such storage media image: {0:s}.'.format(options.source))
+    return False
+
+  resolver_context = context.Context()
+  file_system = _OpenFileSystem(resolver_context, options.source)
+  root_file_entry = file_system.GetRootFileEntry()
+
+  number_of_file_entries_per_benchmark = []
+  for description, function in (
+      ('by path specification', BenchmarkByPathSpecification),
+      ('sub_file_entries', BenchmarkSubFileEntries)):
+    number_of_file_entries = 0
+
+    start_time = time.time()
+    for _ in range(options.number_of_iterations):
+      number_of_file_entries += function(root_file_entry)
+    _PrintBenchmark(description, number_of_file_entries, start_time)
+
+    number_of_file_entries_per_benchmark.append(number_of_file_entries)
+
+  if len(set(number_of_file_entries_per_benchmark)) != 1:
+    print('Number of file entries enumerated differs per benchmark.')
+    return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)